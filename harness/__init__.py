@@ -0,0 +1,15 @@
+"""
+RC1 Harness: the validator stage of the teaching loop (teaching_loop/loop.py).
+
+LLMHarness.run(text) audits a text with rc1_lite and returns a Report:
+gate, score, violations located by sentence, correction vectors and the
+structured rewrite prompt. Stdlib only; no LLM is invoked here.
+"""
+
+from .schema import CorrectionVector, Report, Violation
+from .runner import LLMHarness, build_report
+from .teacher.correction import build_rewrite_prompt, generate_corrections
+from .teacher.rewrite import deterministic_rewrite
+
+__all__ = ["Report", "Violation", "CorrectionVector", "LLMHarness", "build_report",
+           "generate_corrections", "build_rewrite_prompt", "deterministic_rewrite"]
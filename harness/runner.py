@@ -0,0 +1,91 @@
+"""
+Harness Runner
+
+    harness = LLMHarness()
+    report = harness.run(text, sample_id="s1")
+    report = harness.run(rewritten, sample_id="s1_iter1", previous=report)
+
+run evaluates with rc1_lite.evaluate_output and builds a Report. Given
+the previous Report of the same lineage, texts longer than one delta
+chunk are re-evaluated with rc1_lite.delta, reusing the unchanged
+sentences; the result is identical either way. build_report is the
+second half alone, for callers that evaluate elsewhere (a process pool).
+"""
+
+import bisect
+from typing import Dict, Optional
+
+from rc1_lite.context import DocumentContext
+from rc1_lite.delta import DELTA_CHUNK_CHARS, evaluate_delta
+from rc1_lite.engine import evaluate_output
+
+from .schema import PAIR_LOCATED, Report, Violation
+from .teacher.correction import build_rewrite_prompt, generate_corrections
+
+# Violation excerpts are cut to this many characters
+EXCERPT_CHARS = 160
+
+
+def _locate(violation: Dict, starts) -> int:
+    """Index of the sentence a violation's correction targets."""
+    if violation["type"] in PAIR_LOCATED:
+        return min(violation["location"] + 1, len(starts) - 1)
+    return max(0, bisect.bisect_right(starts, violation["location"]) - 1)
+
+
+def build_report(text: str, result: Dict, sample_id: str = "sample_0") -> Report:
+    """Report of text from its rc1_lite result (evaluate_output(text))."""
+    violations = []
+    if result["violations"]:
+        spans = DocumentContext(text).sentence_spans
+        starts = [a for a, _ in spans]
+        for v in result["violations"]:
+            i = _locate(v, starts)
+            a, b = spans[i]
+            violations.append(Violation(
+                type=v["type"],
+                severity=v["severity"],
+                location=v["location"],
+                sentence=i,
+                excerpt=text[a:b][:EXCERPT_CHARS],
+                metadata=dict(v["metadata"]),
+            ))
+    corrections = generate_corrections(violations)
+    return Report(
+        sample_id=sample_id,
+        gate=result["gate"],
+        overall_score=result["score"],
+        V=result["V"],
+        V_max=result["V_max"],
+        taxonomy=dict(result["taxonomy"]),
+        violations=violations,
+        corrections=corrections,
+        rewrite_prompt=build_rewrite_prompt(text, corrections) if corrections else "",
+        version=result["version"],
+        text=text,
+        result=result,
+    )
+
+
+class LLMHarness:
+    """
+    Deterministic validator for the teaching loop.
+
+    delta: re-evaluate rewrites against the previous Report (rc1_lite.delta).
+    """
+
+    def __init__(self, delta: bool = True):
+        self.delta = delta
+
+    def evaluate(self, text: str, previous: Optional[Report] = None) -> Dict:
+        """rc1_lite result of text; equal to evaluate_output(text)."""
+        if self.delta and len(text) > DELTA_CHUNK_CHARS:
+            if previous is None:
+                return evaluate_delta(None, None, text)
+            return evaluate_delta(previous.text, previous.result, text)
+        return evaluate_output(text)
+
+    def run(self, text: str, sample_id: str = "sample_0",
+            previous: Optional[Report] = None) -> Report:
+        """Validate text. previous: Report of the text this one rewrites."""
+        return build_report(text, self.evaluate(text, previous), sample_id)
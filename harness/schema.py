@@ -0,0 +1,93 @@
+"""
+Harness Schema
+
+    Violation           one RC1 operator result with severity > 0, located
+                        by the sentence a correction should touch
+    CorrectionVector    the structured fix for one violation
+    Report              everything one validation pass produced
+
+Sentences are rc1_lite's (context.SENT_SPLIT), so indices agree with
+ESC and LOOP locations, which are sentence indices; every other operator
+reports a character offset.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Operators whose location is a sentence-pair index i: the correction
+# targets sentence i + 1 (the escalating / repeating one)
+PAIR_LOCATED = ("ESC", "LOOP")
+
+
+@dataclass
+class Violation:
+    """One violated RC1 operator."""
+    type: str
+    severity: int
+    location: int             # as reported: char offset, or pair index for ESC / LOOP
+    sentence: int             # index of the sentence to correct
+    excerpt: str              # that sentence, truncated
+    metadata: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "severity": self.severity,
+            "location": self.location,
+            "sentence": self.sentence,
+            "excerpt": self.excerpt,
+            "metadata": self.metadata,
+        }
+
+
+@dataclass
+class CorrectionVector:
+    """Structured fix: what to do (action) to which sentence, and why (type)."""
+    type: str
+    severity: int
+    sentence: int
+    action: str
+    instruction: str
+    excerpt: str
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "severity": self.severity,
+            "sentence": self.sentence,
+            "action": self.action,
+            "instruction": self.instruction,
+            "excerpt": self.excerpt,
+        }
+
+
+@dataclass
+class Report:
+    """One validation pass over one text."""
+    sample_id: str
+    gate: str
+    overall_score: float
+    V: int
+    V_max: int
+    taxonomy: Dict[str, int]
+    violations: List[Violation]
+    corrections: List[CorrectionVector]
+    rewrite_prompt: str
+    version: str
+    # Evaluated text and raw rc1_lite result, for the next delta pass
+    text: str = field(default="", repr=False, compare=False)
+    result: Optional[Dict] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "sample_id": self.sample_id,
+            "gate": self.gate,
+            "overall_score": self.overall_score,
+            "V": self.V,
+            "V_max": self.V_max,
+            "taxonomy": self.taxonomy,
+            "violations": [v.to_dict() for v in self.violations],
+            "corrections": [c.to_dict() for c in self.corrections],
+            "rewrite_prompt": self.rewrite_prompt,
+            "version": self.version,
+        }
@@ -0,0 +1,6 @@
+"""Teacher: correction vectors, rewrite prompts and a stand-in rewriter."""
+
+from .correction import build_rewrite_prompt, generate_corrections
+from .rewrite import deterministic_rewrite
+
+__all__ = ["generate_corrections", "build_rewrite_prompt", "deterministic_rewrite"]
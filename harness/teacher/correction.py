@@ -0,0 +1,68 @@
+"""
+Correction Vectors and Rewrite Prompts
+
+generate_corrections maps each violation to one CorrectionVector: a
+fixed action per operator type and a fixed instruction, aimed at one
+sentence. Feedback stays structured; nothing here is free prose about
+the text. Most severe first, then in text order.
+
+build_rewrite_prompt renders the vectors and the text as the prompt a
+rewriting model receives. Its rules carry the loop's hard constraints:
+touch only the listed sentences, add no new abstractions, do not grow.
+"""
+
+from typing import List
+
+from ..schema import CorrectionVector, Violation
+
+# type -> (action, instruction)
+ACTIONS = {
+    "H2": ("dissolve_metaphor",
+           "Restate the metaphor literally (e.g. 'X, meaning Y') or remove it."),
+    "ABS": ("scope_absolute",
+            "Bound the absolute claim with its conditions or evidence, or weaken it."),
+    "INTENT": ("add_mechanism",
+               "Name the concrete mechanism (function, file, check) that carries out the intent."),
+    "ESC": ("bridge_abstraction",
+            "Connect the abstract claim to the preceding technical one explicitly, or drop it."),
+    "LOOP": ("remove_repetition",
+             "Delete this sentence; it rephrases the one before it."),
+    "PRESC": ("ground_prescription",
+              "Give the reason for the recommendation: a condition, spec or measurement."),
+    "SELF": ("qualify_self_reference",
+             "Qualify the claim about the system with the conditions it holds under."),
+}
+
+
+def generate_corrections(violations: List[Violation]) -> List[CorrectionVector]:
+    """One CorrectionVector per violation, most severe first."""
+    ordered = sorted(violations, key=lambda v: (-v.severity, v.sentence))
+    corrections = []
+    for v in ordered:
+        action, instruction = ACTIONS[v.type]
+        corrections.append(CorrectionVector(
+            type=v.type,
+            severity=v.severity,
+            sentence=v.sentence,
+            action=action,
+            instruction=instruction,
+            excerpt=v.excerpt,
+        ))
+    return corrections
+
+
+def build_rewrite_prompt(text: str, corrections: List[CorrectionVector]) -> str:
+    """Structured rewrite prompt for text under corrections."""
+    lines = [
+        "Rewrite the text below, applying only these corrections.",
+        "Rules: change only the listed sentences; keep every other sentence verbatim;",
+        "add no new claims or abstractions; do not make the text longer than needed.",
+        "",
+        "Corrections:",
+    ]
+    for n, c in enumerate(corrections, 1):
+        lines.append(f"{n}. [{c.type} severity {c.severity}] sentence {c.sentence}: "
+                     f"{c.action}. {c.instruction}")
+        lines.append(f"   > {c.excerpt}")
+    lines += ["", "Text:", text]
+    return "\n".join(lines)
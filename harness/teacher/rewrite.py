@@ -0,0 +1,102 @@
+"""
+Deterministic Stand-in Rewriter
+
+    run_teaching_loop(text, LLMHarness(), rewrite_fn=deterministic_rewrite)
+
+A rewrite_fn for offline tests and load runs: no model, same output for
+the same input. Each correction edits its sentence mechanically with a
+phrase the corresponding RC1 qualifier family recognizes:
+
+    dissolve_metaphor        append ", meaning the literal mechanism"
+    scope_absolute           append " in most cases"
+    add_mechanism            append " via `run()` in main.py"
+    bridge_abstraction       prefix "In practice, " (the old first word
+                             lowercased unless it looks like a name)
+    remove_repetition        delete the sentence
+    ground_prescription      append " because the spec requires it"
+    qualify_self_reference   append " as designed"
+
+Phrases go before the sentence's closing punctuation. A sentence gets
+each action once, and deletion wins. The edits resolve most single
+violations; long sentences with distant markers can keep theirs, and
+the loop's iteration limit applies as it would to a model.
+"""
+
+import re
+from typing import Dict, List
+
+from rc1_lite.context import DocumentContext
+
+from ..schema import CorrectionVector
+
+_APPEND = {
+    "dissolve_metaphor": ", meaning the literal mechanism",
+    "scope_absolute": " in most cases",
+    "add_mechanism": " via `run()` in main.py",
+    "ground_prescription": " because the spec requires it",
+    "qualify_self_reference": " as designed",
+}
+_PREFIX = {"bridge_abstraction": "In practice, "}
+_DELETE = "remove_repetition"
+
+_CLOSING = ".!?"
+
+_FIRST_WORD = re.compile(r"[A-Za-z]+")
+
+
+def _lower_first(head: str, text: str) -> str:
+    """
+    head with its first letter lowercased, if the first word is an
+    ordinary capitalized word: not "I" (or I'm, I'll), not an acronym or
+    other mixed case, and not capitalized mid-sentence elsewhere in text,
+    which marks a proper noun.
+    """
+    word = _FIRST_WORD.match(head)
+    if word is None:
+        return head
+    word = word.group()
+    if word == "I" or not (word[0].isupper() and word[1:] == word[1:].lower()):
+        return head
+    if re.search(r"[^\s.!?]\s+" + word + r"\b", text):
+        return head
+    return head[0].lower() + head[1:]
+
+
+def _edit(sentence: str, actions: List[str], text: str) -> str:
+    body = sentence.rstrip()
+    trail = sentence[len(body):]
+    end = len(body)
+    while end and body[end - 1] in _CLOSING:
+        end -= 1
+    head, close = body[:end], body[end:]
+    for action in actions:
+        if action in _APPEND:
+            head += _APPEND[action]
+        elif action in _PREFIX and head:
+            head = _PREFIX[action] + _lower_first(head, text)
+    return head + close + trail
+
+
+def deterministic_rewrite(text: str, corrections: List[CorrectionVector]) -> str:
+    """Apply corrections to text sentence by sentence (see module docstring)."""
+    spans = DocumentContext(text).sentence_spans
+    actions: Dict[int, List[str]] = {}
+    for c in corrections:
+        if 0 <= c.sentence < len(spans):
+            todo = actions.setdefault(c.sentence, [])
+            if c.action not in todo:
+                todo.append(c.action)
+
+    pieces = []
+    pos = 0
+    for i in sorted(actions):
+        a, b = spans[i]
+        pieces.append(text[pos:a])
+        if _DELETE in actions[i]:
+            # Drop the sentence and the whitespace that separated it
+            pos = spans[i + 1][0] if i + 1 < len(spans) else b
+            continue
+        pieces.append(_edit(text[a:b], actions[i], text))
+        pos = b
+    pieces.append(text[pos:])
+    return "".join(pieces)
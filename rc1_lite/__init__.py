@@ -6,7 +6,14 @@ Standalone engine matching the frozen RC1-2026-03-25 paper specification.
 Pure Python (stdlib only). No external dependencies. Deterministic.
 """
 
-from .engine import evaluate_output
+from .engine import evaluate_output, evaluate_gate, evaluate_result
+from .batch import evaluate_batch, iter_evaluate
+from .chunked import evaluate_chunked
+from .cache import ResultCache
+from .incremental import IncrementalEvaluator
+from .result import RC1Result
 from .version import VERSION
 
-__all__ = ["evaluate_output", "VERSION"]
+__all__ = ["evaluate_output", "evaluate_gate", "evaluate_result", "evaluate_batch",
+           "iter_evaluate", "evaluate_chunked", "ResultCache", "IncrementalEvaluator",
+           "RC1Result", "VERSION"]
@@ -0,0 +1,7 @@
+"""python -m rc1_lite: streaming JSONL corpus evaluator (see rc1_lite.cli)."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+RC1-Lite Batch Evaluation
+
+Fans evaluate_output out over a process pool.
+
+    evaluate_batch(texts, jobs=N)   -> [P(y_1), ..., P(y_n)]   (input order)
+    iter_evaluate(texts, jobs=N)    -> (i, P(y_i)) as chunks finish
+
+Texts are shipped in chunks to amortize pickling. At most `window`
+chunks are in flight (submitted or buffered for ordering), so memory
+stays bounded for arbitrarily long input iterables. Each result is
+exactly evaluate_output(y_i); only scheduling is parallel.
+
+compact=True yields RC1Results (evaluate_result) instead of dicts:
+smaller to pickle back from the workers and to hold, equal to the dicts.
+gate_only=True yields evaluate_gate(y), which may stop early.
+
+A None in texts is a placeholder: it keeps its position and yields None.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .engine import evaluate_gate, evaluate_output, evaluate_result
+from .result import RC1Result
+
+DEFAULT_CHUNKSIZE = 64
+
+
+def _evaluator(compact: bool, gate_only: bool):
+    if gate_only:
+        return evaluate_gate
+    return evaluate_result if compact else evaluate_output
+
+
+def _evaluate_chunk(chunk: List[Optional[str]], compact: bool = False,
+                    gate_only: bool = False) -> List[Union[Dict, RC1Result, None]]:
+    """Worker entry point."""
+    evaluate = _evaluator(compact, gate_only)
+    return [None if y is None else evaluate(y) for y in chunk]
+
+
+def _chunks(texts: Iterable[str], size: int) -> Iterator[Tuple[int, List[str]]]:
+    """(index of first text, chunk) over an arbitrary iterable."""
+    it = iter(texts)
+    start = 0
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _resolve_jobs(jobs: Optional[int]) -> int:
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def iter_evaluate(
+    texts: Iterable[str],
+    jobs: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    window: Optional[int] = None,
+    ordered: bool = False,
+    mp_context=None,
+    compact: bool = False,
+    gate_only: bool = False,
+) -> Iterator[Tuple[int, Union[Dict, RC1Result, None]]]:
+    """
+    Stream (index, result) pairs.
+
+    Args:
+        texts: any iterable of strings (or None placeholders); consumed lazily
+        jobs: worker processes (None or <= 0: one per CPU; 1: in-process)
+        chunksize: texts per task
+        window: max chunks in flight (default 2 * jobs)
+        ordered: yield in input order instead of completion order
+        mp_context: multiprocessing context for the pool
+        compact: yield RC1Results (evaluate_result) instead of dicts
+        gate_only: yield evaluate_gate results (overrides compact)
+
+    Unordered output yields each chunk as soon as it completes.
+    Ordered output holds completed chunks until their predecessors
+    arrive; held chunks count against the window.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    jobs = _resolve_jobs(jobs)
+
+    if jobs == 1:
+        evaluate = _evaluator(compact, gate_only)
+        for i, y in enumerate(texts):
+            yield i, None if y is None else evaluate(y)
+        return
+
+    window = window if window and window > 0 else 2 * jobs
+    source = _chunks(texts, chunksize)
+    pending = {}      # future -> index of first text
+    held = {}         # index of first text -> results (ordered mode)
+    next_index = 0
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as pool:
+        try:
+            while True:
+                while not exhausted and len(pending) + len(held) < window:
+                    item = next(source, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    start, chunk = item
+                    pending[pool.submit(_evaluate_chunk, chunk, compact, gate_only)] = start
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    start = pending.pop(future)
+                    results = future.result()
+                    if not ordered:
+                        for offset, result in enumerate(results):
+                            yield start + offset, result
+                        continue
+                    held[start] = results
+                    while next_index in held:
+                        results = held.pop(next_index)
+                        for offset, result in enumerate(results):
+                            yield next_index + offset, result
+                        next_index += len(results)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def evaluate_batch(
+    texts: Iterable[str],
+    jobs: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    mp_context=None,
+    compact: bool = False,
+) -> List[Union[Dict, RC1Result]]:
+    """
+    [evaluate_output(y) for y in texts], computed across a process pool.
+
+    Results are in input order; RC1Results if compact.
+    """
+    return [
+        result for _, result in iter_evaluate(
+            texts, jobs=jobs, chunksize=chunksize, ordered=True,
+            mp_context=mp_context, compact=compact,
+        )
+    ]
@@ -0,0 +1,347 @@
+"""
+RC1-Lite Benchmarks
+
+Latency of evaluate_output end to end and per operator, against text
+length, violation density and document class:
+
+    python -m rc1_lite.bench --out bench.json
+    python -m rc1_lite.bench --quick --baseline bench.json    # exit 1 on regression
+
+    report = run_benchmarks(quick=True)
+    regressions = compare(report, baseline)
+
+Suites (inputs from rc1_lite.corpus, seeded):
+
+    length      100 B .. 1 MB documents at 5% violation sentences
+    density     10 kB documents from 0% to 100% violation sentences
+    class       one case per samples/batch.jsonl class, plus the
+                docs/fp_study.md corpus
+
+Every case reports exact percentiles (nearest rank) of end-to-end time,
+timed uninstrumented, and of each stage's time, hits and window checks,
+from separate instrumented passes (rc1_lite.instrument; stage "scan" is
+the fused scan). Each case has its own seeded inputs, so a single suite
+compares cleanly against a full run. The report is JSON and carries a calibration time of a fixed
+stdlib workload; compare() scales baseline times by the calibration ratio
+before applying its tolerance, so a baseline from a slower machine still
+catches real regressions. Baselines are machine-specific and are not
+checked in: write one with --out and pass it back with --baseline.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .corpus import CLASSES, class_document, document, fp_study_corpus
+from .engine import evaluate_output, instrumented
+from .instrument import Instrumentation
+from .version import VERSION
+
+SUITES = ("length", "density", "class")
+
+LENGTHS = (100, 1_000, 10_000, 100_000, 1_000_000)
+LENGTH_DENSITY = 0.05
+DENSITY_CHARS = 10_000
+DENSITIES = (0.0, 0.01, 0.05, 0.2, 0.5, 1.0)
+CLASS_DOCS = 50
+
+# Timing budget per case in seconds; every document runs at least once
+BUDGET = 2.0
+QUICK_BUDGET = 0.25
+
+# Quantiles reported for every metric
+QUANTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99))
+
+# compare(): time metrics checked, and the floor below which they are noise
+COMPARED = ("p50", "p90")
+MIN_COMPARE_US = 50
+
+
+def stats(values: Sequence[int]) -> Dict:
+    """count, min, max, mean and exact nearest-rank quantiles."""
+    ordered = sorted(values)
+    n = len(ordered)
+    if not n:
+        return {"count": 0}
+    summary = {"count": n, "min": ordered[0], "max": ordered[-1],
+               "mean": round(sum(ordered) / n, 3)}
+    for name, q in QUANTILES:
+        summary[name] = ordered[max(1, math.ceil(n * q)) - 1]
+    return summary
+
+
+class _Samples(Instrumentation):
+    """Instrumentation that keeps every sample rather than histograms."""
+
+    def __init__(self):
+        super().__init__()
+        self.samples = {}   # stage -> (time_us, hits, window_checks) lists
+
+    def record(self, samples) -> None:
+        for stage, time_us, hits, windows in samples:
+            lists = self.samples.get(stage)
+            if lists is None:
+                lists = self.samples[stage] = ([], [], [])
+            lists[0].append(time_us)
+            lists[1].append(hits)
+            lists[2].append(windows)
+
+
+def calibrate(rounds: int = 5) -> int:
+    """Best-of-rounds time (us) of a fixed, engine-independent stdlib workload."""
+    words = re.compile(r"\b\w+\b")
+    text = " ".join(f"token{i % 97} value{i % 13}." for i in range(2000))
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter_ns()
+        counts = {}
+        for match in words.finditer(text):
+            word = match.group()
+            counts[word] = counts.get(word, 0) + 1
+        sorted(counts.items())
+        sum(i * i for i in range(20000))
+        elapsed = (time.perf_counter_ns() - started) // 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure(texts: Sequence[str], budget: float = BUDGET,
+            evaluate: Callable[[str], Dict] = evaluate_output) -> Dict:
+    """
+    Benchmark one case: evaluate texts round-robin until budget seconds.
+
+    Whole passes only, at least one. End-to-end times are taken
+    uninstrumented; per-stage samples come from further instrumented
+    passes, for half the budget again.
+    """
+    clock = time.perf_counter_ns
+    gc.collect()
+    e2e = []
+    deadline = time.perf_counter() + budget
+    while True:
+        for y in texts:
+            started = clock()
+            evaluate(y)
+            e2e.append((clock() - started) // 1000)
+        if time.perf_counter() >= deadline:
+            break
+
+    recorder = _Samples()
+    results = []
+    deadline = time.perf_counter() + budget / 2
+    with instrumented(recorder):
+        while True:
+            for y in texts:
+                result = evaluate(y)
+                if len(results) < len(texts):
+                    results.append(result)
+            if time.perf_counter() >= deadline:
+                break
+    gates = {}
+    for result in results:
+        gates[result["gate"]] = gates.get(result["gate"], 0) + 1
+
+    return {
+        "docs": len(texts),
+        "mean_chars": round(sum(map(len, texts)) / max(1, len(texts)), 1),
+        "mean_V": round(sum(r["V"] for r in results) / max(1, len(results)), 3),
+        "gates": gates,
+        "e2e_us": stats(e2e),
+        "stages": {
+            stage: {"time_us": stats(t), "hits": stats(h), "window_checks": stats(w)}
+            for stage, (t, h, w) in recorder.samples.items()
+        },
+    }
+
+
+def _cases(suites: Sequence[str], quick: bool, seed: int):
+    """(group, name, texts) for every case of the selected suites."""
+    def rng(group: str, name: str) -> random.Random:
+        return random.Random(f"rc1-bench:{seed}:{group}/{name}")
+
+    if "length" in suites:
+        for length in LENGTHS[:-1] if quick else LENGTHS:
+            # About 200 kB of text per case, at least one document
+            n = max(1, min(50, 200_000 // length))
+            if quick:
+                n = max(1, n // 5)
+            r = rng("length", str(length))
+            yield "length", str(length), [document(length, LENGTH_DENSITY, r)
+                                          for _ in range(n)]
+    if "density" in suites:
+        n = 4 if quick else 20
+        for density in DENSITIES:
+            r = rng("density", f"{density:g}")
+            yield "density", f"{density:g}", [document(DENSITY_CHARS, density, r)
+                                              for _ in range(n)]
+    if "class" in suites:
+        n = CLASS_DOCS // 5 if quick else CLASS_DOCS
+        for cls in CLASSES:
+            r = rng("class", cls)
+            yield "class", cls, [class_document(cls, r) for _ in range(n)]
+        yield "class", "fp_study", fp_study_corpus(seed=seed)
+
+
+def run_benchmarks(
+    suites: Sequence[str] = SUITES,
+    quick: bool = False,
+    seed: int = 0,
+    budget: Optional[float] = None,
+    progress: Optional[Callable[[str, Dict], None]] = None,
+) -> Dict:
+    """
+    Run the selected suites; returns the JSON-shaped report.
+
+    quick drops the 1 MB length case and uses fewer documents and a
+    shorter budget (QUICK_BUDGET) per case. progress(key, result) is
+    called after each case.
+    """
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        raise ValueError(f"unknown suites {sorted(unknown)}; expected a subset of {SUITES}")
+    if budget is None:
+        budget = QUICK_BUDGET if quick else BUDGET
+
+    started = time.perf_counter()
+    results = {}
+    for group, name, texts in _cases(suites, quick, seed):
+        key = f"{group}/{name}"
+        results[key] = measure(texts, budget)
+        if progress is not None:
+            progress(key, results[key])
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "calibration_us": calibrate(),
+        "quick": quick,
+        "seed": seed,
+        "budget_s": budget,
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25) -> List[Dict]:
+    """
+    Time metrics of current more than (1 + tolerance) x the baseline.
+
+    Baseline times are first scaled by the ratio of the two reports'
+    calibration times. Only cases and stages present in both are
+    compared, and only COMPARED quantiles of at least MIN_COMPARE_US.
+    """
+    scale = 1.0
+    if current.get("calibration_us") and baseline.get("calibration_us"):
+        scale = current["calibration_us"] / baseline["calibration_us"]
+
+    regressions = []
+
+    def check(case: str, stage: str, now: Dict, then: Dict) -> None:
+        for metric in COMPARED:
+            if metric not in now or metric not in then:
+                continue
+            expected = then[metric] * scale
+            if max(now[metric], expected) < MIN_COMPARE_US:
+                continue
+            ratio = now[metric] / max(expected, 1e-9)
+            if ratio > 1.0 + tolerance:
+                regressions.append({
+                    "case": case, "stage": stage, "metric": metric,
+                    "baseline_us": then[metric], "expected_us": round(expected, 1),
+                    "current_us": now[metric], "ratio": round(ratio, 3),
+                })
+
+    for case, result in current.get("results", {}).items():
+        old = baseline.get("results", {}).get(case)
+        if old is None:
+            continue
+        check(case, "e2e", result["e2e_us"], old["e2e_us"])
+        for stage, metrics in result["stages"].items():
+            if stage in old["stages"]:
+                check(case, stage, metrics["time_us"], old["stages"][stage]["time_us"])
+    return regressions
+
+
+# ── CLI ──
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m rc1_lite.bench",
+        description=f"Latency benchmarks for RC1-Lite ({VERSION}).",
+    )
+    parser.add_argument("--suite", default=",".join(SUITES),
+                        help=f"comma-separated subset of {','.join(SUITES)}")
+    parser.add_argument("--quick", action="store_true",
+                        help="smaller corpus, no 1 MB case, short budget")
+    parser.add_argument("--budget", type=float, default=None,
+                        help=f"seconds per case (default {BUDGET}, quick {QUICK_BUDGET})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None,
+                        help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", default=None,
+                        help="compare against this report; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown over the baseline (default 0.25)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="no progress on stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    suites = args.suite.split(",")
+    if not set(suites) <= set(SUITES):
+        parser.error(f"--suite must be a subset of {','.join(SUITES)}")
+    if args.budget is not None and args.budget < 0:
+        parser.error("--budget must be >= 0")
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read baseline: {exc}")
+
+    def progress(key: str, result: Dict) -> None:
+        e2e = result["e2e_us"]
+        sys.stderr.write(f"{key:<28} {result['mean_chars']:>10.0f} chars  "
+                         f"p50 {e2e['p50']:>9} us  p99 {e2e['p99']:>9} us  "
+                         f"(n={e2e['count']})\n")
+
+    report = run_benchmarks(suites, quick=args.quick, seed=args.seed, budget=args.budget,
+                            progress=None if args.quiet else progress)
+    status = 0
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        report["regressions"] = regressions
+        for r in regressions:
+            sys.stderr.write(f"REGRESSION {r['case']} {r['stage']} {r['metric']}: "
+                             f"{r['current_us']} us vs {r['expected_us']} us "
+                             f"(x{r['ratio']})\n")
+        if regressions:
+            status = 1
+        elif not args.quiet:
+            sys.stderr.write(f"no regressions against {args.baseline} "
+                             f"(tolerance {args.tolerance:g})\n")
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+RC1-Lite Result Cache
+
+evaluate_output is a pure function of (y, VERSION), so its results can
+be memoized by content:
+
+    key = blake2b(VERSION || 0x00 || utf8(y))
+
+Opt-in. Bounded by entry count and by an estimate of result bytes;
+least-recently-used entries are evicted first. Texts are not retained,
+only their digests. Thread-safe.
+
+Results come back frozen (FrozenDict / FrozenList): they compare equal
+to, and serialize exactly like, evaluate_output(y), but refuse mutation,
+so no caller can corrupt an entry another caller will be handed.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .version import VERSION
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """
+    dict that refuses mutation. Equal to, and JSON-encoded as, a dict.
+
+    Filled in __new__; __init__ does nothing, so calling it again on a
+    cached instance cannot refill it.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        self = dict.__new__(cls)
+        dict.__init__(self, *args, **kwargs)
+        return self
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    list that refuses mutation. Equal to, and JSON-encoded as, a list.
+
+    Filled in __new__, like FrozenDict.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, iterable=()):
+        self = list.__new__(cls)
+        list.__init__(self, iterable)
+        return self
+
+    def __init__(self, iterable=()):
+        pass
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(obj):
+    """Deep read-only copy of a JSON-shaped result."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def _sizeof(obj) -> int:
+    """Approximate retained bytes of a frozen result."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _sizeof(k) + _sizeof(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            size += _sizeof(v)
+    return size
+
+
+def text_key(y: str, version: str = VERSION) -> bytes:
+    """Content address of y under a spec version."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(version.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(y.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+class ResultCache:
+    """
+    Content-addressed LRU cache in front of evaluate_output.
+
+        cache = ResultCache(max_entries=10_000, max_bytes=32 << 20)
+        result = cache.evaluate(y)      # == evaluate_output(y), frozen
+
+    Concurrent misses on the same text may both evaluate; the results
+    are identical, so whichever is stored last wins harmlessly.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 evaluate: Optional[Callable[[str], Dict]] = None,
+                 version: str = VERSION):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if evaluate is None:
+            from .engine import evaluate_output as evaluate
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = version
+        self._evaluate = evaluate
+        self._entries = OrderedDict()   # key -> (result, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, y: str) -> Optional[Dict]:
+        """Cached result for y, or None. Counts a hit or a miss."""
+        key = text_key(y, self.version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, y: str, result: Dict) -> Dict:
+        """Store result for y; returns the frozen copy that was stored."""
+        key = text_key(y, self.version)
+        frozen = freeze(result)
+        size = _sizeof(frozen) + len(key)
+        if size > self.max_bytes:
+            return frozen   # would evict everything and still not fit
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (frozen, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return frozen
+
+    def evaluate(self, y: str) -> Dict:
+        """evaluate_output(y), served from the cache when possible."""
+        result = self.get(y)
+        if result is None:
+            result = self.put(y, self._evaluate(y))
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,458 @@
+"""
+RC1-Lite Certification Runner
+
+Automates the submission in certification/compliance-checklist.md:
+engine hash, results on the test vectors, runtime, and the diff from
+the reference.
+
+    python -m rc1_lite.certify certification/test-vectors.jsonl --jobs 4 \\
+        --out report.json --results results.jsonl --signed-by "A. Maintainer"
+
+Vectors are JSONL records {"id", "input", "expected"}, read lazily, so
+files of any size stream through. Each output is projected onto the
+keys of its "expected" (V, V_max, score, gate, taxonomy, version, and
+violation_count = len(violations)) and must match exactly.
+
+The reference engine runs on rc1_lite.batch (process pool, compact
+results). A third-party implementation is driven as a subprocess with
+--command: it reads {"id": n, "text": ...} lines on stdin and writes one
+result line per record ({"id": n, ...}), in any order, the protocol of
+`python -m rc1_lite`. Its sources are hashed with --hash-file.
+
+The engine hash is the SHA-256 of a sha256sum-style manifest
+("<sha256>  <path>" per module, sorted by path), so it can be recomputed
+with standard tools. The report is signed off with the SHA-256 of its
+canonical JSON, and with an HMAC-SHA256 under --key-file if given;
+verify_report checks both. --baseline adds the throughput relative to
+another report, e.g. the Python reference's on the same vectors.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import platform
+import queue
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .batch import DEFAULT_CHUNKSIZE, _resolve_jobs, iter_evaluate
+from .version import VERSION
+
+_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+
+# Modules evaluate_output executes, relative to the package
+ENGINE_MODULES = (
+    "engine.py", "scoring.py", "version.py", "context.py", "scanner.py",
+    "lexicon.py", "window.py", "instrument.py", "result.py", "deadline.py",
+    "incremental.py",
+    "constraints/__init__.py",
+    "constraints/h2_metaphor.py",
+    "constraints/absolute_claim.py",
+    "constraints/intent_execution.py",
+    "constraints/abstraction_escalation.py",
+    "constraints/rephrasing_loop.py",
+    "constraints/ungrounded_prescriptive.py",
+    "constraints/self_reference.py",
+)
+
+# Mismatches listed in the report; all are counted
+MAX_LISTED = 100
+
+
+# ── Engine hash ──
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def engine_hash(paths: Optional[Sequence[str]] = None, root: Optional[str] = None) -> Dict:
+    """
+    {"sha256", "modules": {path: sha256}} of the engine sources.
+
+    Defaults to ENGINE_MODULES of this package. Paths are reported
+    relative to root (default: the package directory for the defaults,
+    else the current directory).
+    """
+    if paths is None:
+        root = _PACKAGE
+        files = [os.path.join(_PACKAGE, *name.split("/")) for name in ENGINE_MODULES]
+    else:
+        root = root or os.getcwd()
+        files = list(paths)
+    modules = {}
+    for path in files:
+        name = os.path.relpath(path, root).replace(os.sep, "/")
+        modules[name] = _file_sha256(path)
+    manifest = "".join(f"{digest}  {name}\n" for name, digest in sorted(modules.items()))
+    return {
+        "sha256": hashlib.sha256(manifest.encode("utf-8")).hexdigest(),
+        "modules": dict(sorted(modules.items())),
+    }
+
+
+# ── Vectors ──
+
+def read_vectors(stream: BinaryIO, digest=None) -> Iterator[Dict]:
+    """
+    Parse vector JSONL lazily: {"id", "input", "expected", "chars"} per
+    non-blank line, or {"id", "error"} for a record that cannot be run. digest,
+    a hashlib object, is fed every line read.
+    """
+    for number, line in enumerate(stream, 1):
+        if digest is not None:
+            digest.update(line)
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError as exc:
+            yield {"id": f"line {number}", "error": f"invalid JSON: {exc}"}
+            continue
+        if not isinstance(obj, dict) or not isinstance(obj.get("input"), str) \
+                or not isinstance(obj.get("expected"), dict):
+            rid = obj.get("id") if isinstance(obj, dict) else None
+            yield {"id": rid if rid is not None else f"line {number}",
+                   "error": "expected {\"id\", \"input\": string, \"expected\": object}"}
+            continue
+        yield {"id": obj.get("id", f"line {number}"), "input": obj["input"],
+               "expected": obj["expected"], "chars": len(obj["input"])}
+
+
+def project(result, keys: Iterable[str]) -> Dict:
+    """result restricted to keys; violation_count is len(result["violations"])."""
+    out = {}
+    for key in keys:
+        if key == "violation_count" and "violation_count" not in result:
+            out[key] = len(result["violations"]) if "violations" in result else None
+        else:
+            out[key] = result.get(key)
+    return out
+
+
+def diff(expected: Dict, actual: Dict) -> List[str]:
+    """Keys of expected whose values actual does not reproduce exactly."""
+    return [key for key, value in expected.items()
+            if actual.get(key) != value or type(actual.get(key)) is not type(value)]
+
+
+# ── Engines ──
+
+def _run_reference(vectors: Iterator[Dict], jobs: Optional[int],
+                   chunksize: int) -> Iterator[Tuple[Dict, Optional[Dict]]]:
+    """(vector, result) in input order; result None for unrunnable vectors."""
+    held = []
+
+    def texts() -> Iterator[str]:
+        for vector in vectors:
+            held.append(vector)
+            if "input" in vector:
+                yield vector["input"]
+
+    position = 0
+    for _, result in iter_evaluate(texts(), jobs=jobs, chunksize=chunksize,
+                                   ordered=True, compact=True):
+        while "input" not in held[position]:
+            yield held[position], None
+            position += 1
+        yield held[position], result
+        position += 1
+        if position > 4096:
+            del held[:position]
+            position = 0
+    for vector in held[position:]:
+        yield vector, None
+
+
+def _run_command(vectors: Iterator[Dict], command: str) -> Iterator[Tuple[Dict, Optional[Dict]]]:
+    """
+    (vector, result) from an external engine speaking the rc1_lite CLI
+    protocol; results may come back in any order. Unrunnable vectors
+    are yielded first, as they are read.
+    """
+    proc = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE)
+    pending = {}                    # sequence number -> vector
+    errors = queue.Queue()          # unrunnable vectors, from the writer
+    lock = threading.Lock()
+
+    def write() -> None:
+        try:
+            for n, vector in enumerate(vectors):
+                if "input" not in vector:
+                    errors.put(vector)
+                    continue
+                with lock:
+                    pending[n] = {"id": vector["id"], "expected": vector["expected"],
+                                  "chars": vector["chars"]}
+                proc.stdin.write(json.dumps({"id": n, "text": vector["input"]}).encode() + b"\n")
+        except OSError:
+            pass        # engine gone; its missing answers are reported
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    try:
+        for line in proc.stdout:
+            while not errors.empty():
+                yield errors.get(), None
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                with lock:
+                    vector = pending.pop(row["id"])
+            except (ValueError, KeyError, TypeError):
+                raise RuntimeError(f"engine wrote an unmatched line: {line[:200]!r}")
+            yield vector, row
+        writer.join()
+        while not errors.empty():
+            yield errors.get(), None
+        status = proc.wait()
+        if pending:
+            raise RuntimeError(f"engine exited ({status}) without answering "
+                               f"{len(pending)} vectors")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+
+# ── Runner ──
+
+def certify(
+    stream: BinaryIO,
+    *,
+    jobs: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    command: Optional[str] = None,
+    hash_files: Optional[Sequence[str]] = None,
+    results_out: Optional[TextIO] = None,
+    source: str = "-",
+) -> Dict:
+    """
+    Run every vector of stream; returns the report (unsigned).
+
+    command: external engine (see module docstring); None runs this
+    package. results_out receives {"id", "result", "match"} per vector.
+    """
+    digest = hashlib.sha256()
+    vectors = read_vectors(stream, digest)
+    if command is None:
+        outcomes = _run_reference(vectors, jobs, chunksize)
+        engine = {"name": "rc1_lite", "version": VERSION, **engine_hash(hash_files)}
+    else:
+        outcomes = _run_command(vectors, command)
+        engine = {"name": command, **(engine_hash(hash_files) if hash_files else {})}
+
+    counts = {"vectors": 0, "passed": 0, "failed": 0, "errors": 0}
+    mismatches = []
+    size = 0
+    started = time.perf_counter()
+    for vector, result in outcomes:
+        counts["vectors"] += 1
+        if result is None:
+            counts["errors"] += 1
+            entry = {"id": vector["id"], "error": vector["error"]}
+            match = False
+        else:
+            size += vector["chars"]
+            actual = project(result, vector["expected"])
+            fields = diff(vector["expected"], actual)
+            match = not fields
+            counts["passed" if match else "failed"] += 1
+            entry = {"id": vector["id"], "fields": fields,
+                     "expected": vector["expected"], "actual": actual}
+        if not match and len(mismatches) < MAX_LISTED:
+            mismatches.append(entry)
+        if results_out is not None:
+            row = {"id": vector["id"], "match": match}
+            if result is None:
+                row["error"] = vector["error"]
+            else:
+                row["result"] = result.to_dict() if hasattr(result, "to_dict") else \
+                    {k: v for k, v in result.items() if k != "id"}
+            results_out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    seconds = time.perf_counter() - started
+
+    return {
+        "certification": VERSION,
+        "compliant": counts["vectors"] > 0 and counts["passed"] == counts["vectors"],
+        "engine": engine,
+        "runtime": {
+            "runner": f"{platform.python_implementation()} {platform.python_version()}",
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "jobs": _resolve_jobs(jobs) if command is None else None,
+        },
+        "vectors": {"source": source, "sha256": digest.hexdigest(), **counts},
+        "mismatches": mismatches,
+        "timing": {
+            "seconds": round(seconds, 6),
+            "vectors_per_second": round(counts["vectors"] / max(seconds, 1e-9), 1),
+            "input_chars_per_second": round(size / max(seconds, 1e-9), 1),
+        },
+    }
+
+
+def compare_baseline(report: Dict, baseline: Dict) -> Dict:
+    """Throughput of report relative to baseline, and whether both ran the same vectors."""
+    ours = report["timing"]["vectors_per_second"]
+    theirs = baseline.get("timing", {}).get("vectors_per_second") or 0
+    return {
+        "engine": baseline.get("engine", {}).get("name"),
+        "engine_sha256": baseline.get("engine", {}).get("sha256"),
+        "same_vectors": baseline.get("vectors", {}).get("sha256") == report["vectors"]["sha256"],
+        "vectors_per_second": theirs,
+        "relative_throughput": round(ours / theirs, 3) if theirs else None,
+    }
+
+
+# ── Sign-off ──
+
+def _canonical(report: Dict) -> bytes:
+    body = {k: v for k, v in report.items() if k != "signoff"}
+    return json.dumps(body, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False).encode("utf-8")
+
+
+def sign_report(report: Dict, signed_by: Optional[str] = None,
+                key: Optional[bytes] = None) -> Dict:
+    """Add report["signoff"]: digest of the canonical report, and its HMAC if key."""
+    report.pop("signoff", None)
+    report["signed_by"] = signed_by
+    report["signed_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    canonical = _canonical(report)
+    signoff = {"sha256": hashlib.sha256(canonical).hexdigest()}
+    if key is not None:
+        signoff["hmac_sha256"] = hmac.new(key, canonical, hashlib.sha256).hexdigest()
+    report["signoff"] = signoff
+    return report
+
+
+def verify_report(report: Dict, key: Optional[bytes] = None) -> bool:
+    """True if the report is unaltered since sign-off (and, with key, signed with it)."""
+    signoff = report.get("signoff") or {}
+    canonical = _canonical(report)
+    if not hmac.compare_digest(signoff.get("sha256", ""),
+                               hashlib.sha256(canonical).hexdigest()):
+        return False
+    if key is None:
+        return True
+    expected = hmac.new(key, canonical, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signoff.get("hmac_sha256", ""), expected)
+
+
+# ── CLI ──
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m rc1_lite.certify",
+        description=f"Run RC1 certification vectors ({VERSION}).",
+    )
+    parser.add_argument("vectors", nargs="?", default="-",
+                        help="vector JSONL (default: stdin)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="worker processes for the reference engine (0: one per CPU)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--command", default=None,
+                        help="external engine to certify instead (rc1_lite CLI protocol)")
+    parser.add_argument("--hash-file", action="append", default=None, metavar="PATH",
+                        help="engine source to hash (repeatable; default: rc1_lite modules)")
+    parser.add_argument("--results", default=None,
+                        help="write per-vector results (JSONL) here")
+    parser.add_argument("--baseline", default=None,
+                        help="report to compare throughput against")
+    parser.add_argument("--signed-by", default=None)
+    parser.add_argument("--key-file", default=None,
+                        help="HMAC-SHA256 the report with this file's contents")
+    parser.add_argument("--verify", default=None, metavar="REPORT",
+                        help="only verify the sign-off of REPORT (with --key-file)")
+    parser.add_argument("--out", default=None,
+                        help="write the JSON report here (default: stdout)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="no summary on stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    key = None
+    if args.key_file:
+        try:
+            with open(args.key_file, "rb") as f:
+                key = f.read()
+        except OSError as exc:
+            parser.error(f"cannot read key: {exc}")
+
+    if args.verify:
+        try:
+            with open(args.verify, encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read report: {exc}")
+        ok = verify_report(report, key)
+        if not args.quiet:
+            sys.stderr.write(f"{args.verify}: {'signature valid' if ok else 'INVALID'}\n")
+        return 0 if ok else 1
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read baseline: {exc}")
+
+    stream = sys.stdin.buffer if args.vectors == "-" else open(args.vectors, "rb")
+    results_out = open(args.results, "w", encoding="utf-8") if args.results else None
+    try:
+        report = certify(stream, jobs=args.jobs, chunksize=args.chunksize,
+                         command=args.command, hash_files=args.hash_file,
+                         results_out=results_out, source=args.vectors)
+    except (OSError, RuntimeError) as exc:
+        sys.stderr.write(f"rc1_lite.certify: {exc}\n")
+        return 2
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        if results_out is not None:
+            results_out.close()
+    if baseline is not None:
+        report["baseline"] = compare_baseline(report, baseline)
+    sign_report(report, args.signed_by, key)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+    if not args.quiet:
+        v = report["vectors"]
+        sys.stderr.write(
+            f"rc1_lite.certify: {'COMPLIANT' if report['compliant'] else 'NOT COMPLIANT'} "
+            f"{v['passed']}/{v['vectors']} passed, {v['failed']} failed, "
+            f"{v['errors']} errors | engine {report['engine'].get('sha256', '-')[:16]} | "
+            f"{report['timing']['vectors_per_second']} vectors/s\n")
+    return 0 if report["compliant"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
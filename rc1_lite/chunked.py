@@ -0,0 +1,291 @@
+"""
+RC1-Lite Chunked Evaluation
+
+For long documents (whole reports, transcripts: 100k+ characters):
+
+    evaluate_chunked(y, jobs=N)    -> evaluate_output(y), computed in parallel
+
+y is cut at sentence starts (context.SENT_SPLIT) into chunks of about
+chunk_chars. Chunk j owns the raw marker matches starting in
+[a_j, a_{j+1}) and the sentences starting there. Its worker gets that
+region plus the overlap needed to decide everything it owns alone:
+
+    left    the char before a_j (\\b), the widest qualifier window
+            (H2: 20 tokens x 6 chars), and the '.' opening SELF's
+            sentence window
+    right   the widest window, the '.' closing SELF's window, and enough
+            whitespace runs after a_{j+1} that every owned raw match is
+            final (incremental._SETTLE_RUNS, from PatternEdges.reach)
+
+and returns per-operator partial state (ChunkState):
+
+    markers     every owned raw match of every pattern, with the verdict
+                of its qualifier window
+    LOOP        similar adjacent pairs inside the chunk; the token sets
+                of its first and last sentence
+    ESC         the first escalating pair inside the chunk; the
+                (tech, abstract, bridge) flags of its first and last
+                sentence
+
+Merging chains each pattern's raw matches into finditer hits (leftmost,
+non-overlapping, so a match straddling a cut is resolved there), and
+tests the sentence pairs that straddle a cut. The result equals
+evaluate_output(y) exactly. A single sentence longer than chunk_chars
+stays one chunk; text without sentence splits is not parallelized.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .batch import _resolve_jobs
+from .context import DocumentContext, token_set
+from .engine import SCANNER, _project, evaluate_output
+from .incremental import _SETTLE_RUNS, _WS_RUN
+from .constraints import (
+    h2_metaphor as _h2,
+    absolute_claim as _abs,
+    intent_execution as _intent,
+    abstraction_escalation as _esc,
+    rephrasing_loop as _loop,
+    ungrounded_prescriptive as _presc,
+    self_reference as _self,
+)
+
+Span = Tuple[int, int]
+Flags = Tuple[bool, bool, bool]
+
+# Marker operators: (tag, qualifier tag, window radius in chars).
+# A radius of None is SELF's window: the '.'-delimited sentence.
+_MARKERS = (
+    ("H2", "H2_DISSOLVE", _h2.WINDOW_TOKENS * 6),
+    ("ABS", "ABS_SCOPE", _abs.WINDOW_TOKENS * 7),
+    ("INTENT", "INTENT_MECH", _intent.WINDOW_TOKENS * 7),
+    ("PRESC", "PRESC_GROUND", _presc.WINDOW_TOKENS * 7),
+    ("SELF", "SELF_QUAL", None),
+)
+_RADIUS = max(radius for _, _, radius in _MARKERS if radius)
+
+_SENTENCE_TAGS = ("ESC_TECH", "ESC_ABSTRACT", "ESC_BRIDGE")
+
+# Below this a chunk's overlap and pickling outweigh the parallel scan
+MIN_CHUNK_CHARS = 16 << 10
+
+
+class ChunkState(NamedTuple):
+    """Partial evaluation of one chunk; positions and indices are global."""
+    markers: List[List[List[Tuple[int, int, bool]]]]   # [operator][pattern] -> (s, e, qualified)
+    loop_repeats: int
+    loop_first: int                     # first similar pair inside the chunk, or -1
+    first_set: FrozenSet[str]           # token set of the first sentence
+    last_set: FrozenSet[str]            # token set of the last sentence
+    esc_first: int                      # first escalating pair inside the chunk, or -1
+    first_flags: Flags                  # (tech, abstract, bridge) of the first sentence
+    last_flags: Flags
+
+
+def plan_chunks(spans: List[Span], chunk_chars: int) -> List[Tuple[int, int]]:
+    """Group sentence spans into [i0, i1) index ranges of about chunk_chars each."""
+    chunks = []
+    i0 = 0
+    for i in range(1, len(spans)):
+        if spans[i][0] - spans[i0][0] >= chunk_chars:
+            chunks.append((i0, i))
+            i0 = i
+    if spans:
+        chunks.append((i0, len(spans)))
+    return chunks
+
+
+def _bounds(y: str, a: int, b: int) -> Span:
+    """[lo, hi): the slice of y that decides everything owned by [a, b)."""
+    n = len(y)
+    dot = y.rfind(".", 0, a)
+    lo = max(0, min(a - 1, a - _RADIUS, dot))
+    if b >= n:
+        return lo, n
+    runs = list(islice(_WS_RUN.finditer(y, b), _SETTLE_RUNS))
+    if len(runs) < _SETTLE_RUNS:
+        return lo, n
+    dot = y.find(".", b)
+    hi = max(b + _RADIUS, runs[-1].start() + 1, dot + 1 if dot >= 0 else n)
+    return lo, min(n, hi)
+
+
+def _evaluate_chunk(task: Tuple) -> ChunkState:
+    """Worker entry point: partial state of the region [a, b)."""
+    text, lo, n, a, b, first, spans = task
+    scan = SCANNER.scan(text)
+    ctx = DocumentContext(text, scan)
+
+    markers = []
+    for tag, qualifier_tag, radius in _MARKERS:
+        qualified = ctx.window_test(qualifier_tag, SCANNER.families[qualifier_tag])
+        per_pattern = []
+        for raw in scan.raw(tag):
+            owned = []
+            for s, e in raw:
+                if s + lo < a:
+                    continue
+                if s + lo >= b:
+                    break
+                if radius is None:
+                    # _bounds keeps the '.' on either side inside the slice
+                    cs = text.rfind(".", 0, s) + 1
+                    ce = text.find(".", s)
+                    ce = ce + 1 if ce >= 0 else len(text)
+                else:
+                    cs = max(0, s + lo - radius) - lo
+                    ce = min(n, s + lo + radius) - lo
+                owned.append((s + lo, e + lo, qualified(cs, ce)))
+            per_pattern.append(owned)
+        markers.append(per_pattern)
+
+    sets = []
+    flags = []
+    for sa, sb in spans:
+        sa -= lo
+        sb -= lo
+        sets.append(token_set(text[sa:sb]))
+        flags.append(tuple(scan.any_start(tag, sa, sb) for tag in _SENTENCE_TAGS))
+
+    repeats = 0
+    loop_first = -1
+    esc_first = -1
+    for i in range(len(spans) - 1):
+        if _loop._jaccard_sets(sets[i], sets[i + 1]) > _loop.LAMBDA:
+            repeats += 1
+            if loop_first < 0:
+                loop_first = first + i
+        if esc_first < 0 and _escalates(flags[i], flags[i + 1]):
+            esc_first = first + i
+
+    return ChunkState(markers, repeats, loop_first, sets[0], sets[-1],
+                      esc_first, flags[0], flags[-1])
+
+
+def _escalates(prev: Flags, cur: Flags) -> bool:
+    """T in the first sentence, H in the second, no bridge in either."""
+    return prev[0] and cur[1] and not (prev[2] or cur[2])
+
+
+def _marker_totals(states: List[ChunkState], m: int):
+    """(hits, qualified, first hit, first unqualified hit) of operator m."""
+    total = 0
+    qualified = 0
+    lead = None
+    unqualified = None
+    for k in range(len(states[0].markers[m])):
+        end = -1
+        for state in states:
+            for s, e, ok in state.markers[m][k]:
+                if s < end:
+                    continue    # overlaps the previous hit: finditer skips it
+                end = e
+                total += 1
+                if lead is None:
+                    lead = (s, e)
+                if ok:
+                    qualified += 1
+                elif unqualified is None:
+                    unqualified = s
+    return total, qualified, lead or (-1, -1), -1 if unqualified is None else unqualified
+
+
+def merge_chunks(y: str, spans: List[Span], chunks: List[Tuple[int, int]],
+                 states: List[ChunkState]) -> Dict:
+    """evaluate_output(y) from the partial states of consecutive chunks."""
+    totals = [_marker_totals(states, m) for m in range(len(_MARKERS))]
+
+    total, dissolved, (first, _), _ = totals[0]
+    h2 = _h2._verdict(total, dissolved, first)
+    total, scoped, (first, end), _ = totals[1]
+    absolute = _abs._verdict(total, scoped > 0, first, y[first:end])
+    total, backed, (first, _), _ = totals[2]
+    intent = _intent._verdict(total, backed > 0, first)
+    total, grounded, _, unqualified = totals[3]
+    presc = _presc._verdict(total, total - grounded, unqualified)
+    total, qualified, _, unqualified = totals[4]
+    self_ref = _self._verdict(total, total - qualified, unqualified)
+
+    repeats = 0
+    loop_first = -1
+    esc_first = -1
+    for j, state in enumerate(states):
+        if j:
+            # The sentence pair straddling the cut before chunk j
+            prev = states[j - 1]
+            i = chunks[j][0] - 1
+            if _loop._jaccard_sets(prev.last_set, state.first_set) > _loop.LAMBDA:
+                repeats += 1
+                if loop_first < 0:
+                    loop_first = i
+            if esc_first < 0 and _escalates(prev.last_flags, state.first_flags):
+                esc_first = i
+        repeats += state.loop_repeats
+        if loop_first < 0:
+            loop_first = state.loop_first
+        if esc_first < 0:
+            esc_first = state.esc_first
+
+    loop = _loop._verdict(repeats, loop_first)
+    if esc_first < 0:
+        esc = _esc._no_escalation()
+    else:
+        (a1, b1), (a2, b2) = spans[esc_first], spans[esc_first + 1]
+        esc = _esc._escalation(esc_first, y[a1:b1], y[a2:b2])
+
+    # Same order as engine.CONSTRAINTS
+    return _project([h2, absolute, intent, esc, loop, presc, self_ref])
+
+
+def evaluate_chunked(
+    y: str,
+    jobs: Optional[int] = None,
+    chunk_chars: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    mp_context=None,
+) -> Dict:
+    """
+    evaluate_output(y), with y's sentence-aligned chunks evaluated in parallel.
+
+    Args:
+        y: text to evaluate
+        jobs: worker processes (None or <= 0: one per CPU; 1: in-process)
+        chunk_chars: target chunk length (default: two chunks per worker,
+            at least MIN_CHUNK_CHARS)
+        executor: run chunks on this executor instead of a fresh pool
+        mp_context: multiprocessing context for the fresh pool
+
+    Inputs that fit in one chunk are evaluated directly.
+    """
+    jobs = _resolve_jobs(jobs)
+    if chunk_chars is None:
+        chunk_chars = max(MIN_CHUNK_CHARS, -(-len(y) // (2 * jobs)))
+    if chunk_chars < 1:
+        raise ValueError("chunk_chars must be >= 1")
+    if len(y) <= chunk_chars:
+        return evaluate_output(y)
+
+    n = len(y)
+    spans = DocumentContext(y).sentence_spans
+    chunks = plan_chunks(spans, chunk_chars)
+    if len(chunks) == 1:
+        return evaluate_output(y)
+
+    tasks = []
+    for j, (i0, i1) in enumerate(chunks):
+        a = spans[i0][0] if j else 0
+        b = spans[i1][0] if i1 < len(spans) else n
+        lo, hi = _bounds(y, a, b)
+        tasks.append((y[lo:hi], lo, n, a, b, i0, spans[i0:i1]))
+
+    if executor is not None:
+        states = list(executor.map(_evaluate_chunk, tasks))
+    elif jobs == 1:
+        states = [_evaluate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)),
+                                 mp_context=mp_context) as pool:
+            states = list(pool.map(_evaluate_chunk, tasks))
+    return merge_chunks(y, spans, chunks, states)
@@ -0,0 +1,184 @@
+"""
+RC1-Lite Corpus Evaluator
+
+    python -m rc1_lite [INPUT] [--jobs N] [--gate-only] ...
+
+Streams JSONL records ({"id": ..., "text": ...}, as in samples/batch.jsonl)
+from INPUT (default stdin) and writes one JSON result per record to
+stdout, in input order. Memory is bounded by the in-flight window, not
+by corpus size. --gate-only runs evaluate_gate, which stops once the
+gate is decided.
+
+Resuming: with --emit-offsets every output record carries "next_offset",
+the input byte offset just past its record. Restart with
+--offset <next_offset of the last record written> to continue.
+
+Records that cannot be evaluated (bad JSON, missing or non-string text)
+produce {"id": ..., "error": ...} and do not stop the run. They are
+written at once when nothing is in flight ahead of them, and otherwise
+travel through the window as placeholders, so they count against it.
+Throughput (records/s, bytes/s) is reported on stderr at the end.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO
+
+from .batch import DEFAULT_CHUNKSIZE, iter_evaluate
+from .version import VERSION
+
+_SKIP_BLOCK = 1 << 20
+
+
+def _open_input(path: str, offset: int) -> BinaryIO:
+    if path == "-":
+        stream = sys.stdin.buffer
+        remaining = offset
+        while remaining > 0:
+            block = stream.read(min(remaining, _SKIP_BLOCK))
+            if not block:
+                break
+            remaining -= len(block)
+        return stream
+    stream = open(path, "rb")
+    stream.seek(offset)
+    return stream
+
+
+def _records(stream: BinaryIO, offset: int, id_field: str, text_field: str,
+             stats: Dict) -> Iterator[Dict]:
+    """
+    Parse JSONL lazily. Yields {"id", "next_offset", "text"} or
+    {"id", "next_offset", "error"} per non-blank line.
+    """
+    position = offset
+    for line in stream:
+        position += len(line)
+        stats["bytes"] += len(line)
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError as exc:
+            yield {"id": None, "next_offset": position, "error": f"invalid JSON: {exc}"}
+            continue
+        if not isinstance(obj, dict):
+            yield {"id": None, "next_offset": position, "error": "record is not an object"}
+            continue
+        rid = obj.get(id_field)
+        text = obj.get(text_field)
+        if not isinstance(text, str):
+            yield {"id": rid, "next_offset": position,
+                   "error": f"missing or non-string field {text_field!r}"}
+            continue
+        yield {"id": rid, "next_offset": position, "text": text}
+
+
+def run(stream: BinaryIO, out: TextIO, *, offset: int = 0, jobs: int = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE, id_field: str = "id",
+        text_field: str = "text", gate_only: bool = False,
+        emit_offsets: bool = False, mp_context=None) -> Dict:
+    """
+    Evaluate every record of stream, writing JSONL to out.
+
+    mp_context: multiprocessing context for the pool (jobs > 1).
+
+    Returns run statistics: records, errors, bytes, seconds.
+    """
+    stats = {"records": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+    queued = deque()   # records handed to iter_evaluate, awaiting output
+
+    def texts() -> Iterator[Optional[str]]:
+        for record in _records(stream, offset, id_field, text_field, stats):
+            if "text" in record:
+                queued.append(record)
+                yield record["text"]
+            elif not queued:
+                emit(record, None)      # nothing ahead of it: write it now
+            else:
+                queued.append(record)
+                yield None              # placeholder: keeps its place in the window
+
+    def emit(record: Dict, result: Optional[Dict]) -> None:
+        row = {"id": record["id"]}
+        if result is None:
+            row["error"] = record["error"]
+            stats["errors"] += 1
+        elif gate_only:
+            row["gate"] = result["gate"]
+        else:
+            row.update(result)
+        if emit_offsets:
+            row["next_offset"] = record["next_offset"]
+        out.write(json.dumps(row) + "\n")
+        stats["records"] += 1
+
+    started = time.perf_counter()
+    for _, result in iter_evaluate(texts(), jobs=jobs, chunksize=chunksize, ordered=True,
+                                   mp_context=mp_context, gate_only=gate_only):
+        emit(queued.popleft(), result)
+    out.flush()
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def _report(stats: Dict, err: TextIO) -> None:
+    seconds = max(stats["seconds"], 1e-9)
+    err.write(
+        f"rc1_lite {VERSION}: {stats['records']} records "
+        f"({stats['errors']} errors), {stats['bytes']} bytes in {stats['seconds']:.3f}s | "
+        f"{stats['records'] / seconds:.1f} records/s, "
+        f"{stats['bytes'] / seconds:.0f} bytes/s\n"
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m rc1_lite",
+        description=f"Evaluate a JSONL corpus with RC1-Lite ({VERSION}).",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSONL file (default: stdin)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="worker processes (0: one per CPU; default 1)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"records per worker task (default {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--gate-only", action="store_true",
+                        help="write only {id, gate}")
+    parser.add_argument("--offset", type=int, default=0,
+                        help="start at this input byte offset (a line start)")
+    parser.add_argument("--emit-offsets", action="store_true",
+                        help="add next_offset to each output record")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="no throughput report on stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.offset < 0:
+        parser.error("--offset must be >= 0")
+
+    stream = _open_input(args.input, args.offset)
+    try:
+        stats = run(
+            stream, sys.stdout, offset=args.offset, jobs=args.jobs,
+            chunksize=args.chunksize, id_field=args.id_field,
+            text_field=args.text_field, gate_only=args.gate_only,
+            emit_offsets=args.emit_offsets,
+        )
+    except BrokenPipeError:
+        return 1
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+    if not args.quiet:
+        _report(stats, sys.stderr)
+    return 0
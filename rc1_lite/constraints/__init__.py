@@ -1 +1 @@
-"""RC1-Lite constraint operators. Each is a pure function: y -> {type, severity, location, metadata}."""
+"""RC1-Lite constraint operators. Each is a pure function: (y, ctx=None) -> {type, severity, location, metadata}."""
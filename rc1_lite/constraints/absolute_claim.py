@@ -11,7 +11,9 @@ Q(y) detected via lexical scoping qualifiers within 10-token window.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Absolute quantifiers
 _ABSOLUTE_PATS = [
@@ -43,40 +45,52 @@ _SCOPING_PATS = [
 
 WINDOW_TOKENS = 10
 
+# Families for the fused scanner
+SCAN_FAMILIES = {"ABS": _ABSOLUTE_PATS, "ABS_SCOPE": _SCOPING_PATS}
+
+
+def _verdict(absolutes: int, scoped: bool, first: int, sample: str) -> Dict:
+    """Result for `absolutes` hits; first/sample describe the first hit."""
+    if absolutes == 0:
+        return {"type": "ABS", "severity": 0, "location": -1, "metadata": {}}
+    if scoped:
+        return {"type": "ABS", "severity": 0, "location": -1,
+                "metadata": {"absolutes": absolutes, "scoped": True}}
+    else:
+        return {"type": "ABS", "severity": 2, "location": first,
+                "metadata": {"absolutes": absolutes, "scoped": False,
+                             "sample": sample}}
+
 
-def absolute_claim(y: str) -> Dict:
+def absolute_claim(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_abs: Absolute Claim Without Scope detection.
 
+    ctx: shared DocumentContext of y; built here if None.
+
     Returns: {type, severity, location, metadata}
     """
+    if ctx is None:
+        ctx = DocumentContext(y)
+
     # Find absolute quantifiers
-    abs_hits = []
-    for pat in _ABSOLUTE_PATS:
-        for match in pat.finditer(y):
-            abs_hits.append((match.start(), match.group()))
+    spans = ctx.hits("ABS", _ABSOLUTE_PATS)
+    abs_hits = [(s, y[s:e]) for s, e in spans]
 
     if not abs_hits:
-        return {"type": "ABS", "severity": 0, "location": -1, "metadata": {}}
+        return _verdict(0, False, -1, "")
 
     # Check for scoping qualifiers within window
-    tokens = y.split()
     has_scope = False
+    scoped_in = ctx.window_test("ABS_SCOPE", _SCOPING_PATS)
 
     for hit_pos, hit_text in abs_hits:
         # Check within 10-token window around the absolute claim
         char_start = max(0, hit_pos - WINDOW_TOKENS * 7)
         char_end = min(len(y), hit_pos + WINDOW_TOKENS * 7)
-        window_text = y[char_start:char_end]
 
-        if any(p.search(window_text) for p in _SCOPING_PATS):
+        if scoped_in(char_start, char_end):
             has_scope = True
             break
 
-    if has_scope:
-        return {"type": "ABS", "severity": 0, "location": -1,
-                "metadata": {"absolutes": len(abs_hits), "scoped": True}}
-    else:
-        return {"type": "ABS", "severity": 2, "location": abs_hits[0][0],
-                "metadata": {"absolutes": len(abs_hits), "scoped": False,
-                             "sample": abs_hits[0][1]}}
+    return _verdict(len(abs_hits), has_scope, abs_hits[0][0], abs_hits[0][1])
@@ -16,7 +16,9 @@ Bridge detection: presence of reasoning tokens between T and H.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Technical domain lexicon
 _TECH_PATS = [
@@ -47,20 +49,44 @@ _BRIDGE_PATS = [
     re.compile(r'\b(?:for\s+example|such\s+as|i\.e\.)\b', re.I),
 ]
 
-# Sentence splitter
-_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# Families for the fused scanner. No marker can match across a sentence
+# split (context.SENT_SPLIT: [.!?] + whitespace), so a raw match starting
+# inside a sentence is exactly a search() hit on that sentence.
+SCAN_FAMILIES = {
+    "ESC_TECH": _TECH_PATS,
+    "ESC_ABSTRACT": _ABSTRACT_PATS,
+    "ESC_BRIDGE": _BRIDGE_PATS,
+}
+
+
+def _no_escalation() -> Dict:
+    return {"type": "ESC", "severity": 0, "location": -1, "metadata": {}}
+
+
+def _escalation(i: int, s1: str, s2: str) -> Dict:
+    return {"type": "ESC", "severity": 2, "location": i,
+            "metadata": {"from": s1[:60], "to": s2[:60],
+                         "reason": "T->H without bridge"}}
 
 
-def abstraction_escalation(y: str) -> Dict:
+def abstraction_escalation(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_esc: Abstraction Escalation detection.
 
+    ctx: shared DocumentContext of y; built here if None. Sentences are
+    searched pattern by pattern unless ctx carries a fused scan.
+
     Returns: {type, severity, location, metadata}
     """
-    sentences = _SENT_SPLIT.split(y)
+    if ctx is None:
+        ctx = DocumentContext(y)
+    if ctx.scan is not None:
+        return _abstraction_escalation_scanned(y, ctx)
+
+    sentences = ctx.sentences
 
     if len(sentences) < 2:
-        return {"type": "ESC", "severity": 0, "location": -1, "metadata": {}}
+        return _no_escalation()
 
     # Check adjacent sentences for domain shift
     for i in range(len(sentences) - 1):
@@ -76,8 +102,29 @@ def abstraction_escalation(y: str) -> Dict:
             has_bridge = any(p.search(combined) for p in _BRIDGE_PATS)
 
             if not has_bridge:
-                return {"type": "ESC", "severity": 2, "location": i,
-                        "metadata": {"from": s1[:60], "to": s2[:60],
-                                     "reason": "T->H without bridge"}}
+                return _escalation(i, s1, s2)
 
-    return {"type": "ESC", "severity": 0, "location": -1, "metadata": {}}
+    return _no_escalation()
+
+
+def _abstraction_escalation_scanned(y: str, ctx: DocumentContext) -> Dict:
+    """Same decision as above, reading sentence hits from the fused scan."""
+    scan = ctx.scan
+    spans = ctx.sentence_spans
+
+    if len(spans) < 2:
+        return _no_escalation()
+
+    for i in range(len(spans) - 1):
+        a1, b1 = spans[i]
+        a2, b2 = spans[i + 1]
+
+        if (scan.any_start("ESC_TECH", a1, b1)
+                and scan.any_start("ESC_ABSTRACT", a2, b2)):
+            # Bridge in s1 + " " + s2; no bridge marker spans the join
+            has_bridge = (scan.any_start("ESC_BRIDGE", a1, b1)
+                          or scan.any_start("ESC_BRIDGE", a2, b2))
+            if not has_bridge:
+                return _escalation(i, y[a1:b1], y[a2:b2])
+
+    return _no_escalation()
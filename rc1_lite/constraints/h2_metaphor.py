@@ -13,7 +13,9 @@ Dissolution requires explicit literal rephrasing.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Metaphor markers (lexical detection)
 _METAPHOR_PATS = [
@@ -47,6 +49,9 @@ _DISSOLUTION_PATS = [
 
 WINDOW_TOKENS = 20
 
+# Families for the fused scanner
+SCAN_FAMILIES = {"H2": _METAPHOR_PATS, "H2_DISSOLVE": _DISSOLUTION_PATS}
+
 
 def _get_window(tokens: list, pos: int, window: int) -> str:
     """Get tokens within window around position."""
@@ -55,49 +60,53 @@ def _get_window(tokens: list, pos: int, window: int) -> str:
     return " ".join(tokens[start:end])
 
 
-def h2_metaphor(y: str) -> Dict:
+def _verdict(total: int, dissolved: int, first: int) -> Dict:
+    """Result for `total` metaphor hits, `dissolved` of them dissolved."""
+    if total == 0:
+        return {"type": "H2", "severity": 0, "location": -1, "metadata": {}}
+    if dissolved >= total:
+        # All dissolved
+        return {"type": "H2", "severity": 0, "location": -1,
+                "metadata": {"metaphors": total, "dissolved": dissolved}}
+    elif dissolved > 0:
+        # Partial dissolution
+        return {"type": "H2", "severity": 1, "location": first,
+                "metadata": {"metaphors": total, "dissolved": dissolved,
+                             "reason": "partial dissolution"}}
+    else:
+        # No dissolution at all
+        return {"type": "H2", "severity": 2, "location": first,
+                "metadata": {"metaphors": total, "dissolved": 0,
+                             "reason": "undissolved"}}
+
+
+def h2_metaphor(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_H2: Undissolved Metaphor detection.
 
+    ctx: shared DocumentContext of y; built here if None.
+
     Returns: {type, severity, location, metadata}
     """
-    tokens = y.split()
-    text_lower = y.lower()
+    if ctx is None:
+        ctx = DocumentContext(y)
 
     # Check for any metaphor markers
-    metaphor_hits = []
-    for pat in _METAPHOR_PATS:
-        for match in pat.finditer(y):
-            metaphor_hits.append(match.start())
+    spans = ctx.hits("H2", _METAPHOR_PATS)
+    metaphor_hits = [s for s, _ in spans]
 
     if not metaphor_hits:
-        return {"type": "H2", "severity": 0, "location": -1, "metadata": {}}
+        return _verdict(0, 0, -1)
 
     # Check dissolution within window for each hit
     dissolved_count = 0
+    dissolved_in = ctx.window_test("H2_DISSOLVE", _DISSOLUTION_PATS)
     for hit_pos in metaphor_hits:
         # Build window around hit (character-based, convert to token window)
         char_start = max(0, hit_pos - WINDOW_TOKENS * 6)
         char_end = min(len(y), hit_pos + WINDOW_TOKENS * 6)
-        window_text = y[char_start:char_end]
 
-        has_dissolution = any(p.search(window_text) for p in _DISSOLUTION_PATS)
-        if has_dissolution:
+        if dissolved_in(char_start, char_end):
             dissolved_count += 1
 
-    total = len(metaphor_hits)
-
-    if dissolved_count >= total:
-        # All dissolved
-        return {"type": "H2", "severity": 0, "location": -1,
-                "metadata": {"metaphors": total, "dissolved": dissolved_count}}
-    elif dissolved_count > 0:
-        # Partial dissolution
-        return {"type": "H2", "severity": 1, "location": metaphor_hits[0],
-                "metadata": {"metaphors": total, "dissolved": dissolved_count,
-                             "reason": "partial dissolution"}}
-    else:
-        # No dissolution at all
-        return {"type": "H2", "severity": 2, "location": metaphor_hits[0],
-                "metadata": {"metaphors": total, "dissolved": 0,
-                             "reason": "undissolved"}}
+    return _verdict(len(metaphor_hits), dissolved_count, metaphor_hits[0])
@@ -11,7 +11,9 @@ Detection lexical within 15-token window.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Intent verbs
 _INTENT_PATS = [
@@ -39,37 +41,50 @@ _MECHANISM_PATS = [
 
 WINDOW_TOKENS = 15
 
+# Families for the fused scanner
+SCAN_FAMILIES = {"INTENT": _INTENT_PATS, "INTENT_MECH": _MECHANISM_PATS}
+
+
+def _verdict(intents: int, backed: bool, first: int) -> Dict:
+    """Result for `intents` hits, backed if any window has a mechanism."""
+    if intents == 0:
+        return {"type": "INTENT", "severity": 0, "location": -1, "metadata": {}}
+    if backed:
+        return {"type": "INTENT", "severity": 0, "location": -1,
+                "metadata": {"intents": intents, "backed": True}}
+    else:
+        return {"type": "INTENT", "severity": 2, "location": first,
+                "metadata": {"intents": intents, "backed": False}}
+
 
-def intent_execution(y: str) -> Dict:
+def intent_execution(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_intent: Intent Without Mechanism detection.
 
+    ctx: shared DocumentContext of y; built here if None.
+
     Returns: {type, severity, location, metadata}
     """
+    if ctx is None:
+        ctx = DocumentContext(y)
+
     # Find intent markers
-    intent_hits = []
-    for pat in _INTENT_PATS:
-        for match in pat.finditer(y):
-            intent_hits.append(match.start())
+    spans = ctx.hits("INTENT", _INTENT_PATS)
+    intent_hits = [s for s, _ in spans]
 
     if not intent_hits:
-        return {"type": "INTENT", "severity": 0, "location": -1, "metadata": {}}
+        return _verdict(0, False, -1)
 
     # Check for mechanism indicators within 15-token window
     has_mechanism = False
+    mechanism_in = ctx.window_test("INTENT_MECH", _MECHANISM_PATS)
 
     for hit_pos in intent_hits:
         char_start = max(0, hit_pos - WINDOW_TOKENS * 7)
         char_end = min(len(y), hit_pos + WINDOW_TOKENS * 7)
-        window_text = y[char_start:char_end]
 
-        if any(p.search(window_text) for p in _MECHANISM_PATS):
+        if mechanism_in(char_start, char_end):
             has_mechanism = True
             break
 
-    if has_mechanism:
-        return {"type": "INTENT", "severity": 0, "location": -1,
-                "metadata": {"intents": len(intent_hits), "backed": True}}
-    else:
-        return {"type": "INTENT", "severity": 2, "location": intent_hits[0],
-                "metadata": {"intents": len(intent_hits), "backed": False}}
+    return _verdict(len(intent_hits), has_mechanism, intent_hits[0])
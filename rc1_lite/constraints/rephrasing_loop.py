@@ -10,11 +10,11 @@ Let sim(y_i, y_{i+1}) = Jaccard similarity over token sets between adjacent segm
 Segments defined as sentences.
 """
 
-import re
 import string
-from typing import Dict
+from typing import Dict, FrozenSet, Optional
+
+from ..context import DocumentContext
 
-_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
 LAMBDA = 0.7  # Jaccard threshold
 
 
@@ -24,7 +24,11 @@ def _strip_punct(token: str) -> str:
 
 
 def _jaccard(a: str, b: str) -> float:
-    """Jaccard similarity over token sets (punctuation stripped)."""
+    """
+    Jaccard similarity over token sets (punctuation stripped).
+
+    String reference for _jaccard_sets; the tests hold the two equal.
+    """
     set_a = {_strip_punct(t) for t in a.lower().split() if _strip_punct(t)}
     set_b = {_strip_punct(t) for t in b.lower().split() if _strip_punct(t)}
     if not set_a or not set_b:
@@ -34,32 +38,49 @@ def _jaccard(a: str, b: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def rephrasing_loop(y: str) -> Dict:
+def _jaccard_sets(set_a: FrozenSet[str], set_b: FrozenSet[str]) -> float:
+    """Jaccard similarity over precomputed token sets (DocumentContext.sentence_sets)."""
+    if not set_a or not set_b:
+        return 0.0
+    return len(set_a & set_b) / len(set_a | set_b)
+
+
+def _verdict(repeats: int, first: int) -> Dict:
+    """Result for `repeats` similar adjacent pairs, the first at index first."""
+    if repeats == 0:
+        return {"type": "LOOP", "severity": 0, "location": -1, "metadata": {}}
+    elif repeats == 1:
+        return {"type": "LOOP", "severity": 1, "location": first,
+                "metadata": {"repeats": repeats, "reason": "minor rephrasing"}}
+    else:
+        return {"type": "LOOP", "severity": 2, "location": first,
+                "metadata": {"repeats": repeats, "reason": "severe rephrasing loop"}}
+
+
+def rephrasing_loop(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_loop: Rephrasing Loop detection.
 
+    ctx: shared DocumentContext of y; built here if None. Each sentence's
+    token set is built once, not once per neighbouring pair.
+
     Returns: {type, severity, location, metadata}
     """
-    sentences = _SENT_SPLIT.split(y)
+    if ctx is None:
+        ctx = DocumentContext(y)
+    sets = ctx.sentence_sets
 
-    if len(sentences) < 2:
-        return {"type": "LOOP", "severity": 0, "location": -1, "metadata": {}}
+    if len(sets) < 2:
+        return _verdict(0, -1)
 
     repeats = 0
     first_hit = -1
 
-    for i in range(len(sentences) - 1):
-        sim = _jaccard(sentences[i], sentences[i + 1])
+    for i in range(len(sets) - 1):
+        sim = _jaccard_sets(sets[i], sets[i + 1])
         if sim > LAMBDA:
             repeats += 1
             if first_hit < 0:
                 first_hit = i
 
-    if repeats == 0:
-        return {"type": "LOOP", "severity": 0, "location": -1, "metadata": {}}
-    elif repeats == 1:
-        return {"type": "LOOP", "severity": 1, "location": first_hit,
-                "metadata": {"repeats": repeats, "reason": "minor rephrasing"}}
-    else:
-        return {"type": "LOOP", "severity": 2, "location": first_hit,
-                "metadata": {"repeats": repeats, "reason": "severe rephrasing loop"}}
+    return _verdict(repeats, first_hit)
@@ -5,7 +5,9 @@ Detect self-references (e.g., 'I can', 'system guarantees') without qualificatio
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Self-referential markers
 _SELF_PATS = [
@@ -26,45 +28,64 @@ _QUAL_PATS = [
     re.compile(r'\b(?:as\s+(?:designed|implemented|specified))\b', re.I),
 ]
 
+# Families for the fused scanner
+SCAN_FAMILIES = {"SELF": _SELF_PATS, "SELF_QUAL": _QUAL_PATS}
+
+
+def _verdict(self_refs: int, unqualified: int, first: int) -> Dict:
+    """Result for `self_refs` hits; first is the first unqualified one."""
+    if self_refs == 0:
+        return {"type": "SELF", "severity": 0, "location": -1, "metadata": {}}
+    if unqualified == 0:
+        return {"type": "SELF", "severity": 0, "location": -1,
+                "metadata": {"self_refs": self_refs, "qualified": True}}
+    elif unqualified == 1:
+        return {"type": "SELF", "severity": 1, "location": first,
+                "metadata": {"self_refs": self_refs, "unqualified": unqualified}}
+    else:
+        return {"type": "SELF", "severity": 2, "location": first,
+                "metadata": {"self_refs": self_refs, "unqualified": unqualified}}
+
 
-def self_reference(y: str) -> Dict:
+def self_reference(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_self: Self-Referential Capability Claim detection.
 
+    ctx: shared DocumentContext of y; built here if None.
+
     Returns: {type, severity, location, metadata}
     """
-    self_hits = []
-    for pat in _SELF_PATS:
-        for match in pat.finditer(y):
-            self_hits.append((match.start(), match.group()))
+    if ctx is None:
+        ctx = DocumentContext(y)
+
+    spans = ctx.hits("SELF", _SELF_PATS)
+    self_hits = [(s, y[s:e]) for s, e in spans]
 
     if not self_hits:
-        return {"type": "SELF", "severity": 0, "location": -1, "metadata": {}}
+        return _verdict(0, 0, -1)
 
     # Check for qualification
     unqualified = 0
     first_hit = -1
+    qualified_in = ctx.window_test("SELF_QUAL", _QUAL_PATS)
+
+    # Hits in one sentence share its window: find and test it once
+    sent_start = sent_end = 0
+    qualified = False
 
     for hit_pos, hit_text in self_hits:
         # Check sentence containing the self-reference
-        # Find sentence boundaries
-        sent_start = y.rfind(".", 0, hit_pos)
-        sent_start = sent_start + 1 if sent_start >= 0 else 0
-        sent_end = y.find(".", hit_pos)
-        sent_end = sent_end + 1 if sent_end >= 0 else len(y)
-        sentence = y[sent_start:sent_end]
-
-        if not any(p.search(sentence) for p in _QUAL_PATS):
+        if not sent_start <= hit_pos < sent_end:
+            # Find sentence boundaries
+            sent_start = y.rfind(".", 0, hit_pos)
+            sent_start = sent_start + 1 if sent_start >= 0 else 0
+            sent_end = y.find(".", hit_pos)
+            sent_end = sent_end + 1 if sent_end >= 0 else len(y)
+            qualified = qualified_in(sent_start, sent_end)
+
+        if not qualified:
             unqualified += 1
             if first_hit < 0:
                 first_hit = hit_pos
 
-    if unqualified == 0:
-        return {"type": "SELF", "severity": 0, "location": -1,
-                "metadata": {"self_refs": len(self_hits), "qualified": True}}
-    elif unqualified == 1:
-        return {"type": "SELF", "severity": 1, "location": first_hit,
-                "metadata": {"self_refs": len(self_hits), "unqualified": unqualified}}
-    else:
-        return {"type": "SELF", "severity": 2, "location": first_hit,
-                "metadata": {"self_refs": len(self_hits), "unqualified": unqualified}}
+    return _verdict(len(self_hits), unqualified, first_hit)
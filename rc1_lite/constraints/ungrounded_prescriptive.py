@@ -6,7 +6,9 @@ Detect prescriptive markers (e.g., 'must', 'should') without grounding
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..context import DocumentContext
 
 # Prescriptive markers
 _PRESCRIPTIVE_PATS = [
@@ -29,41 +31,54 @@ _GROUNDING_PATS = [
 
 WINDOW_TOKENS = 10
 
+# Families for the fused scanner
+SCAN_FAMILIES = {"PRESC": _PRESCRIPTIVE_PATS, "PRESC_GROUND": _GROUNDING_PATS}
+
+
+def _verdict(prescriptives: int, ungrounded: int, first: int) -> Dict:
+    """Result for `prescriptives` hits; first is the first ungrounded one."""
+    if prescriptives == 0:
+        return {"type": "PRESC", "severity": 0, "location": -1, "metadata": {}}
+    if ungrounded == 0:
+        return {"type": "PRESC", "severity": 0, "location": -1,
+                "metadata": {"prescriptives": prescriptives, "grounded": True}}
+    elif ungrounded == 1:
+        return {"type": "PRESC", "severity": 1, "location": first,
+                "metadata": {"prescriptives": prescriptives, "ungrounded": ungrounded}}
+    else:
+        return {"type": "PRESC", "severity": 2, "location": first,
+                "metadata": {"prescriptives": prescriptives, "ungrounded": ungrounded}}
+
 
-def ungrounded_prescriptive(y: str) -> Dict:
+def ungrounded_prescriptive(y: str, ctx: Optional[DocumentContext] = None) -> Dict:
     """
     C_presc: Ungrounded Prescriptive Claim detection.
 
+    ctx: shared DocumentContext of y; built here if None.
+
     Returns: {type, severity, location, metadata}
     """
-    presc_hits = []
-    for pat in _PRESCRIPTIVE_PATS:
-        for match in pat.finditer(y):
-            presc_hits.append((match.start(), match.group()))
+    if ctx is None:
+        ctx = DocumentContext(y)
+
+    spans = ctx.hits("PRESC", _PRESCRIPTIVE_PATS)
+    presc_hits = [(s, y[s:e]) for s, e in spans]
 
     if not presc_hits:
-        return {"type": "PRESC", "severity": 0, "location": -1, "metadata": {}}
+        return _verdict(0, 0, -1)
 
     # Check grounding within 10-token window
     ungrounded = 0
     first_hit = -1
+    grounded_in = ctx.window_test("PRESC_GROUND", _GROUNDING_PATS)
 
     for hit_pos, hit_text in presc_hits:
         char_start = max(0, hit_pos - WINDOW_TOKENS * 7)
         char_end = min(len(y), hit_pos + WINDOW_TOKENS * 7)
-        window_text = y[char_start:char_end]
 
-        if not any(p.search(window_text) for p in _GROUNDING_PATS):
+        if not grounded_in(char_start, char_end):
             ungrounded += 1
             if first_hit < 0:
                 first_hit = hit_pos
 
-    if ungrounded == 0:
-        return {"type": "PRESC", "severity": 0, "location": -1,
-                "metadata": {"prescriptives": len(presc_hits), "grounded": True}}
-    elif ungrounded == 1:
-        return {"type": "PRESC", "severity": 1, "location": first_hit,
-                "metadata": {"prescriptives": len(presc_hits), "ungrounded": ungrounded}}
-    else:
-        return {"type": "PRESC", "severity": 2, "location": first_hit,
-                "metadata": {"prescriptives": len(presc_hits), "ungrounded": ungrounded}}
+    return _verdict(len(presc_hits), ungrounded, first_hit)
@@ -0,0 +1,110 @@
+"""
+RC1-Lite Document Context
+
+Per-input state shared by every operator, built once per evaluation:
+
+    sentence_spans   (start, end) of each _SENT_SPLIT segment
+    sentences        the segments themselves (== SENT_SPLIT.split(y))
+    sentence_tokens  lowercased whitespace tokens per sentence
+    sentence_sets    punctuation-stripped token set per sentence
+
+Everything is computed lazily on first access and cached, so an operator
+that never asks for sentences costs nothing. The optional fused scan
+(rc1_lite.scanner) rides along; without it, hits and window tests fall
+back to the per-pattern reference searches. slice_windows=True answers
+window tests by searching the slice even when a scan is attached, which
+is cheaper when only a few windows will be asked about.
+"""
+
+import re
+import string
+from typing import Callable, FrozenSet, List, Optional, Pattern, Sequence, Tuple, Union
+
+from .scanner import Scan, StagedScan, finditer_spans
+from .window import slice_search
+
+Span = Tuple[int, int]
+
+# Sentence splitter shared by LOOP and ESC
+SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+_PUNCT = string.punctuation
+
+
+def token_set(sentence: str) -> FrozenSet[str]:
+    """Lowercased, punctuation-stripped token set of one sentence."""
+    stripped = {t.strip(_PUNCT) for t in sentence.lower().split()}
+    stripped.discard("")
+    return frozenset(stripped)
+
+
+class DocumentContext:
+    """Shared, lazily-built view of one input text."""
+
+    __slots__ = ("text", "scan", "slice_windows", "_sentence_spans", "_sentences",
+                 "_sentence_tokens", "_sentence_sets")
+
+    def __init__(self, text: str, scan: Optional[Union[Scan, StagedScan]] = None,
+                 slice_windows: bool = False):
+        self.text = text
+        self.scan = scan
+        self.slice_windows = slice_windows
+        self._sentence_spans = None
+        self._sentences = None
+        self._sentence_tokens = None
+        self._sentence_sets = None
+
+    @property
+    def sentence_spans(self) -> List[Span]:
+        spans = self._sentence_spans
+        if spans is None:
+            spans = []
+            start = 0
+            for m in SENT_SPLIT.finditer(self.text):
+                spans.append((start, m.start()))
+                start = m.end()
+            spans.append((start, len(self.text)))
+            self._sentence_spans = spans
+        return spans
+
+    @property
+    def sentences(self) -> List[str]:
+        sentences = self._sentences
+        if sentences is None:
+            y = self.text
+            sentences = [y[a:b] for a, b in self.sentence_spans]
+            self._sentences = sentences
+        return sentences
+
+    @property
+    def sentence_tokens(self) -> List[List[str]]:
+        tokens = self._sentence_tokens
+        if tokens is None:
+            tokens = [s.lower().split() for s in self.sentences]
+            self._sentence_tokens = tokens
+        return tokens
+
+    @property
+    def sentence_sets(self) -> List[FrozenSet[str]]:
+        sets = self._sentence_sets
+        if sets is None:
+            sets = []
+            for tokens in self.sentence_tokens:
+                stripped = {t.strip(_PUNCT) for t in tokens}
+                stripped.discard("")
+                sets.append(frozenset(stripped))
+            self._sentence_sets = sets
+        return sets
+
+    def hits(self, tag: str, patterns: Sequence[Pattern]) -> List[Span]:
+        """finditer spans of a marker family, pattern-major."""
+        if self.scan is not None:
+            return self.scan.hits(tag)
+        return finditer_spans(patterns, self.text)
+
+    def window_test(self, tag: str,
+                    patterns: Sequence[Pattern]) -> Callable[[int, int], bool]:
+        """(cs, ce) -> any(p.search(y[cs:ce]) for p in family)."""
+        if self.scan is not None and not self.slice_windows:
+            return self.scan.window(tag).has
+        return slice_search(patterns, self.text)
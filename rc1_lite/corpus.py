@@ -0,0 +1,223 @@
+"""
+RC1-Lite Synthetic Corpus
+
+Seeded generators of evaluation inputs for benchmarks and load tests:
+
+    fp_study_corpus(n=200, seed=0)     docs/fp_study.md: clean technical
+                                       paragraphs of 40-120 tokens; 16% of
+                                       them carry exactly one severity-1
+                                       activation (V = 1), the rest V = 0
+    class_document(cls, rng)           one paragraph in the style of a
+                                       samples/batch.jsonl class (CLASSES)
+    document(length, density, rng)     exactly `length` characters of
+                                       technical prose; each sentence is a
+                                       violation sentence with probability
+                                       `density`
+
+Sentences come from fixed template pools; the same seed gives the same
+corpus on every platform. ABS can only score 0 or 2 under this engine,
+so the study's twelve severity-1 "ABS" documents are generated as
+single ungrounded prescriptives, which keeps its V distribution
+(32 documents at V = 1, mean V 0.16).
+"""
+
+import random
+from typing import Dict, List
+
+# samples/batch.jsonl classes
+CLASSES = (
+    "clean_tech", "metaphor_heavy", "epistemic_fail", "loop_spiral",
+    "all_intent", "mixed_good", "dissolved_metaphor", "grounded_absolute",
+)
+
+# fp_study.md: documents with V = 1 out of 200
+FP_STUDY_SIZE = 200
+FP_STUDY_ACTIVE = 32
+
+_IDENT = ("compute_hash", "parse_header", "isclose", "gcd", "reshape", "encode",
+          "read_chunk", "checksum", "fsum", "split_frame")
+_TYPE = ("float", "integer", "tuple", "byte string", "list of offsets")
+
+# Clean technical prose (RFC 793 / RFC 2616 / Python math / NumPy /
+# Euclid), V = 0 in any order and combination
+_CLEAN = (
+    "The function {ident}(x) returns a {type} computed from x.",
+    "Each segment carries a {n}-bit sequence number in its header.",
+    "The receiver acknowledges data by sending the next expected sequence number.",
+    "ndarray.reshape returns a view with the requested shape when the strides allow it.",
+    "The gcd of a and b equals the gcd of b and the remainder of a divided by b.",
+    "A {status} response indicates that the request was fulfilled.",
+    "The buffer holds up to {n} bytes before the sender blocks.",
+    "Status code {status} is described in section {n} of RFC 2616.",
+    "math.isclose compares two floats using a relative tolerance of 1e-09.",
+    "The checksum covers the pseudo header, the TCP header and the payload.",
+    "The window field gives the number of octets the receiver is willing to accept.",
+    "Integer division in Python rounds toward negative infinity.",
+    "The Euclidean algorithm terminates because the remainder decreases at each step.",
+    "The dtype attribute describes the layout of each element in memory.",
+    "A connection enters TIME-WAIT after the final acknowledgment is sent.",
+    "The header ends with an empty line, followed by the message body.",
+    "math.sqrt raises ValueError for negative inputs.",
+    "Chunked transfer coding sends the body as a series of sized chunks.",
+    "The urgent pointer is interpreted only when the URG control bit is set.",
+    "Broadcasting stretches dimensions of length one to match the other operand.",
+    "A proxy forwards the request line and the headers to the origin server.",
+    "{ident} accepts an optional start offset and an optional length.",
+)
+
+# Exactly one ungrounded prescriptive (PRESC severity 1) in a clean context
+_PRESC_ONE = (
+    "The sender should retransmit the segment.",
+    "Callers should close the stream afterwards.",
+    "Clients ought to reuse the connection.",
+)
+
+# One sentence per samples/batch.jsonl class style
+_CLASS_SENTENCES: Dict[str, tuple] = {
+    "clean_tech": _CLEAN,
+    "metaphor_heavy": (
+        "The soul of the machine breathes fire into the dancing void.",
+        "The ghost inhabits the architecture, weaving through the cosmic fabric.",
+        "The seed blooms into infinite consciousness.",
+        "Data is the blood that flows through the veins of the network.",
+        "The kernel is the heart of the system, forged in silence.",
+    ),
+    "epistemic_fail": (
+        "This obviously proves the hypothesis is correct.",
+        "The system always works perfectly and never fails.",
+        "It is clearly the best approach that has been proven beyond doubt.",
+        "Every engineer must accept that this design is certainly optimal.",
+    ),
+    "loop_spiral": (
+        "The real question is what this really means.",
+        "What this really means is a higher-order recursive pattern.",
+        "In other words, to rephrase, this is what it really means.",
+        "The real question is what this really means at a deeper level.",
+        "As I said before, the deeper truth is that we must transcend.",
+    ),
+    "all_intent": (
+        "We should build a framework for processing data.",
+        "The plan is to create a pipeline architecture.",
+        "The vision is to transcend current limitations.",
+        "We will create a revolutionary system.",
+        "The goal is to automate the whole workflow.",
+    ),
+    "mixed_good": (
+        "The module implements SHA3-256 hashing via {ident}.py.",
+        "If the input is under 64 bytes, it uses a single-pass digest.",
+        "Otherwise, it chunks the stream at 4096-byte boundaries and returns a Merkle root.",
+        "Tests show approximately 8ms per 1MB on commodity hardware.",
+        "The digest is cached because section {n} of the spec requires it.",
+    ),
+    "dissolved_metaphor": (
+        "The scheduler is the heart of the runtime, meaning the loop that dispatches ready tasks.",
+        "The ghost process, literally a detached daemon, holds the lock.",
+        "The token bucket breathes, which means it refills at 100 tokens per second.",
+    ),
+    "grounded_absolute": (
+        "This function always returns 32 bytes because the SHA3-256 spec requires it.",
+        "Under normal conditions the queue never drops a message.",
+        "All responses in this version include a Date header per section 14.18.",
+    ),
+}
+
+# Violation sentences for density mixes: the non-clean classes
+_VIOLATIONS = tuple(
+    s for cls in ("metaphor_heavy", "epistemic_fail", "loop_spiral", "all_intent")
+    for s in _CLASS_SENTENCES[cls]
+)
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(
+        ident=rng.choice(_IDENT),
+        type=rng.choice(_TYPE),
+        n=rng.choice((8, 16, 32, 64, 128, 512, 4096)),
+        status=rng.choice((200, 201, 204, 206)),
+    )
+
+
+def _sentences(pool, rng: random.Random):
+    """
+    Endless filled sentences from pool, dealt from reshuffled decks.
+
+    A template recurs only after the whole pool, so near-identical
+    neighbours (LOOP) cannot arise by chance, even where a lowercase
+    sentence start merges two templates into one sentence.
+    """
+    deck = list(pool)
+    previous = None
+    while True:
+        rng.shuffle(deck)
+        if deck[0] is previous and len(deck) > 1:
+            deck.append(deck.pop(0))
+        for template in deck:
+            yield _fill(template, rng)
+        previous = deck[-1]
+
+
+def _paragraph(pool, low: int, high: int, rng: random.Random) -> List[str]:
+    """Sentences from pool totalling between low and high whitespace tokens."""
+    target = rng.randint(low, high)
+    sentences = []
+    count = 0
+    for sentence in _sentences(pool, rng):
+        size = len(sentence.split())
+        if count >= low and count + size > target:
+            break
+        sentences.append(sentence)
+        count += size
+    return sentences
+
+
+def class_document(cls: str, rng: random.Random) -> str:
+    """One 3-5 sentence paragraph in the style of a batch.jsonl class."""
+    if cls not in _CLASS_SENTENCES:
+        raise ValueError(f"unknown class {cls!r}; expected one of {CLASSES}")
+    sentences = _sentences(_CLASS_SENTENCES[cls], rng)
+    return " ".join(next(sentences) for _ in range(rng.randint(3, 5)))
+
+
+def fp_study_corpus(n: int = FP_STUDY_SIZE, seed: int = 0) -> List[str]:
+    """
+    n clean technical documents distributed as in docs/fp_study.md.
+
+    round(n * 32 / 200) of them contain one ungrounded prescriptive
+    (V = 1), at seeded positions; the others are V = 0.
+    """
+    rng = random.Random(f"rc1-fp-study:{seed}")
+    active = set(rng.sample(range(n), round(n * FP_STUDY_ACTIVE / FP_STUDY_SIZE)))
+    docs = []
+    for i in range(n):
+        if i in active:
+            # First, and followed by a sentence with no grounding marker
+            # within the 70-char window
+            follow = rng.choice(_CLEAN[2:4])
+            head = [rng.choice(_PRESC_ONE), follow]
+            size = sum(len(s.split()) for s in head)
+            rest = tuple(t for t in _CLEAN if t is not follow)
+            sentences = head + _paragraph(rest, 40 - size, 120 - size, rng)
+        else:
+            sentences = _paragraph(_CLEAN, 40, 120, rng)
+        docs.append(" ".join(sentences))
+    return docs
+
+
+def document(length: int, density: float = 0.0, rng: random.Random = None) -> str:
+    """
+    Exactly `length` characters of technical prose.
+
+    Each sentence is drawn from the violation pool with probability
+    density, else from the clean pool. The text is cut at `length`, so
+    the last sentence may be partial.
+    """
+    rng = rng or random.Random(0)
+    clean = _sentences(_CLEAN, rng)
+    violations = _sentences(_VIOLATIONS, rng)
+    parts = []
+    size = -1
+    while size < length:
+        sentence = next(violations if rng.random() < density else clean)
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)[:length]
@@ -0,0 +1,137 @@
+"""
+RC1-Lite Deadline-Bounded Evaluation
+
+For gateways that must answer within a latency budget whatever the input:
+
+    result = evaluate_output(y, deadline_ms=50)
+    if result.get("partial"):
+        result["gate"]        # "PASS" / "WARN" / "FAIL" if already decided, else None
+        result["V_lower"]     # V >= V_lower, always
+    else:
+        ...                   # == evaluate_output(y), exactly
+
+y is fed to an IncrementalEvaluator in steps, with the clock checked
+before each one. Steps start at DEADLINE_STEP characters and double
+while the doubled step, at the rate measured so far, fits in half the
+time left, so with a generous budget a long text goes in a few large
+feeds and costs about what evaluate_output(y) does. If the budget runs out first, the result is built from
+the evaluator's settled state (IncrementalEvaluator.bounds), which holds
+for every continuation of the prefix fed, y included:
+
+    {"partial": True, "gate", "V_lower", "V_upper", "V_max",
+     "bounds": {type: [lowest, highest] severity}, "chars", "length",
+     "version"}
+
+gate is set when V_lower and V_upper fall under the same gate. Once all
+of y has been fed the result is always complete, even past the deadline.
+
+Worst-case cost
+---------------
+
+    n   characters of y         h   hits of the operator's marker family
+    s   sentences of y          P   patterns in the families scanned
+    W   qualifier window: 2 x radius chars (H2 240, ABS / INTENT / PRESC
+        140); for SELF, the '.'-delimited sentence
+
+evaluate_output(y), one fused scan and a window index (engine):
+
+    scan      O(n P). Marker patterns have bounded reach. One qualifier,
+              INTENT's `[^`]+\\([^)]*\\)`, backtracks O(L^2) over an
+              unclosed backtick span of L chars.
+    H2        O(h (log n + W))    one WindowIndex query per hit
+    ABS       O(h (log n + W))    stops at the first scoped hit
+    INTENT    O(h (log n + W))    stops at the first backed hit
+    ESC       O(n + s log n)      sentence split, three bisects per sentence
+    LOOP      O(n)                token sets, one Jaccard per adjacent pair
+    PRESC     O(h (log n + W))
+    SELF      O(P n + h log n)    each sentence window found and tested once
+
+With deadline_ms, a step feeds max(step, T) characters, T being the
+unsettled tail (IncrementalEvaluator.unsettled), and costs
+
+    O((step + T) P)     marker scan of the new text and the tail; steps
+                        of incremental.INDEX_CHUNK chars or more add one
+                        qualifier scan of the step
+    O(hits (log n + W)) one query per closed qualifier window; backtick
+                        qualifiers are searched on the window slice, so
+                        INTENT's backtick pattern sees at most W chars
+    O(step log n)       sentences (LOOP, ESC) and SELF's '.' index
+
+so the call returns within deadline_ms plus one step, and a step is
+sized to take at most half the time left at the rate measured so far.
+The rate is an average: a text that turns from prose (~2 us/char here)
+to the densest adversarial marker mix (~20 us/char) partway through a
+large step overruns by up to that factor on the step. Only one unbroken
+token or whitespace run keeps T growing; the step grows with it, which
+keeps the total linear but lets a single step cost O(T), with no clock
+check inside it. Gateways that cannot accept that should also bound
+len(y).
+
+Partial results depend on timing, so they are not reproducible; complete
+ones are. This path is not instrumented (rc1_lite.instrument).
+"""
+
+import time
+from typing import Dict
+
+from .engine import _GATE_AT, evaluate_output
+from .incremental import IncrementalEvaluator
+from .scoring import V_MAX
+from .version import VERSION
+
+# Characters fed between clock checks
+DEADLINE_STEP = 1024
+
+
+def evaluate_within(y: str, deadline_ms: float) -> Dict:
+    """
+    evaluate_output(y), or a partial result if deadline_ms runs out first.
+
+    The clock starts at the call. A complete result equals
+    evaluate_output(y) and has no "partial" key. The deadline is not
+    honoured inside one long unbroken token: its characters are fed in
+    one step (see the module docstring).
+    """
+    if deadline_ms < 0:
+        raise ValueError("deadline_ms must be >= 0")
+    deadline = time.perf_counter() + deadline_ms / 1000
+    n = len(y)
+    if time.perf_counter() >= deadline:
+        return _partial(IncrementalEvaluator(), n)
+    if n <= DEADLINE_STEP:
+        return evaluate_output(y)
+
+    session = IncrementalEvaluator()
+    started = time.perf_counter()
+    pos = 0
+    step = DEADLINE_STEP
+    while pos < n:
+        if time.perf_counter() >= deadline:
+            return _partial(session, n)
+        size = max(step, session.unsettled)
+        session.feed(y[pos:pos + size])
+        pos += size
+        # Double while 2 x step at the mean rate fits in half the time left
+        now = time.perf_counter()
+        if 2 * step * (now - started) / pos <= (deadline - now) / 2:
+            step *= 2
+    return session.result()
+
+
+def _partial(session: IncrementalEvaluator, length: int) -> Dict:
+    """Partial result from what session has settled of a text of length chars."""
+    bounds = session.bounds()
+    lower = sum(lo for lo, _ in bounds.values())
+    upper = sum(hi for _, hi in bounds.values())
+    gate = _GATE_AT[lower]
+    return {
+        "partial": True,
+        "gate": gate if gate == _GATE_AT[upper] else None,
+        "V_lower": lower,
+        "V_upper": upper,
+        "V_max": V_MAX,
+        "bounds": {kind: [lo, hi] for kind, (lo, hi) in bounds.items()},
+        "chars": len(session),
+        "length": length,
+        "version": VERSION,
+    }
@@ -0,0 +1,125 @@
+"""
+RC1-Lite Delta Re-evaluation
+
+For correction loops, where each rewrite changes a few sentences of the
+previous text:
+
+    result = evaluate_delta(None, None, v0)              # full evaluation
+    result = evaluate_delta(v0, result, v1)              # == evaluate_output(v1)
+    result = evaluate_delta(v1, result, v2)
+
+y is cut into sentence-aligned chunks and evaluated with the partial
+states of rc1_lite.chunked, merged exactly. A chunk's state is a function
+of its decision slice alone (chunked._bounds: the chunk plus the overlap
+its windows and matches reach) and of where its sentences and region
+fall in that slice. The returned DeltaResult keeps every state of y
+keyed by exactly that, in slice coordinates; the next call reuses the
+states whose key reappears in the new text and evaluates only the
+rest. Keys are compared in full, never by digest, so reuse cannot change
+a result: it always equals evaluate_output(new_text).
+
+Cuts are content-defined: before a sentence when its CRC-32 falls under
+its length modulo chunk_chars (so chunks average about chunk_chars
+characters), with a floor of chunk_chars / 4 and a ceiling of
+4 x chunk_chars. A cut depends only on the sentences since the previous
+cut, so an edit moves at most the cuts up to the next one after it,
+and unchanged text further away re-forms the same chunks wherever it
+moved. An edited sentence costs its own chunk, and a neighbouring one
+where the edit lies in that chunk's overlap.
+
+prev_text is only checked for identity with new_text; prev_result may be
+a plain evaluate_output dict (nothing to reuse). Evaluation is
+in-process and not instrumented.
+"""
+
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from .chunked import ChunkState, _bounds, _evaluate_chunk, merge_chunks
+from .context import DocumentContext
+
+DELTA_CHUNK_CHARS = 1024
+
+Key = Tuple[str, int, int, Tuple[Tuple[int, int], ...]]
+
+
+class DeltaResult(dict):
+    """evaluate_output(y), carrying the chunk states evaluate_delta can reuse."""
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, result: Dict, chunks: Dict[Key, ChunkState]):
+        super().__init__(result)
+        self.chunks = chunks
+
+
+def plan_delta_chunks(y: str, spans: List[Tuple[int, int]],
+                      chunk_chars: int = DELTA_CHUNK_CHARS) -> List[Tuple[int, int]]:
+    """Content-defined [i0, i1) sentence ranges of y (see module docstring)."""
+    floor = max(1, chunk_chars // 4)
+    ceiling = 4 * chunk_chars
+    chunks = []
+    i0 = 0
+    for i in range(1, len(spans)):
+        size = spans[i][0] - spans[i0][0]
+        if size < floor:
+            continue
+        a, b = spans[i]
+        if size >= ceiling or \
+                zlib.crc32(y[a:b].encode("utf-8", "surrogatepass")) % chunk_chars < b - a:
+            chunks.append((i0, i))
+            i0 = i
+    chunks.append((i0, len(spans)))
+    return chunks
+
+
+def _place(state: ChunkState, lo: int, first: int) -> ChunkState:
+    """state in slice coordinates -> document coordinates (slice at lo, first sentence first)."""
+    if lo:
+        markers = [[[(s + lo, e + lo, ok) for s, e, ok in hits] for hits in per_pattern]
+                   for per_pattern in state.markers]
+    else:
+        markers = state.markers
+    return state._replace(
+        markers=markers,
+        loop_first=state.loop_first + first if state.loop_first >= 0 else -1,
+        esc_first=state.esc_first + first if state.esc_first >= 0 else -1,
+    )
+
+
+def evaluate_delta(prev_text: Optional[str], prev_result: Optional[Dict], new_text: str,
+                   chunk_chars: int = DELTA_CHUNK_CHARS) -> DeltaResult:
+    """
+    evaluate_output(new_text), reusing what prev_result holds of prev_text.
+
+    prev_result is a DeltaResult from an earlier call, or anything else
+    (evaluated in full). Returns a DeltaResult for the next call.
+    """
+    if chunk_chars < 1:
+        raise ValueError("chunk_chars must be >= 1")
+    known = getattr(prev_result, "chunks", None) or {}
+    if known and new_text == prev_text:
+        return DeltaResult(prev_result, known)
+
+    y = new_text
+    n = len(y)
+    spans = DocumentContext(y).sentence_spans
+    chunks = plan_delta_chunks(y, spans, chunk_chars)
+
+    kept = {}
+    states = []
+    for j, (i0, i1) in enumerate(chunks):
+        a = spans[i0][0] if j else 0
+        b = spans[i1][0] if i1 < len(spans) else n
+        lo, hi = _bounds(y, a, b)
+        local = tuple((sa - lo, sb - lo) for sa, sb in spans[i0:i1])
+        key = (y[lo:hi], a - lo, b - lo, local)
+        state = known.get(key)
+        if state is None:
+            state = kept.get(key)
+        if state is None:
+            state = _evaluate_chunk((key[0], 0, n - lo, a - lo, b - lo, 0, local))
+        kept[key] = state
+        states.append(_place(state, lo, i0))
+
+    return DeltaResult(merge_chunks(y, spans, chunks, states), kept)
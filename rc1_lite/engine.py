@@ -5,12 +5,45 @@ Deterministic constraint projection: y -> {score, gate, taxonomy, violations, ve
 
 Runs all 7 operators. Sums severity. Computes S = 1 - V/V_max. Gates.
 No probabilistic inference. No secondary LLM. Pure function.
+
+evaluate_output builds one DocumentContext per input (fused scan,
+sentences, tokens) and hands it to every operator. evaluate_reference
+runs each operator's own per-pattern scan; both return identical results.
+The two share DocumentContext and the operators' verdict code, so the
+reference checks the scanners, not those.
+
+evaluate_gate answers only the gate: it runs operators cheapest first
+and stops once the remaining ones cannot move V across a threshold.
+
+evaluate_output(y, deadline_ms=...) bounds the wall time instead, and
+may return a partial result (rc1_lite.deadline).
+
+evaluate_result(y) returns the same projection packed into a slotted
+RC1Result (rc1_lite.result), for callers that hold many results.
+
+set_instrumentation / instrumented attach an rc1_lite.instrument
+collector that times each operator and counts its hits and window
+checks. Results are unchanged either way.
 """
 
-from typing import Dict, List
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from .scoring import compute_score, compute_gate, compute_taxonomy, V_MAX
+from .context import DocumentContext
+from .instrument import SCAN_STAGE, Instrumentation, ProbeContext
+from .result import RC1Result
+from .scanner import FusedScanner, StagedScan
 from .version import VERSION
+from .constraints import (
+    h2_metaphor as _h2,
+    absolute_claim as _abs,
+    intent_execution as _intent,
+    abstraction_escalation as _esc,
+    ungrounded_prescriptive as _presc,
+    self_reference as _self,
+)
 from .constraints.h2_metaphor import h2_metaphor
 from .constraints.absolute_claim import absolute_claim
 from .constraints.intent_execution import intent_execution
@@ -31,18 +64,167 @@ CONSTRAINTS = [
     self_reference,
 ]
 
+# One scanner over every operator's marker families
+SCANNER = FusedScanner({
+    **_h2.SCAN_FAMILIES,
+    **_abs.SCAN_FAMILIES,
+    **_intent.SCAN_FAMILIES,
+    **_esc.SCAN_FAMILIES,
+    **_presc.SCAN_FAMILIES,
+    **_self.SCAN_FAMILIES,
+})
+
+
+# Gate path: operators by measured cost, cheapest first (samples/,
+# certification vectors and docs/, marker scan excluded as shared).
+# PASS needs five operators to settle, FAIL at least four, so the two
+# most expensive usually never run.
+GATE_ORDER = [
+    self_reference,
+    h2_metaphor,
+    ungrounded_prescriptive,
+    intent_execution,
+    rephrasing_loop,
+    absolute_claim,
+    abstraction_escalation,
+]
+
+# Gate path scans marker families only, each group on first use; the few
+# qualifier windows asked about are searched as slices.
+GATE_SCANNERS = [
+    FusedScanner({tag: SCANNER.families[tag]
+                  for tag in ("H2", "ABS", "INTENT", "PRESC", "SELF")}),
+    FusedScanner({tag: SCANNER.families[tag]
+                  for tag in ("ESC_TECH", "ESC_ABSTRACT", "ESC_BRIDGE")}),
+]
+
+# Gate as a function of V. compute_gate is monotone in V, so once the
+# lowest and highest reachable V share a gate, the gate is decided.
+_GATE_AT = [compute_gate(compute_score(v)) for v in range(V_MAX + 1)]
+_MAX_SEVERITY = V_MAX // len(CONSTRAINTS)
+
+# Active collector, or None (the default: no instrumentation overhead)
+_instrumentation: Optional[Instrumentation] = None
+
 
-def evaluate_output(y: str) -> Dict:
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> Optional[Instrumentation]:
+    """Attach a collector to evaluate_output (None detaches). Returns the previous one."""
+    global _instrumentation
+    previous = _instrumentation
+    _instrumentation = instrumentation
+    return previous
+
+
+@contextmanager
+def instrumented(instrumentation: Optional[Instrumentation] = None) -> Iterator[Instrumentation]:
+    """Instrument evaluate_output inside the block; yields the collector."""
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    previous = set_instrumentation(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        set_instrumentation(previous)
+
+
+def evaluate_output(y: str, deadline_ms: Optional[float] = None) -> Dict:
     """
     P(y) -> {score, gate, taxonomy, violations, version}
 
     Deterministic. Stateless. No side effects.
+
+    deadline_ms bounds the wall time (rc1_lite.deadline): past it, the
+    result is partial, marked "partial": True, with sound bounds on V.
     """
-    violations = []
+    if deadline_ms is not None:
+        from .deadline import evaluate_within
+        return evaluate_within(y, deadline_ms)
+    return _project(_results(y))
+
+
+def evaluate_result(y: str) -> RC1Result:
+    """
+    evaluate_output(y) as a compact RC1Result.
+
+    result.to_dict() == evaluate_output(y); taxonomy and violations are
+    only built when asked for.
+    """
+    return RC1Result.pack(_results(y))
+
+
+def _results(y: str) -> List[Dict]:
+    """C_1(y)..C_7(y) over one shared DocumentContext."""
+    if _instrumentation is not None:
+        return _results_instrumented(y, _instrumentation)
+    ctx = DocumentContext(y, SCANNER.scan(y))
+    return [constraint(y, ctx) for constraint in CONSTRAINTS]
+
+
+def _results_instrumented(y: str, instrumentation: Instrumentation) -> List[Dict]:
+    """_results(y), recording per-stage time, hits and window checks."""
+    clock = time.perf_counter_ns
+    started = clock()
+    scan = SCANNER.scan(y)
+    elapsed = clock() - started
+    samples = [(SCAN_STAGE, elapsed // 1000, 0, 0)]
+
+    ctx = ProbeContext(y, scan)
+    results = []
     for constraint in CONSTRAINTS:
-        result = constraint(y)
-        if result["severity"] > 0:
-            violations.append(result)
+        started = clock()
+        result = constraint(y, ctx)
+        elapsed = clock() - started
+        hits, windows = ctx.take()
+        samples.append((result["type"], elapsed // 1000, hits, windows))
+        results.append(result)
+
+    instrumentation.record(samples)
+    return results
+
+
+def evaluate_reference(y: str) -> Dict:
+    """
+    P(y) via each operator's own per-pattern scan.
+
+    The reference for the fused scan: evaluate_output must equal it
+    exactly. It shares DocumentContext and the verdict code with
+    evaluate_output, so it is not an independent check of those.
+    """
+    ctx = DocumentContext(y)
+    return _project([constraint(y, ctx) for constraint in CONSTRAINTS])
+
+
+def evaluate_gate(y: str) -> Dict:
+    """
+    Gate of P(y) without necessarily computing all of P(y).
+
+    Returns {gate, V_lower, evaluated, version}: gate equals
+    evaluate_output(y)["gate"]; V_lower <= V is the severity summed over
+    the operators that ran (their types listed in evaluated, in run
+    order). When all seven ran, V_lower == V.
+    """
+    ctx = DocumentContext(y, StagedScan(y, GATE_SCANNERS), slice_windows=True)
+    v = 0
+    remaining = len(GATE_ORDER)
+    evaluated = []
+    for constraint in GATE_ORDER:
+        if _GATE_AT[v] == _GATE_AT[min(V_MAX, v + remaining * _MAX_SEVERITY)]:
+            break
+        result = constraint(y, ctx)
+        v += result["severity"]
+        remaining -= 1
+        evaluated.append(result["type"])
+    return {
+        "gate": _GATE_AT[min(v, V_MAX)],
+        "V_lower": v,
+        "evaluated": evaluated,
+        "version": VERSION,
+    }
+
+
+def _project(results: List[Dict]) -> Dict:
+    """Assemble {score, gate, taxonomy, violations, version} from C_1..C_7."""
+    violations = [result for result in results if result["severity"] > 0]
 
     # V = sum of all violation severities
     v = sum(viol["severity"] for viol in violations)
@@ -0,0 +1,600 @@
+"""
+RC1-Lite Differential Fuzzer
+
+Runs a reference engine and a candidate engine side by side on
+generated adversarial inputs and reports the first divergence, minimized:
+
+    python -m rc1_lite.fuzz --cases 1000000 --jobs 8
+    python -m rc1_lite.fuzz --candidate mypkg.fast:evaluate --report diverge.json
+
+    report = run_differential(candidate, cases=100_000, seed=7, jobs=4)
+
+Cases follow the generative phases of docs/adversarial_protocol.md:
+
+    isolation   one operator: minimal trigger, near-boundary variant
+                (qualifier just inside / outside the window, LOOP pairs
+                straddling lambda), dissolved / grounded variant
+    compound    2, 3 or 5+ operators triggered at once
+    inflation   clean padding past 1000 tokens around one violation,
+                redundant phrase repetition, exact and near-exact segment
+                duplication, whitespace manipulation
+    edge        markers inserted at arbitrary positions, mixed case,
+                punctuation (em-dash, semicolon, ellipsis), Unicode
+                (re.I confusables, fullwidth, zero-width, combining),
+                empty, single-word and single-sentence inputs
+
+Phases 4 (cross-model sampling) and 6 (version audit) are not
+generative and are out of scope here.
+
+Case i of a seed is a pure function of (seed, i), so workers generate
+their own blocks: only indices and verdicts cross process boundaries.
+The first divergence is the lowest divergent index, independent of
+scheduling. Markers are rendered from the engine's own pattern families
+(rc1_lite.lexicon phrase lists), so new vocabulary is fuzzed as soon as
+it is added.
+
+An outcome is the result dict, or the exception an engine raised; two
+engines diverge when their outcomes differ (on `keys` only, if given).
+
+The default reference, engine.evaluate_reference, replaces the fused
+scan with each operator's per-pattern searches but is not independent
+of the candidate: both go through DocumentContext (sentence split,
+token sets) and the operators' shared verdict code, so a fault there
+shows up on both sides. To fuzz those too, point --reference at an
+engine outside this tree, such as an installed earlier release.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import platform
+import random
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .batch import _resolve_jobs
+from .engine import SCANNER, evaluate_output, evaluate_reference
+from .lexicon import LIT, RUN, SPACE, compile_phrases
+from .version import VERSION
+from .constraints import (
+    h2_metaphor as _h2,
+    absolute_claim as _abs,
+    intent_execution as _intent,
+    ungrounded_prescriptive as _presc,
+)
+
+Engine = Callable[[str], Dict]
+
+PHASES = ("isolation", "compound", "inflation", "edge")
+
+# Relative frequency of each phase (inflation cases are ~50x longer)
+_PHASE_WEIGHTS = {"isolation": 4, "compound": 3, "inflation": 1, "edge": 4}
+
+DEFAULT_BLOCK = 256
+DEFAULT_MAX_TESTS = 4000
+
+# Windowed operators: (marker tag, qualifier tag, window radius in chars)
+_WINDOWED = {
+    "H2": ("H2", "H2_DISSOLVE", _h2.WINDOW_TOKENS * 6),
+    "ABS": ("ABS", "ABS_SCOPE", _abs.WINDOW_TOKENS * 7),
+    "INTENT": ("INTENT", "INTENT_MECH", _intent.WINDOW_TOKENS * 7),
+    "PRESC": ("PRESC", "PRESC_GROUND", _presc.WINDOW_TOKENS * 7),
+}
+_OPERATORS = ("H2", "ABS", "INTENT", "ESC", "LOOP", "PRESC", "SELF")
+
+# Clean prose: no word here is a marker on its own
+_FILLER = (
+    "data", "value", "result", "input", "request", "record", "field", "user",
+    "table", "report", "rows", "page", "file", "time", "batch", "queue",
+    "the", "a", "of", "to", "and", "with", "from", "into", "after", "before",
+    "each", "two", "three", "small", "large", "new", "old", "fixed", "sorted",
+    "reads", "writes", "stores", "holds", "lists", "counts", "sends", "keeps",
+)
+_NAMES = ("x", "foo", "parse_input", "main", "Config", "run2", "cache_size")
+
+_WHITESPACE = (" ", "  ", "\t", "\n", "\r\n", " \n ", "\x0b", "\x0c", "\xa0",
+               "\u2003", "\u3000", "\x1c", "\x85")
+_PUNCTUATION = ("\u2014", " \u2014 ", ";", "; ", "\u2026", "...", "?!", ",", ":",
+                "(", ")", "'", '"', "-", "/")
+# Characters re.IGNORECASE equates with ASCII letters (long s, Kelvin, dotted / dotless i)
+_CONFUSABLES = {"s": "\u017f", "k": "\u212a", "i": "\u0130", "I": "\u0131",
+                "S": "\u017f", "K": "\u212a"}
+_INVISIBLE = ("\u200b", "\u200d", "\u0301", "\ufeff", "\U0001f600")
+
+
+def _marker_vocab() -> Dict[str, List[List[Tuple]]]:
+    """Per family: per pattern, its phrase list (None for structural patterns)."""
+    vocab = {}
+    for tag, patterns in SCANNER.families.items():
+        vocab[tag] = []
+        for pattern in patterns:
+            compiled = compile_phrases(pattern)
+            vocab[tag].append(compiled[2] if compiled is not None else None)
+    return vocab
+
+
+_VOCAB = _marker_vocab()
+
+
+class _Case:
+    """Random choices of one case, drawn from an rng seeded by (seed, index)."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def words(self, count: int) -> str:
+        rng = self.rng
+        return " ".join(rng.choice(_FILLER) for _ in range(count))
+
+    def gap(self, chars: int) -> str:
+        """Clean filler of exactly chars characters (may cut a word)."""
+        text = ""
+        while len(text) < chars:
+            text += self.rng.choice(_FILLER) + " "
+        return text[:chars]
+
+    def marker(self, tag: str) -> str:
+        rng = self.rng
+        phrases = rng.choice(_VOCAB[tag])
+        if phrases is None:
+            return rng.choice(("`x`", "`f(x)`", "`parse()`", "`a b`"))
+        out = []
+        for element in rng.choice(phrases):
+            if element[0] is LIT:
+                out.append(element[1])
+            elif element[0] is SPACE:
+                out.append(" " if element[1] or rng.random() < 0.5 else "")
+            elif element[0] is RUN and element[1] == "d":
+                out.append(str(rng.randint(0, 4096)))
+            else:
+                out.append(rng.choice(_NAMES))
+        return "".join(out)
+
+    def sentence(self, *parts: str) -> str:
+        rng = self.rng
+        head = rng.choice(("The", "A", "Each", "Then", "Now"))
+        body = " ".join(p for p in parts if p)
+        return f"{head} {self.words(rng.randint(0, 4))} {body} {self.words(rng.randint(0, 4))}."
+
+    # ── Operator triggers ──
+
+    def trigger(self, operator: str, variant: str = "trigger") -> str:
+        """One operator's trigger: "trigger", "near" (boundary) or "grounded"."""
+        rng = self.rng
+        if operator in _WINDOWED:
+            tag, qualifier, radius = _WINDOWED[operator]
+            hit = self.marker(tag)
+            if variant == "trigger":
+                return self.sentence(hit)
+            q = self.marker(qualifier)
+            if variant == "grounded":
+                return self.sentence(hit, self.words(rng.randint(0, 3)), q)
+            # Qualifier edge just inside or outside the window edge
+            delta = rng.randint(-3, 3)
+            if rng.random() < 0.5:
+                gap = radius - len(hit) - 1 - len(q) + delta
+                return hit + " " + self.gap(max(0, gap)) + q + "."
+            return q + self.gap(max(0, radius - len(q) + delta)) + hit + "."
+        if operator == "SELF":
+            hit = self.marker("SELF")
+            if variant == "trigger":
+                return self.sentence(hit)
+            q = self.marker("SELF_QUAL")
+            if variant == "grounded":
+                return self.sentence(q, hit)
+            # Qualifier in the neighbouring '.'-sentence, or right at its edge
+            return rng.choice((
+                f"{self.sentence(hit)} {self.sentence(q)}",
+                f"{self.sentence(q)} {self.sentence(hit)}",
+                f"{hit} {q}.", f"{q}. {hit}", f"{hit}.{q}",
+            ))
+        if operator == "ESC":
+            first = self.sentence(self.marker("ESC_TECH"))
+            second = self.sentence(self.marker("ESC_ABSTRACT"))
+            if variant == "grounded":
+                return f"{first} {self.sentence(self.marker('ESC_BRIDGE'))} {second}"
+            if variant == "near":
+                # Bridge one sentence too late, or a join SENT_SPLIT ignores
+                return rng.choice((
+                    f"{first} {second} {self.sentence(self.marker('ESC_BRIDGE'))}",
+                    f"{first[:-1]}; {second[0].lower()}{second[1:]}",
+                    f"{first[:-1]}! {second}",
+                    f"{first[:-1]}.{second}",
+                ))
+            return f"{first} {second}"
+        # LOOP: a 10-word sentence and a copy with k words changed; the
+        # Jaccard similarity crosses lambda between k = 1 and k = 2
+        tokens = rng.sample(_FILLER[:16], 10)
+        changes = {"trigger": 0, "near": rng.choice((1, 2)), "grounded": 6}[variant]
+        copy = list(tokens)
+        for i in rng.sample(range(10), changes):
+            copy[i] = rng.choice(_FILLER[16:]) + "s"
+        repeats = rng.choice((1, 1, 2, 3))
+        return " ".join(["The " + " ".join(tokens) + "."]
+                        + ["The " + " ".join(copy) + "."] * repeats)
+
+    # ── Phases ──
+
+    def isolation(self) -> str:
+        rng = self.rng
+        return self.trigger(rng.choice(_OPERATORS),
+                            rng.choice(("trigger", "near", "grounded")))
+
+    def compound(self) -> str:
+        rng = self.rng
+        operators = rng.sample(_OPERATORS, rng.choice((2, 3, 5, 6, 7)))
+        parts = [self.trigger(op, rng.choice(("trigger", "trigger", "near"))) for op in operators]
+        return " ".join(parts)
+
+    def inflation(self) -> str:
+        rng = self.rng
+        kind = rng.randrange(4)
+        if kind == 0:
+            # >1000 tokens of clean prose, one violation somewhere
+            sentences = [self.sentence(self.words(8)) for _ in range(rng.randint(110, 160))]
+            sentences.insert(rng.randrange(len(sentences) + 1),
+                             self.trigger(rng.choice(_OPERATORS)))
+            return " ".join(sentences)
+        if kind == 1:
+            # One phrase inserted over and over
+            phrase = self.marker(rng.choice(list(_VOCAB)))
+            seps = (" ", ", ", ". ", " and ", "; ")
+            return self.sentence("".join(phrase + rng.choice(seps)
+                                         for _ in range(rng.randint(2, 60))))
+        if kind == 2:
+            # Exact and near-exact segment duplication
+            segment = self.compound()
+            copies = [segment]
+            for _ in range(rng.randint(1, 8)):
+                if rng.random() < 0.5:
+                    words = segment.split(" ")
+                    words[rng.randrange(len(words))] = rng.choice(_FILLER)
+                    copies.append(" ".join(words))
+                else:
+                    copies.append(segment)
+            return " ".join(copies)
+        # Whitespace manipulation
+        return re.sub(" ", lambda _: rng.choice(_WHITESPACE), self.compound())
+
+    def edge(self) -> str:
+        rng = self.rng
+        kind = rng.randrange(6)
+        if kind == 0:
+            return rng.choice(("", " ", ".", "\n", rng.choice(_FILLER),
+                               self.marker(rng.choice(list(_VOCAB))),
+                               self.trigger(rng.choice(_OPERATORS))))
+        text = self.compound() if rng.random() < 0.5 else self.sentence(self.words(12))
+        if kind == 1:
+            # Markers at arbitrary positions, inside words and at edges
+            for _ in range(rng.randint(1, 6)):
+                i = rng.randint(0, len(text))
+                text = text[:i] + self.marker(rng.choice(list(_VOCAB))) + text[i:]
+            return text
+        if kind == 2:
+            return "".join(c.upper() if rng.random() < 0.5 else c.lower() for c in text)
+        if kind == 3:
+            return re.sub(r"[ .]", lambda m: rng.choice(_PUNCTUATION)
+                          if rng.random() < 0.3 else m.group(), text)
+        if kind == 4:
+            return "".join(_CONFUSABLES.get(c, c) if rng.random() < 0.3 else c for c in text)
+        # Fullwidth letters, zero-width and combining characters
+        out = []
+        for c in text:
+            r = rng.random()
+            if r < 0.05 and "a" <= c.lower() <= "z":
+                c = chr(ord(c) + 0xFEE0)
+            elif r < 0.1:
+                c += rng.choice(_INVISIBLE)
+            out.append(c)
+        return "".join(out)
+
+
+_PHASE_TABLE = [phase for phase in PHASES for _ in range(_PHASE_WEIGHTS[phase])]
+
+
+def generate_case(seed: int, index: int, phases: Sequence[str] = PHASES) -> Tuple[str, str]:
+    """(phase, text) of case index under seed. Deterministic across runs and platforms."""
+    rng = random.Random(f"rc1-fuzz:{seed}:{index}")
+    table = _PHASE_TABLE if tuple(phases) == PHASES else \
+        [phase for phase in PHASES if phase in phases for _ in range(_PHASE_WEIGHTS[phase])]
+    phase = rng.choice(table)
+    return phase, getattr(_Case(rng), phase)()
+
+
+# ── Comparison ──
+
+def outcome(engine: Engine, y: str, keys: Optional[Sequence[str]] = None):
+    """("ok", result) or ("error", "Type: message"); result restricted to keys if given."""
+    try:
+        result = engine(y)
+    except Exception as exc:
+        return ("error", f"{type(exc).__name__}: {exc}")
+    if keys is not None:
+        result = {key: result.get(key) for key in keys}
+    return ("ok", result)
+
+
+def diverges(y: str, reference: Engine, candidate: Engine,
+             keys: Optional[Sequence[str]] = None) -> bool:
+    return outcome(reference, y, keys) != outcome(candidate, y, keys)
+
+
+def _run_block(task: Tuple) -> Tuple[int, int, Optional[int], Dict[str, int]]:
+    """Worker entry point: (start, cases checked, first divergent index or None, per-phase counts)."""
+    seed, start, stop, phases, reference, candidate, keys = task
+    counts = dict.fromkeys(phases, 0)
+    for index in range(start, stop):
+        phase, y = generate_case(seed, index, phases)
+        counts[phase] += 1
+        if diverges(y, reference, candidate, keys):
+            return start, index + 1 - start, index, counts
+    return start, stop - start, None, counts
+
+
+# ── Minimization ──
+
+_PIECE = re.compile(r"\s+|\w+|[^\w\s]")
+
+
+def _ddmin(items: list, test: Callable[[list], bool]) -> list:
+    """Zeller's ddmin: a 1-minimal sublist of items on which test holds."""
+    n = 2
+    while len(items) >= 2:
+        size = math.ceil(len(items) / n)
+        parts = [items[i:i + size] for i in range(0, len(items), size)]
+        for i, part in enumerate(parts):
+            if test(part):
+                items, n = part, 2
+                break
+            complement = [x for j, p in enumerate(parts) if j != i for x in p]
+            if n > 2 and test(complement):
+                items, n = complement, max(n - 1, 2)
+                break
+        else:
+            if n >= len(items):
+                break
+            n = min(len(items), 2 * n)
+    return items
+
+
+def minimize(y: str, still_fails: Callable[[str], bool],
+             max_tests: int = DEFAULT_MAX_TESTS) -> str:
+    """
+    A small input on which still_fails holds, by ddmin over tokens then chars.
+
+    Stops early (returning the smallest failing input so far) after
+    max_tests calls of still_fails.
+    """
+    tests = 0
+    best = y
+
+    class _Budget(Exception):
+        pass
+
+    def test(text: str) -> bool:
+        nonlocal tests, best
+        if tests >= max_tests:
+            raise _Budget
+        tests += 1
+        if still_fails(text):
+            if len(text) < len(best):
+                best = text
+            return True
+        return False
+
+    try:
+        pieces = _ddmin(_PIECE.findall(y), lambda p: test("".join(p)))
+        _ddmin(list("".join(pieces)), lambda c: test("".join(c)))
+    except _Budget:
+        pass
+    return best
+
+
+# ── Harness ──
+
+def run_differential(
+    candidate: Engine = evaluate_output,
+    cases: int = 100_000,
+    seed: int = 0,
+    jobs: Optional[int] = None,
+    reference: Engine = evaluate_reference,
+    phases: Sequence[str] = PHASES,
+    keys: Optional[Sequence[str]] = None,
+    block: int = DEFAULT_BLOCK,
+    minimize_divergence: bool = True,
+    mp_context=None,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> Dict:
+    """
+    Compare candidate with reference on cases 0 .. cases-1 of seed.
+
+    reference: evaluate_reference by default, which shares DocumentContext
+    and the verdict code with evaluate_output (see the module docstring).
+
+    Engines must be picklable (module-level functions) when jobs > 1.
+    progress(checked, seconds) is called as blocks complete.
+
+    Returns a report: {version, python, platform, seed, cases, seconds,
+    cases_per_second, phases, divergence}; divergence is None or
+    {index, phase, input, minimized, expected, actual, minimized_expected,
+    minimized_actual}, expected being the reference outcome.
+    """
+    if block < 1:
+        raise ValueError("block must be >= 1")
+    unknown = set(phases) - set(PHASES)
+    if unknown or not phases:
+        raise ValueError(f"phases must be a non-empty subset of {PHASES}")
+    phases = tuple(p for p in PHASES if p in phases)
+    keys = tuple(keys) if keys is not None else None
+    jobs = _resolve_jobs(jobs)
+
+    tasks = ((seed, start, min(start + block, cases), phases, reference, candidate, keys)
+             for start in range(0, cases, block))
+    checked = 0
+    counts = dict.fromkeys(phases, 0)
+    first = None
+    started = time.perf_counter()
+
+    def collect(result) -> None:
+        nonlocal checked, first
+        _, done, index, block_counts = result
+        checked += done
+        for phase, count in block_counts.items():
+            counts[phase] += count
+        if index is not None and (first is None or index < first):
+            first = index
+        if progress is not None:
+            progress(checked, time.perf_counter() - started)
+
+    if jobs == 1:
+        for task in tasks:
+            collect(_run_block(task))
+            if first is not None:
+                break
+    else:
+        window = 2 * jobs
+        pending = {}      # future -> block start
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as pool:
+            try:
+                while True:
+                    # Once a divergence is known, only earlier blocks matter,
+                    # and every one of those is already submitted
+                    while first is None and len(pending) < window:
+                        task = next(tasks, None)
+                        if task is None:
+                            break
+                        pending[pool.submit(_run_block, task)] = task[1]
+                    if first is not None:
+                        for future, start in list(pending.items()):
+                            if start > first and future.cancel():
+                                del pending[future]
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del pending[future]
+                        collect(future.result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    seconds = time.perf_counter() - started
+    report = {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "cases": checked,
+        "seconds": round(seconds, 3),
+        "cases_per_second": round(checked / max(seconds, 1e-9), 1),
+        "phases": counts,
+        "divergence": None,
+    }
+    if first is not None:
+        phase, y = generate_case(seed, first, phases)
+        small = y
+        if minimize_divergence:
+            small = minimize(y, lambda text: diverges(text, reference, candidate, keys))
+        report["divergence"] = {
+            "index": first,
+            "phase": phase,
+            "input": y,
+            "minimized": small,
+            "expected": outcome(reference, y, keys),
+            "actual": outcome(candidate, y, keys),
+            "minimized_expected": outcome(reference, small, keys),
+            "minimized_actual": outcome(candidate, small, keys),
+        }
+    return report
+
+
+# ── CLI ──
+
+def _load(spec: str) -> Engine:
+    """'package.module:function' -> the function."""
+    module, _, name = spec.partition(":")
+    if not module or not name:
+        raise ValueError(f"engine must be module:function, got {spec!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m rc1_lite.fuzz",
+        description=f"Differential fuzzing of an RC1 engine against the reference ({VERSION}).",
+    )
+    parser.add_argument("--cases", "-n", type=int, default=100_000,
+                        help="cases to generate (default 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="worker processes (0: one per CPU; default 0)")
+    parser.add_argument("--candidate", default="rc1_lite.engine:evaluate_output",
+                        help="engine under test, module:function")
+    parser.add_argument("--reference", default="rc1_lite.engine:evaluate_reference",
+                        help="reference engine, module:function")
+    parser.add_argument("--keys", default=None,
+                        help="compare only these result keys (comma-separated, e.g. gate)")
+    parser.add_argument("--phases", default=",".join(PHASES),
+                        help=f"comma-separated subset of {','.join(PHASES)}")
+    parser.add_argument("--block", type=int, default=DEFAULT_BLOCK,
+                        help=f"cases per worker task (default {DEFAULT_BLOCK})")
+    parser.add_argument("--no-minimize", action="store_true",
+                        help="report the divergent input as generated")
+    parser.add_argument("--report", default=None,
+                        help="write the JSON report here (default: stdout)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="no progress on stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        candidate = _load(args.candidate)
+        reference = _load(args.reference)
+    except (ImportError, AttributeError, ValueError) as exc:
+        parser.error(str(exc))
+    phases = args.phases.split(",")
+    if not set(phases) <= set(PHASES):
+        parser.error(f"--phases must be a subset of {','.join(PHASES)}")
+    if args.cases < 0 or args.block < 1:
+        parser.error("--cases must be >= 0 and --block >= 1")
+
+    last = [0.0]
+
+    def progress(checked: int, seconds: float) -> None:
+        if seconds - last[0] >= 5.0:
+            last[0] = seconds
+            sys.stderr.write(f"rc1_lite.fuzz: {checked} cases, "
+                             f"{checked / max(seconds, 1e-9):.0f} cases/s\n")
+
+    report = run_differential(
+        candidate, cases=args.cases, seed=args.seed, jobs=args.jobs,
+        reference=reference, phases=phases,
+        keys=args.keys.split(",") if args.keys else None, block=args.block,
+        minimize_divergence=not args.no_minimize,
+        progress=None if args.quiet else progress,
+    )
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+    if not args.quiet:
+        divergence = report["divergence"]
+        verdict = "no divergence" if divergence is None else \
+            f"DIVERGENCE at case {divergence['index']} ({divergence['phase']})"
+        sys.stderr.write(f"rc1_lite.fuzz: {report['cases']} cases in {report['seconds']}s "
+                         f"({report['cases_per_second']}/s): {verdict}\n")
+    return 0 if report["divergence"] is None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
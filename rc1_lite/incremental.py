@@ -0,0 +1,528 @@
+"""
+RC1-Lite Incremental Evaluation
+
+For output that arrives in chunks (token-streamed LLM responses):
+
+    session = IncrementalEvaluator()
+    for chunk in stream:
+        result = session.append(chunk)     # == evaluate_output(prefix)
+        result["score"], result["gate"]
+
+Re-evaluating the whole prefix after every chunk is O(n^2). The session
+instead keeps per-operator aggregates for the part of the text that can
+no longer change, and re-examines only the open tail:
+
+    markers     A marker's raw matches become final once the text holds
+                more whitespace runs after its start than the pattern can
+                cross (PatternEdges.reach). Behind that frontier the
+                finditer hits are settled and folded into counts.
+    windows     A qualifier window y[cs:ce] is a fixed slice once
+                ce = hit + WINDOW_TOKENS * k (or SELF's next '.') is in
+                the text; its verdict is computed once.
+    sentences   A SENT_SPLIT match needs the uppercase letter after it,
+                so every split found is final. LOOP folds each closed
+                sentence's token set, ESC each closed sentence whose
+                markers are settled.
+
+A feed of INDEX_CHUNK characters or more scans the qualifier families
+over the chunk once and answers its windows from a WindowIndex, as the
+fused engine does; smaller feeds search each window slice.
+
+Work per feed is proportional to the chunk plus the unsettled tail (the
+widest window and the last few tokens); append adds a result(), which
+also revisits the open sentence. Every result, including the last,
+equals evaluate_output(text so far) exactly. bounds() gives each
+operator's severity range over every continuation of the text so far.
+"""
+
+import re
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .context import SENT_SPLIT, token_set
+from .engine import SCANNER, _project
+from .scanner import FusedScanner
+from .constraints import (
+    h2_metaphor as _h2,
+    absolute_claim as _abs,
+    intent_execution as _intent,
+    abstraction_escalation as _esc,
+    rephrasing_loop as _loop,
+    ungrounded_prescriptive as _presc,
+    self_reference as _self,
+)
+
+_WS_RUN = re.compile(r'\s+')
+
+# Families whose hits are counted (operator markers) and families only
+# tested per sentence (ESC)
+_MARKER_TAGS = ("H2", "ABS", "INTENT", "PRESC", "SELF")
+_SENTENCE_TAGS = ("ESC_TECH", "ESC_ABSTRACT", "ESC_BRIDGE")
+
+_STREAM_SCANNER = FusedScanner(
+    {tag: SCANNER.families[tag] for tag in _MARKER_TAGS + _SENTENCE_TAGS}
+)
+
+
+def _max_reach(scanner: FusedScanner) -> int:
+    reach = 0
+    for tag in scanner.tags:
+        for edge in scanner.edges(tag):
+            if edge.reach is None:
+                raise ValueError(f"unbounded marker pattern {edge.pattern.pattern!r}")
+            reach = max(reach, edge.reach)
+    return reach
+
+
+# Whitespace runs a raw match (plus its one-char lookahead) may need
+# after its start before it is settled
+_SETTLE_RUNS = _max_reach(_STREAM_SCANNER) + 1
+
+# Qualifier families, per marker tag
+_QUALIFIER_TAGS = {"H2": "H2_DISSOLVE", "ABS": "ABS_SCOPE", "INTENT": "INTENT_MECH",
+                   "PRESC": "PRESC_GROUND", "SELF": "SELF_QUAL"}
+
+# A feed of at least this many characters answers its window tests from
+# one qualifier scan of the fed region (rc1_lite.window.WindowIndex)
+# instead of searching every window slice
+INDEX_CHUNK = 2048
+
+
+def _split_qualifiers(tag: str):
+    """(bounded, unbounded): patterns of bounded reach, the rest."""
+    bounded, unbounded = [], []
+    for pattern, edge in zip(SCANNER.families[tag], SCANNER.edges(tag)):
+        (bounded if edge.reach is not None else unbounded).append(pattern)
+    return bounded, unbounded
+
+
+# Unbounded-reach qualifiers (`...` spans) can backtrack over a whole
+# region; they stay on slice search, which sees at most one window
+_QUALIFIERS = {tag: _split_qualifiers(family) for tag, family in _QUALIFIER_TAGS.items()}
+_QUALIFIER_SCANNER = FusedScanner({tag: bounded for tag, (bounded, _) in _QUALIFIERS.items()})
+
+
+class _Marker:
+    """Settled state of one windowed marker operator."""
+
+    __slots__ = ("tag", "qualifiers", "radius", "any_only", "ends", "count", "first",
+                 "qualified", "unqualified", "first_unqualified", "pending", "memo")
+
+    def __init__(self, tag: str, qualifiers: Sequence, radius: Optional[int],
+                 any_only: bool):
+        npats = len(SCANNER.families[tag])
+        self.tag = tag
+        self.qualifiers = qualifiers
+        self.radius = radius              # None: SELF's '.'-delimited window
+        self.any_only = any_only          # verdict needs only "some window qualified"
+        self.ends = [-1] * npats          # finditer end of the last settled hit
+        self.count = [0] * npats
+        self.first = [None] * npats       # (start, matched text) of first hit
+        self.qualified = 0                # settled windows that qualified
+        self.unqualified = 0              # settled windows that did not
+        self.first_unqualified = [None] * npats
+        # Settled hits with open windows, per pattern in hit order: (s, cs)
+        self.pending = [deque() for _ in range(npats)]
+        self.memo = (0, 0, False)         # last (cs, ce, qualified) tested
+
+    def settled(self) -> bool:
+        """True once nothing later in the text can change the verdict's window part."""
+        return self.any_only and self.qualified > 0
+
+
+class IncrementalEvaluator:
+    """
+    Streaming evaluation session. One per response; not thread-safe.
+
+    append(chunk) -> evaluate_output(text so far)
+    feed(chunk)   -> None: append without building a result
+    result()      -> evaluate_output(text so far), without appending
+    """
+
+    def __init__(self):
+        self._buf = ""                # text[self._base:]
+        self._base = 0
+        self._length = 0
+        self._dot_before_base = -1    # last '.' in text[:self._base]
+        self._dots = []               # positions of every '.' in text[self._base:]
+        self._ws_tail = 0             # start of the trailing whitespace run (or length)
+        self._frontier = 0            # raw marker matches starting before it are final
+        self._markers = {
+            "H2": _Marker("H2", _h2._DISSOLUTION_PATS, _h2.WINDOW_TOKENS * 6, False),
+            "ABS": _Marker("ABS", _abs._SCOPING_PATS, _abs.WINDOW_TOKENS * 7, True),
+            "INTENT": _Marker("INTENT", _intent._MECHANISM_PATS,
+                              _intent.WINDOW_TOKENS * 7, True),
+            "PRESC": _Marker("PRESC", _presc._GROUNDING_PATS,
+                             _presc.WINDOW_TOKENS * 7, False),
+            "SELF": _Marker("SELF", _self._QUAL_PATS, None, False),
+        }
+        self._region = None           # large feed: text[self._region:] is indexed
+        self._region_scan = None      # its qualifier scan, built on first use
+        self._radius = max(m.radius for m in self._markers.values() if m.radius)
+        self._tentative = {tag: [] for tag in _MARKER_TAGS}   # unsettled hits: (k, s, e)
+
+        # Sentences (LOOP, ESC)
+        self._sentence_start = 0      # start of the open (last) sentence
+        self._closed = 0              # sentences closed by a split
+        self._loop_prev = None        # token set of the last closed sentence
+        self._loop_repeats = 0
+        self._loop_first = -1
+        self._esc_result = None       # settled escalation, once found
+        self._esc_queue = []          # closed sentences awaiting settled markers
+        self._esc_index = 0           # index of the next sentence to settle
+        self._esc_prev = None         # (tech, bridge, head) of the last settled sentence
+        self._esc_starts = {tag: [] for tag in _SENTENCE_TAGS}   # settled raw starts
+        self._esc_tentative = {tag: [] for tag in _SENTENCE_TAGS}
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def unsettled(self) -> int:
+        """Characters after the settle frontier; the next feed rescans them."""
+        return self._length - self._frontier
+
+    # ── Input ──
+
+    def append(self, chunk: str) -> Dict:
+        """Extend the text by chunk; returns evaluate_output(text so far)."""
+        self.feed(chunk)
+        return self.result()
+
+    def feed(self, chunk: str) -> None:
+        """Extend the text by chunk."""
+        if not chunk:
+            return
+        # Every split before the old trailing whitespace run was found
+        # already; only that run can still be followed by a capital.
+        split_from = max(self._sentence_start, self._ws_tail)
+        # Every window tested in this feed ends past the old length, so a
+        # radius window starts at most two radii before it
+        self._region = None
+        self._region_scan = None
+        if len(chunk) >= INDEX_CHUNK:
+            self._region = max(self._base, self._length - 2 * self._radius)
+        self._buf += chunk
+        dots = self._dots
+        i = chunk.find(".")
+        while i >= 0:
+            dots.append(self._length + i)
+            i = chunk.find(".", i + 1)
+        stripped = len(chunk.rstrip())
+        if stripped:
+            self._ws_tail = self._length + stripped
+        self._length += len(chunk)
+        self._close_sentences(split_from)
+        self._settle_windows()      # before new hits: keeps per-pattern order
+        self._scan_markers()
+        self._settle_sentences()
+        self._trim()
+
+    def _close_sentences(self, split_from: int) -> None:
+        base = self._base
+        for m in SENT_SPLIT.finditer(self._buf, split_from - base):
+            a, b = self._sentence_start, base + m.start()
+            sentence_set = token_set(self._buf[a - base:b - base])
+            if self._loop_prev is not None:
+                if _loop._jaccard_sets(self._loop_prev, sentence_set) > _loop.LAMBDA:
+                    self._loop_repeats += 1
+                    if self._loop_first < 0:
+                        self._loop_first = self._closed - 1
+            self._loop_prev = sentence_set
+            self._closed += 1
+            if self._esc_result is None:
+                self._esc_queue.append((a, b))
+            self._sentence_start = base + m.end()
+
+    def _scan_markers(self) -> None:
+        base = self._base
+        buf = self._buf
+        start = self._frontier
+
+        # Advance the frontier to the start of the _SETTLE_RUNS-th last run
+        runs = [m.start() for m in _WS_RUN.finditer(buf, start - base)]
+        if len(runs) >= _SETTLE_RUNS:
+            self._frontier = base + runs[-_SETTLE_RUNS]
+        frontier = self._frontier
+
+        scan = _STREAM_SCANNER.scan(buf, start - base)
+        for tag in _MARKER_TAGS:
+            marker = self._markers[tag]
+            tentative = self._tentative[tag] = []
+            for k, raw in enumerate(scan.raw(tag)):
+                end = marker.ends[k]
+                for s, e in raw:
+                    s += base
+                    if s < end:
+                        continue
+                    e += base
+                    end = e
+                    if s < frontier:
+                        marker.ends[k] = e
+                        self._settle_hit(marker, k, s, e)
+                    else:
+                        tentative.append((k, s, e))
+        if self._esc_result is not None:
+            return
+        for tag in _SENTENCE_TAGS:
+            settled = self._esc_starts[tag]
+            tentative = self._esc_tentative[tag] = []
+            for raw in scan.raw(tag):
+                for s, _ in raw:
+                    s += base
+                    (settled if s < frontier else tentative).append(s)
+            settled.sort()
+            tentative.sort()
+
+    # ── Windowed markers ──
+
+    def _rfind_dot(self, pos: int) -> int:
+        """Last '.' before pos, or -1."""
+        i = bisect_left(self._dots, pos)
+        return self._dots[i - 1] if i else self._dot_before_base
+
+    def _window(self, marker: _Marker, s: int) -> Tuple[int, int, bool]:
+        """(cs, ce, closed) of the qualifier window around hit s."""
+        n = self._length
+        if marker.radius is not None:
+            ce = s + marker.radius
+            return max(0, s - marker.radius), min(n, ce), ce <= n
+        dots = self._dots
+        i = bisect_left(dots, s)
+        cs = (dots[i - 1] if i else self._dot_before_base) + 1
+        if i < len(dots):
+            return cs, dots[i] + 1, True
+        return cs, n, False
+
+    def _qualified(self, marker: _Marker, cs: int, ce: int) -> bool:
+        # Hits of one sentence share SELF's window: test it once
+        memo_cs, memo_ce, verdict = marker.memo
+        if cs == memo_cs and ce == memo_ce:
+            return verdict
+        window_text = self._buf[cs - self._base:ce - self._base]
+        region = self._region
+        if region is not None and cs >= region:
+            # Slices of the region are slices of the text: the index is exact
+            scan = self._region_scan
+            if scan is None:
+                scan = self._region_scan = _QUALIFIER_SCANNER.scan(
+                    self._buf[region - self._base:])
+            verdict = scan.window(marker.tag).has(cs - region, ce - region) or any(
+                p.search(window_text) for p in _QUALIFIERS[marker.tag][1])
+        else:
+            verdict = any(p.search(window_text) for p in marker.qualifiers)
+        marker.memo = (cs, ce, verdict)
+        return verdict
+
+    def _settle_hit(self, marker: _Marker, k: int, s: int, e: int) -> None:
+        marker.count[k] += 1
+        if marker.first[k] is None:
+            marker.first[k] = (s, self._buf[s - self._base:e - self._base])
+        if marker.settled():
+            return
+        cs, ce, closed = self._window(marker, s)
+        if closed:
+            self._settle_window(marker, k, s, cs, ce)
+        else:
+            marker.pending[k].append((s, cs))
+
+    def _settle_window(self, marker: _Marker, k: int, s: int, cs: int, ce: int) -> None:
+        if self._qualified(marker, cs, ce):
+            marker.qualified += 1
+        else:
+            marker.unqualified += 1
+            if marker.first_unqualified[k] is None:
+                marker.first_unqualified[k] = s
+
+    def _settle_windows(self) -> None:
+        # Windows close in hit order within a pattern (hit + radius, or
+        # the next '.'), so whatever closes is a prefix of each queue.
+        last_dot = self._rfind_dot(self._length)
+        for marker in self._markers.values():
+            limit = last_dot if marker.radius is None else self._length - marker.radius
+            for k, queue in enumerate(marker.pending):
+                while queue and queue[0][0] <= limit and not marker.settled():
+                    s, cs = queue.popleft()
+                    _, ce, _ = self._window(marker, s)
+                    self._settle_window(marker, k, s, cs, ce)
+            if marker.settled():
+                for queue in marker.pending:
+                    queue.clear()
+
+    # ── Sentences (ESC) ──
+
+    def _sentence_flags(self, a: int, b: int, tentative: bool) -> Tuple[bool, bool, bool]:
+        """(tech, abstract, bridge) raw marker starts in [a, b)."""
+        flags = []
+        for tag in _SENTENCE_TAGS:
+            found = False
+            sources = (self._esc_starts[tag], self._esc_tentative[tag]) if tentative \
+                else (self._esc_starts[tag],)
+            for starts in sources:
+                i = bisect_left(starts, a)
+                if i < len(starts) and starts[i] < b:
+                    found = True
+                    break
+            flags.append(found)
+        return flags[0], flags[1], flags[2]
+
+    def _head(self, a: int, b: int) -> str:
+        return self._buf[a - self._base:min(b, a + 60) - self._base]
+
+    def _esc_step(self, prev, a: int, b: int, tentative: bool):
+        """Fold sentence [a, b) into the ESC chain; (escalation or None, new prev)."""
+        tech, abstract, bridge = self._sentence_flags(a, b, tentative)
+        escalation = None
+        if prev is not None:
+            prev_tech, prev_bridge, prev_head = prev
+            if prev_tech and abstract and not (prev_bridge or bridge):
+                escalation = (prev_head, self._head(a, b))
+        return escalation, (tech, bridge, self._head(a, b))
+
+    def _settle_sentences(self) -> None:
+        if self._esc_result is not None:
+            return
+        queue = self._esc_queue
+        done = 0
+        while done < len(queue) and self._esc_result is None:
+            a, b = queue[done]
+            if b > self._frontier:
+                break
+            escalation, self._esc_prev = self._esc_step(self._esc_prev, a, b, False)
+            if escalation is not None:
+                self._esc_result = _esc._escalation(self._esc_index - 1, *escalation)
+            self._esc_index += 1
+            done += 1
+            for starts in self._esc_starts.values():
+                del starts[:bisect_left(starts, b)]
+        if self._esc_result is not None:
+            queue.clear()
+        else:
+            del queue[:done]
+
+    # ── Buffer ──
+
+    def _trim(self) -> None:
+        """Drop text no open window, sentence or rescan can reach again."""
+        frontier = self._frontier
+        keep = min(frontier - 1, frontier - self._radius,
+                   self._rfind_dot(frontier) + 1, self._sentence_start)
+        for marker in self._markers.values():
+            for queue in marker.pending:
+                if queue:
+                    keep = min(keep, queue[0][1])    # cs grows with s
+        if self._esc_queue:
+            keep = min(keep, self._esc_queue[0][0])
+        drop = keep - self._base
+        if drop <= 0 or drop < len(self._buf) // 2:
+            return    # amortize the copy
+        dots = self._dots
+        i = bisect_left(dots, keep)
+        if i:
+            self._dot_before_base = dots[i - 1]
+            del dots[:i]
+        self._buf = self._buf[drop:]
+        self._base = keep
+        if self._region is not None and self._region_scan is None:
+            self._region = max(self._region, keep)
+
+    # ── Output ──
+
+    def _marker_totals(self, marker: _Marker):
+        """(total, qualified, first hit, first unqualified start) over all hits so far."""
+        count = list(marker.count)
+        first = list(marker.first)
+        first_unqualified = list(marker.first_unqualified)
+        qualified = marker.qualified
+
+        for k, queue in enumerate(marker.pending):
+            for s, _ in queue:
+                if marker.any_only and qualified > 0:
+                    break
+                cs, ce, _ = self._window(marker, s)
+                if self._qualified(marker, cs, ce):
+                    qualified += 1
+                elif first_unqualified[k] is None:
+                    first_unqualified[k] = s
+        for k, s, e in self._tentative[marker.tag]:
+            count[k] += 1
+            if first[k] is None:
+                first[k] = (s, self._buf[s - self._base:e - self._base])
+            if marker.any_only and qualified > 0:
+                continue
+            cs, ce, _ = self._window(marker, s)
+            if self._qualified(marker, cs, ce):
+                qualified += 1
+            elif first_unqualified[k] is None:
+                first_unqualified[k] = s
+
+        lead = next((hit for hit in first if hit is not None), (-1, ""))
+        unqualified = next((s for s in first_unqualified if s is not None), -1)
+        return sum(count), qualified, lead, unqualified
+
+    def _loop_result(self) -> Dict:
+        if self._closed == 0:
+            return _loop._verdict(0, -1)
+        repeats, first = self._loop_repeats, self._loop_first
+        open_set = token_set(self._buf[self._sentence_start - self._base:])
+        if _loop._jaccard_sets(self._loop_prev, open_set) > _loop.LAMBDA:
+            repeats += 1
+            if first < 0:
+                first = self._closed - 1
+        return _loop._verdict(repeats, first)
+
+    def _esc_result_now(self) -> Dict:
+        if self._esc_result is not None:
+            return self._esc_result
+        prev = self._esc_prev
+        index = self._esc_index
+        spans = self._esc_queue + [(self._sentence_start, self._length)]
+        for a, b in spans:
+            escalation, prev = self._esc_step(prev, a, b, True)
+            if escalation is not None:
+                return _esc._escalation(index - 1, *escalation)
+            index += 1
+        return _esc._no_escalation()
+
+    def bounds(self) -> Dict[str, Tuple[int, int]]:
+        """
+        (lowest, highest) severity of each operator over every
+        continuation of the text so far, from settled state only.
+
+        Keys in engine.CONSTRAINTS order. Settled hits, closed windows,
+        closed sentence pairs and a settled escalation never change, so
+        the bounds hold for evaluate_output(text + anything).
+        """
+        h2, absolute, intent, presc, self_ref = (
+            self._markers[tag] for tag in ("H2", "ABS", "INTENT", "PRESC", "SELF"))
+        return {
+            # Any unqualified window rules out 0, any qualified one rules out 2
+            "H2": (1 if h2.unqualified else 0, 1 if h2.qualified else 2),
+            # One qualified window settles these at 0
+            "ABS": (0, 0 if absolute.qualified else 2),
+            "INTENT": (0, 0 if intent.qualified else 2),
+            "ESC": (2, 2) if self._esc_result is not None else (0, 2),
+            "LOOP": (min(2, self._loop_repeats), 2),
+            "PRESC": (min(2, presc.unqualified), 2),
+            "SELF": (min(2, self_ref.unqualified), 2),
+        }
+
+    def result(self) -> Dict:
+        """evaluate_output(text so far)."""
+        totals = {tag: self._marker_totals(self._markers[tag]) for tag in _MARKER_TAGS}
+
+        total, dissolved, (first, _), _ = totals["H2"]
+        h2 = _h2._verdict(total, dissolved, first)
+        total, scoped, (first, sample), _ = totals["ABS"]
+        absolute = _abs._verdict(total, scoped > 0, first, sample)
+        total, backed, (first, _), _ = totals["INTENT"]
+        intent = _intent._verdict(total, backed > 0, first)
+        total, grounded, _, unqualified = totals["PRESC"]
+        presc = _presc._verdict(total, total - grounded, unqualified)
+        total, qualified, _, unqualified = totals["SELF"]
+        self_ref = _self._verdict(total, total - qualified, unqualified)
+
+        # Same order as engine.CONSTRAINTS
+        return _project([h2, absolute, intent, self._esc_result_now(),
+                         self._loop_result(), presc, self_ref])
@@ -0,0 +1,228 @@
+"""
+RC1-Lite Instrumentation
+
+Opt-in, per-operator counters for evaluate_output:
+
+    time_us         wall time of the operator call (microseconds)
+    hits            marker matches in the families the operator read
+    window_checks   qualifier / sentence window queries it issued
+
+The fused scan is recorded as its own stage, "scan". Lazily built
+context (sentences, token sets) is charged to the first operator that
+asks for it, which is where its cost actually lands.
+
+    from rc1_lite.engine import instrumented
+
+    with instrumented() as inst:
+        for y in texts:
+            evaluate_output(y)
+    inst.dump(open("rc1-profile.json", "w"))
+
+Each counter aggregates into a log2-bucketed histogram. Results are
+unaffected: instrumentation only observes. Disabled (the default) it
+costs one global lookup per evaluate_output call. Instrumentation is
+per process; pool workers (rc1_lite.batch) are not observed.
+"""
+
+import json
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from .context import DocumentContext
+from .scanner import Scan
+from .version import VERSION
+
+# Stage name of the shared fused scan
+SCAN_STAGE = "scan"
+
+METRICS = ("time_us", "hits", "window_checks")
+
+
+class Histogram:
+    """
+    Log2-bucketed histogram of non-negative integers.
+
+    Bucket k holds values v with v.bit_length() == k, i.e. upper bound
+    2**k - 1. Quantiles are reported as bucket upper bounds, clamped to
+    the observed maximum.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._buckets = []
+
+    def add(self, value: int) -> None:
+        k = value.bit_length()
+        buckets = self._buckets
+        if k >= len(buckets):
+            buckets.extend([0] * (k + 1 - len(buckets)))
+        buckets[k] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Upper bound of the bucket holding the q-th value (0 < q <= 1)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q))
+        seen = 0
+        for k, n in enumerate(self._buckets):
+            seen += n
+            if seen >= rank:
+                return min((1 << k) - 1, self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """[(upper bound, count)] for every non-empty bucket."""
+        return [((1 << k) - 1, n) for k, n in enumerate(self._buckets) if n]
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+            "buckets": [list(b) for b in self.buckets()],
+        }
+
+
+class Instrumentation:
+    """
+    Aggregated per-stage histograms over many evaluate_output calls.
+
+    Thread-safe: one lock acquisition per evaluated text.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self._stages = {}   # stage -> {metric: Histogram}
+
+    def record(self, samples: Iterable[Tuple[str, int, int, int]]) -> None:
+        """Add one evaluation: (stage, time_us, hits, window_checks) per stage."""
+        with self._lock:
+            self.calls += 1
+            for stage, time_us, hits, windows in samples:
+                hists = self._stages.get(stage)
+                if hists is None:
+                    hists = self._stages[stage] = {m: Histogram() for m in METRICS}
+                hists["time_us"].add(time_us)
+                hists["hits"].add(hits)
+                hists["window_checks"].add(windows)
+
+    def histogram(self, stage: str, metric: str) -> Histogram:
+        """Live histogram of one metric of one stage (KeyError if unseen)."""
+        return self._stages[stage][metric]
+
+    def stages(self) -> List[str]:
+        with self._lock:
+            return list(self._stages)
+
+    def snapshot(self) -> Dict:
+        """JSON-shaped copy of every histogram."""
+        with self._lock:
+            return {
+                "version": VERSION,
+                "calls": self.calls,
+                "stages": {
+                    stage: {metric: hist.to_dict() for metric, hist in hists.items()}
+                    for stage, hists in self._stages.items()
+                },
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def dump(self, fp: TextIO, indent: Optional[int] = 2) -> None:
+        fp.write(self.to_json(indent))
+        fp.write("\n")
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self._stages = {}
+
+
+class ProbeContext(DocumentContext):
+    """
+    DocumentContext that counts what the running operator reads.
+
+    take() returns (hits, window_checks) since the previous take and
+    starts counting afresh for the next operator.
+    """
+
+    __slots__ = ("_hits", "_windows", "_read")
+
+    def __init__(self, text: str, scan: Scan):
+        super().__init__(text, _ProbeScan(scan, self))
+        self._hits = 0
+        self._windows = 0
+        self._read = set()      # families already charged to this operator
+
+    def take(self) -> Tuple[int, int]:
+        counts = (self._hits, self._windows)
+        self._hits = 0
+        self._windows = 0
+        self._read.clear()
+        return counts
+
+    def charge(self, tag: str, matches: int) -> None:
+        if tag not in self._read:
+            self._read.add(tag)
+            self._hits += matches
+
+    def hits(self, tag, patterns):
+        spans = super().hits(tag, patterns)
+        self.charge(tag, len(spans))
+        return spans
+
+    def window_test(self, tag, patterns):
+        test = super().window_test(tag, patterns)
+
+        def counted(cs: int, ce: int) -> bool:
+            self._windows += 1
+            return test(cs, ce)
+
+        return counted
+
+
+class _ProbeScan:
+    """Scan view that charges sentence-window queries to a ProbeContext."""
+
+    __slots__ = ("_scan", "_ctx")
+
+    def __init__(self, scan: Scan, ctx: ProbeContext):
+        self._scan = scan
+        self._ctx = ctx
+
+    def raw(self, tag: str):
+        return self._scan.raw(tag)
+
+    def hits(self, tag: str):
+        return self._scan.hits(tag)
+
+    def starts(self, tag: str):
+        return self._scan.starts(tag)
+
+    def any_start(self, tag: str, lo: int, hi: int) -> bool:
+        ctx = self._ctx
+        ctx.charge(tag, len(self._scan.starts(tag)))
+        ctx._windows += 1
+        return self._scan.any_start(tag, lo, hi)
+
+    def window(self, tag: str):
+        return self._scan.window(tag)
@@ -0,0 +1,445 @@
+"""
+RC1-Lite Lexicon Matcher
+
+Most marker patterns are word lists and short phrases:
+
+    \\b(?:ghost|spirit|soul|heart|blood|veins?)\\b
+    \\bthe\\s+(?:best|only|correct)\\s+(?:way|approach|method)\\b
+    \\b\\w+\\.(?:py|rs|cpp|js|ts|go|java)\\b
+
+Such a pattern denotes a finite, ordered list of phrases: sequences of
+literals, whitespace runs (\\s+, \\s*) and word or digit runs (\\w+, \\d*).
+compile_phrases() derives the list from the parsed regex, in the order
+the regex engine tries the alternatives. It only accepts phrases where
+every run can be taken greedily (nothing after a run could start with
+one of its characters), so a phrase matches at a position in exactly
+one way, or not at all. Anything else (backtick spans, ...) is
+structural and stays a regex.
+
+A leading \\b pins every match to a word run: phrases starting with a
+word character start where a run starts, phrases starting with a
+non-word literal (\\.py) start where a run ends. LexiconMatcher walks
+the \\w runs of y once. Phrases with a literal lead are found through a
+dict keyed by their leading word; \\w- and \\d-led phrases are tried at
+every run. At each position the first phrase of a pattern that matches
+gives that pattern's match, exactly as pattern.match(y, p) would.
+
+Case folding is the regex engine's: a character folds to the lexicon
+character it matches under re.IGNORECASE (so ſ, K and İ behave as in
+re), decided once per distinct character. ASCII text folds with
+str.lower().
+"""
+
+import re
+from typing import List, Optional, Pattern, Sequence, Tuple
+
+from .window import _sc, _sp
+
+Span = Tuple[int, int]
+
+# Phrase elements: (LIT, text) | (SPACE, min) | (RUN, class, min)
+LIT, SPACE, RUN = "lit", "space", "run"
+
+# Where a pattern's phrases may start
+KEYED, WORD_LED, DIGIT_LED, AFTER_WORD = "keyed", "word", "digit", "after"
+
+MAX_PHRASES = 256
+
+_WORD_CHAR = re.compile(r"\w")
+_SPACE_CHAR = re.compile(r"\s")
+_DIGIT_CHAR = re.compile(r"\d")
+
+_RUNS = {
+    _sc.CATEGORY_WORD: "w",
+    _sc.CATEGORY_DIGIT: "d",
+}
+_RUN_CHAR = {"w": _WORD_CHAR, "d": _DIGIT_CHAR}
+_RUN_SPAN = {"w": re.compile(r"\w*"), "d": re.compile(r"\d*")}
+_SPACE_RUN = re.compile(r"\s*")
+_WORD_RUN = re.compile(r"\w+")
+
+_BOUNDARY = (_sc.AT, _sc.AT_BOUNDARY)
+
+
+def _is_word(y: str, i: int) -> bool:
+    return 0 <= i < len(y) and _WORD_CHAR.match(y, i) is not None
+
+
+def _category(item):
+    """Category of a one-item class like [\\s] or \\w, else None."""
+    op, av = item
+    if op is _sc.IN and len(av) == 1 and av[0][0] is _sc.CATEGORY:
+        return av[0][1]
+    return None
+
+
+def _expand(items) -> Optional[List[list]]:
+    """All phrases of a parsed sequence, in regex preference order."""
+    phrases = [[]]
+    for op, av in items:
+        if op is _sc.LITERAL:
+            options = [[(LIT, chr(av))]]
+        elif op is _sc.IN and len(av) <= 8 and all(item_op is _sc.LITERAL for item_op, _ in av):
+            # One char from a small set: members never compete for a char
+            options = [[(LIT, chr(item_av))] for _, item_av in av]
+        elif op is _sc.BRANCH:
+            options = []
+            for branch in av[1]:
+                sub = _expand(branch)
+                if sub is None:
+                    return None
+                options.extend(sub)
+        elif op is _sc.SUBPATTERN:
+            _, add, delete, sub_items = av
+            if add or delete:
+                return None
+            options = _expand(sub_items)
+            if options is None:
+                return None
+        elif op in (_sc.MAX_REPEAT, _sc.MIN_REPEAT):
+            lo, hi, sub_items = av
+            category = _category(sub_items[0]) if len(sub_items) == 1 else None
+            if op is _sc.MAX_REPEAT and hi == _sc.MAXREPEAT and category is _sc.CATEGORY_SPACE:
+                options = [[(SPACE, lo)]]
+            elif op is _sc.MAX_REPEAT and hi == _sc.MAXREPEAT and category in _RUNS:
+                options = [[(RUN, _RUNS[category], lo)]]
+            elif (lo, hi) == (0, 1):
+                sub = _expand(sub_items)
+                if sub is None:
+                    return None
+                options = sub + [[]] if op is _sc.MAX_REPEAT else [[]] + sub
+            else:
+                return None
+        else:
+            return None
+        phrases = [p + o for p in phrases for o in options]
+        if len(phrases) > MAX_PHRASES:
+            return None
+    return phrases
+
+
+def _merge(phrase: list) -> Tuple:
+    """Join adjacent literals, and adjacent runs of one class (\\d+\\d* == \\d+)."""
+    merged = []
+    for element in phrase:
+        last = merged[-1] if merged else None
+        if last and element[0] is LIT and last[0] is LIT:
+            merged[-1] = (LIT, last[1] + element[1])
+        elif last and element[0] is RUN and last[0] is RUN and element[1] == last[1]:
+            merged[-1] = (RUN, last[1], last[2] + element[2])
+        elif last and element[0] is SPACE and last[0] is SPACE:
+            merged[-1] = (SPACE, last[1] + element[1])
+        else:
+            merged.append(element)
+    return tuple(merged)
+
+
+def _greedy_exact(phrase: Tuple) -> bool:
+    """
+    True if consuming every run maximally reproduces the regex match.
+
+    Nothing after a run may start with one of the run's characters; then
+    backtracking into the run can never help. (Word and digit runs end at
+    a word character, so giving some back before a \\b cannot create a
+    boundary either.)
+    """
+    for element, nxt in zip(phrase, phrase[1:]):
+        if element[0] is LIT:
+            continue
+        if nxt[0] is LIT:
+            char = _SPACE_CHAR if element[0] is SPACE else _RUN_CHAR[element[1]]
+            if char.match(nxt[1][0]):
+                return False
+        elif (nxt[0] is SPACE) == (element[0] is SPACE):
+            return False    # \w run next to \d run
+    return True
+
+
+def _lead(phrase: Tuple) -> Optional[str]:
+    """Where a phrase (after a leading \\b) can start, or None."""
+    first = phrase[0]
+    if first[0] is LIT:
+        return KEYED if _WORD_CHAR.match(first[1][0]) else AFTER_WORD
+    if first[0] is RUN and first[2] >= 1:
+        return WORD_LED if first[1] == "w" else DIGIT_LED
+    return None
+
+
+def compile_phrases(pattern: Pattern) -> Optional[Tuple[str, bool, List[Tuple]]]:
+    """
+    (lead, ends_at_boundary, phrases) for a lexicon pattern, or None.
+
+    A lexicon pattern starts with \\b, may end with \\b, and has no other
+    assertion. All its phrases share one lead (see _lead) and match
+    greedily.
+    """
+    if pattern.groups or pattern.flags & (re.M | re.S | re.X | re.A | re.L):
+        return None
+    items = list(_sp.parse(pattern.pattern, pattern.flags))
+    if not items or items[0] != _BOUNDARY:
+        return None
+    ends_at_boundary = len(items) > 1 and items[-1] == _BOUNDARY
+    body = items[1:-1] if ends_at_boundary else items[1:]
+    if _BOUNDARY in body:
+        return None
+    expanded = _expand(body)
+    if not expanded:
+        return None
+    phrases = [_merge(phrase) for phrase in expanded]
+    if not all(phrases):
+        return None
+    leads = {_lead(phrase) for phrase in phrases}
+    if len(leads) != 1 or None in leads:
+        return None
+    if not all(_greedy_exact(phrase) for phrase in phrases):
+        return None
+    return leads.pop(), ends_at_boundary, phrases
+
+
+class _Folding(dict):
+    """
+    str.translate table: char -> the lexicon char it matches under re.I.
+
+    Characters matching no lexicon char map to themselves. Filled lazily,
+    one regex test per lexicon class per distinct character.
+    """
+
+    def __init__(self, chars):
+        super().__init__()
+        self._classes = []          # (representative, regex) per re.I class
+        # ASCII text folds with str.lower(), so classes holding an ASCII
+        # letter are represented by its lowercase form
+        chars = set(chars) | {ch.lower() for ch in chars if ch.isascii()}
+        for ch in sorted(chars, key=lambda c: (not (c.isascii() and c.islower()), c)):
+            if not any(rx.fullmatch(ch) for _, rx in self._classes):
+                self._classes.append((ch, re.compile(re.escape(ch), re.I)))
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        folded = ch
+        for representative, rx in self._classes:
+            if rx.fullmatch(ch):
+                folded = representative
+                break
+        self[code] = folded
+        return folded
+
+    def fold(self, s: str) -> str:
+        return s.translate(self)
+
+
+_TOKEN = re.compile(r"\w+|\W")
+
+
+class _Node:
+    """
+    Trie node over phrase tails.
+
+    Edges: a whole word run, one non-word char, a word prefix (a word
+    that goes on as a \w/\d run), a whitespace run, a \w/\d run.
+    accept lists the (k, rank, ends_at_boundary) phrases ending here.
+    """
+
+    __slots__ = ("words", "chars", "prefixes", "spaces", "runs", "accept")
+
+    def __init__(self):
+        self.words = {}
+        self.chars = {}
+        self.prefixes = {}
+        self.spaces = {}
+        self.runs = {}
+        self.accept = []
+
+    def insert(self, rest: Tuple, k: int, rank: int, ends_at_boundary: bool) -> None:
+        node = self
+        for i, element in enumerate(rest):
+            kind = element[0]
+            if kind is SPACE:
+                node = node.spaces.setdefault(element[1], _Node())
+            elif kind is RUN:
+                node = node.runs.setdefault(element[1:], _Node())
+            else:
+                tokens = _TOKEN.findall(element[1])
+                last = len(tokens) - 1
+                # A final word token may be followed by more word chars if
+                # a run comes next, or if nothing (not even \b) does
+                open_end = rest[i + 1][0] is RUN if i + 1 < len(rest) else not ends_at_boundary
+                for j, token in enumerate(tokens):
+                    if not _WORD_CHAR.match(token):
+                        node = node.chars.setdefault(token, _Node())
+                    elif j == last and open_end:
+                        node = node.prefixes.setdefault(token, _Node())
+                    else:
+                        node = node.words.setdefault(token, _Node())
+        node.accept.append((k, rank, ends_at_boundary))
+
+    def follow(self):
+        """Chars a match through this node must go on with, or None if any."""
+        if self.accept or self.words or self.prefixes or self.spaces or self.runs:
+            return None
+        return set(self.chars)
+
+    def walk(self, y: str, text: str, pos: int, best: dict) -> None:
+        """Record in best[k] = (rank, end) every phrase matching from pos."""
+        if self.accept:
+            boundary = None
+            for k, rank, ends_at_boundary in self.accept:
+                if ends_at_boundary:
+                    if boundary is None:
+                        boundary = _is_word(y, pos - 1) != _is_word(y, pos)
+                    if not boundary:
+                        continue
+                if k not in best or rank < best[k][0]:
+                    best[k] = (rank, pos)
+        if self.words:
+            m = _WORD_RUN.match(y, pos)
+            if m is not None:
+                child = self.words.get(text[pos:m.end()])
+                if child is not None:
+                    child.walk(y, text, m.end(), best)
+        if self.chars:
+            child = self.chars.get(text[pos:pos + 1])
+            if child is not None:
+                child.walk(y, text, pos + 1, best)
+        if self.prefixes:
+            for prefix, child in self.prefixes.items():
+                if text.startswith(prefix, pos):
+                    child.walk(y, text, pos + len(prefix), best)
+        if self.spaces:
+            end = _SPACE_RUN.match(y, pos).end()
+            for low, child in self.spaces.items():
+                if end - pos >= low:
+                    child.walk(y, text, end, best)
+        if self.runs:
+            for (cls, low), child in self.runs.items():
+                end = _RUN_SPAN[cls].match(y, pos).end()
+                if end - pos >= low:
+                    child.walk(y, text, end, best)
+
+
+class LexiconMatcher:
+    """
+    Raw matches of many lexicon patterns in one pass over the word runs.
+
+    scan(y, pos) returns, per pattern, the sorted (start, end) spans of
+    every position p >= pos where pattern.match(y, p) succeeds.
+    """
+
+    def __init__(self, patterns: Sequence[Pattern]):
+        self.patterns = list(patterns)
+        compiled = []
+        for pat in self.patterns:
+            phrases = compile_phrases(pat)
+            if phrases is None:
+                raise ValueError(f"not a lexicon pattern: {pat.pattern!r}")
+            compiled.append(phrases)
+
+        self._folding = _Folding({
+            ch
+            for pat, (_, _, phrases) in zip(self.patterns, compiled) if pat.flags & re.I
+            for phrase in phrases for element in phrase if element[0] is LIT
+            for ch in element[1]
+        })
+
+        # One trie per case mode ([ignorecase]). Phrases starting with a
+        # word enter through the word run at s, \w- and \d-led ones
+        # through a run edge at s, the rest at the run end e.
+        self._starts = (_Node(), _Node())
+        self._ends = (_Node(), _Node())
+        self._ignorecase = False
+        for k, (pat, (lead, ends_at_boundary, phrases)) in enumerate(zip(self.patterns, compiled)):
+            ignorecase = bool(pat.flags & re.I)
+            self._ignorecase = self._ignorecase or ignorecase
+            root = (self._ends if lead is AFTER_WORD else self._starts)[ignorecase]
+            for rank, phrase in enumerate(phrases):
+                if ignorecase:
+                    phrase = tuple((LIT, self._folding.fold(e[1])) if e[0] is LIT else e
+                                   for e in phrase)
+                root.insert(phrase, k, rank, ends_at_boundary)
+
+        self._start_edges = [(ic, self._edges(root)) for ic, root in enumerate(self._starts)
+                             if root.words or root.prefixes or root.runs]
+        self._end_edges = [(ic, root.chars) for ic, root in enumerate(self._ends) if root.chars]
+
+    def fold(self, y: str) -> str:
+        """y case-folded as the regex engine compares it (same length)."""
+        return y.lower() if y.isascii() else self._folding.fold(y)
+
+    @staticmethod
+    def _edges(root: _Node) -> Tuple:
+        """Root edges of one case mode, unpacked for the per-run loop."""
+        width = min(map(len, root.prefixes), default=0)
+        prefixes = {}
+        for prefix, child in root.prefixes.items():
+            prefixes.setdefault(prefix[:width], []).append((prefix, child))
+        runs = {"w": [], "d": []}
+        for (cls, low), child in root.runs.items():
+            runs[cls].append((low, child))
+        # \w-led phrases continue at the run end; most runs end in a char
+        # none of them can continue with
+        follow = set()
+        for _, child in runs["w"]:
+            chars = child.follow()
+            follow = None if chars is None or follow is None else follow | chars
+        return root.words, width, prefixes, runs["w"], follow, runs["d"]
+
+    def scan(self, y: str, pos: int = 0) -> List[List[Span]]:
+        raw = [[] for _ in self.patterns]
+        n = len(y)
+        folded = self.fold(y) if self._ignorecase else y
+        texts = (y, folded)
+        starts = [(texts[ic],) + edges for ic, edges in self._start_edges]
+        ends = [(texts[ic], chars) for ic, chars in self._end_edges]
+
+        def at_end(e: int) -> None:
+            best = None
+            for text, chars in ends:
+                child = chars.get(text[e:e + 1])
+                if child is not None:
+                    best = {} if best is None else best
+                    child.walk(y, text, e + 1, best)
+            if best:
+                for k, (_, end) in best.items():
+                    raw[k].append((e, end))
+
+        if pos > 0 and _is_word(y, pos - 1):
+            # pos is inside or just after a word: no run starts here, but
+            # after-word phrases may start where this run ends
+            pos = _RUN_SPAN["w"].match(y, pos).end()
+            if ends and pos < n:
+                at_end(pos)
+
+        for run in _WORD_RUN.finditer(y, pos):
+            s, e = run.span()
+            best = None
+            for text, words, width, prefixes, word_runs, follow, digit_runs in starts:
+                if words or width:
+                    word = text[s:e]
+                    child = words.get(word)
+                    if child is not None:
+                        best = {} if best is None else best
+                        child.walk(y, text, e, best)
+                    if width and e - s >= width:
+                        for prefix, child in prefixes.get(word[:width], ()):
+                            if word.startswith(prefix):
+                                best = {} if best is None else best
+                                child.walk(y, text, s + len(prefix), best)
+                if word_runs and (follow is None or text[e:e + 1] in follow):
+                    for low, child in word_runs:
+                        if e - s >= low:
+                            best = {} if best is None else best
+                            child.walk(y, text, e, best)
+                if digit_runs and y[s].isdecimal():
+                    d = _RUN_SPAN["d"].match(y, s).end()
+                    for low, child in digit_runs:
+                        if d - s >= low:
+                            best = {} if best is None else best
+                            child.walk(y, text, d, best)
+            if best:
+                for k, (_, end) in best.items():
+                    raw[k].append((s, end))
+            for text, chars in ends:
+                if text[e:e + 1] in chars:
+                    at_end(e)
+                    break
+        return raw
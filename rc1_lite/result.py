@@ -0,0 +1,211 @@
+"""
+RC1-Lite Compact Results
+
+evaluate_result(y) computes exactly what evaluate_output(y) does but
+keeps it as an RC1Result, a slotted object of a few hundred bytes at
+most instead of a tree of dicts and lists:
+
+    severity    bytes, one per operator in CONSTRAINTS order
+    fields      array('q') of (count, count, location) per violation,
+                or None when there is none
+    strings     the few metadata strings (ABS sample, ESC from / to),
+                or None
+
+Only violations (severity > 0) reach the projection, so nothing else of
+an operator's result is kept. taxonomy, violations and to_dict() are
+rebuilt on each access by the operators' own verdict builders, so they
+equal evaluate_output(y) exactly:
+
+    result = evaluate_result(y)
+    result.V, result.gate                    # no dicts built
+    result.severities                        # (0, 2, 0, 0, 1, 0, 0)
+    result.to_dict() == evaluate_output(y)   # always True
+    result["violations"]                     # also a Mapping
+
+The severity vector is the taxonomy vector T(y) weighted: t_i is 1
+exactly where s_i > 0. Results pickle as their packed fields, which
+keeps batch transfers small (rc1_lite.batch, compact=True).
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+from .scoring import compute_gate, compute_score, V_MAX
+from .version import VERSION
+from .constraints import (
+    h2_metaphor as _h2,
+    absolute_claim as _abs,
+    intent_execution as _intent,
+    abstraction_escalation as _esc,
+    rephrasing_loop as _loop,
+    ungrounded_prescriptive as _presc,
+    self_reference as _self,
+)
+
+# Operator types in CONSTRAINTS order
+TYPES = ("H2", "ABS", "INTENT", "ESC", "LOOP", "PRESC", "SELF")
+
+# to_dict() keys, in evaluate_output order
+KEYS = ("score", "V", "V_max", "gate", "taxonomy", "violations", "version")
+
+# Per operator: the metadata counts kept for a violation, and its strings
+_COUNTS = (
+    ("metaphors", "dissolved"),
+    ("absolutes", None),
+    ("intents", None),
+    (None, None),
+    ("repeats", None),
+    ("prescriptives", "ungrounded"),
+    ("self_refs", "unqualified"),
+)
+_STRINGS = ((), ("sample",), (), ("from", "to"), (), (), ())
+
+
+def _rebuild(op: int, first: int, second: int, location: int, strings: Tuple) -> Dict:
+    """Operator op's result from its packed fields, by its own verdict."""
+    if op == 0:
+        return _h2._verdict(first, second, location)
+    if op == 1:
+        return _abs._verdict(first, False, location, strings[0])
+    if op == 2:
+        return _intent._verdict(first, False, location)
+    if op == 3:
+        return _esc._escalation(location, strings[0], strings[1])
+    if op == 4:
+        return _loop._verdict(first, location)
+    if op == 5:
+        return _presc._verdict(first, second, location)
+    return _self._verdict(first, second, location)
+
+
+class RC1Result(Mapping):
+    """
+    P(y), packed. A read-only Mapping equal to evaluate_output(y).
+
+    Build with evaluate_result(y) or RC1Result.pack(results).
+    """
+
+    __slots__ = ("_severity", "_fields", "_strings")
+
+    def __init__(self, severity: bytes, fields: Optional[array] = None,
+                 strings: Optional[Tuple[str, ...]] = None):
+        self._severity = severity
+        self._fields = fields
+        self._strings = strings
+
+    @classmethod
+    def pack(cls, results: List[Dict]) -> "RC1Result":
+        """Pack operator results C_1..C_7 (CONSTRAINTS order)."""
+        severity = bytes(result["severity"] for result in results)
+        fields = None
+        strings = ()
+        for op, result in enumerate(results):
+            if not result["severity"]:
+                continue
+            metadata = result["metadata"]
+            first, second = _COUNTS[op]
+            if fields is None:
+                fields = array("q")
+            fields.extend((metadata[first] if first else 0,
+                           metadata[second] if second else 0,
+                           result["location"]))
+            strings += tuple(metadata[key] for key in _STRINGS[op])
+        return cls(severity, fields, strings or None)
+
+    # ── Scalars, no materialization ──
+
+    @property
+    def V(self) -> int:
+        return sum(self._severity)
+
+    @property
+    def score(self) -> float:
+        return round(compute_score(self.V), 4)
+
+    @property
+    def gate(self) -> str:
+        return compute_gate(compute_score(self.V))
+
+    @property
+    def severities(self) -> Tuple[int, ...]:
+        """Severity per operator, CONSTRAINTS order."""
+        return tuple(self._severity)
+
+    # ── Materialized on access ──
+
+    @property
+    def taxonomy(self) -> Dict[str, int]:
+        return {kind: 1 if s else 0 for kind, s in zip(TYPES, self._severity)}
+
+    @property
+    def violations(self) -> List[Dict]:
+        """Violation dicts, rebuilt on every access."""
+        fields = self._fields
+        strings = self._strings or ()
+        violations = []
+        i = j = 0
+        for op, s in enumerate(self._severity):
+            if not s:
+                continue
+            n = len(_STRINGS[op])
+            violations.append(_rebuild(op, fields[i], fields[i + 1], fields[i + 2],
+                                       strings[j:j + n]))
+            i += 3
+            j += n
+        return violations
+
+    def to_dict(self) -> Dict:
+        """evaluate_output(y), exactly."""
+        v = self.V
+        s = compute_score(v)
+        return {
+            "score": round(s, 4),
+            "V": v,
+            "V_max": V_MAX,
+            "gate": compute_gate(s),
+            "taxonomy": self.taxonomy,
+            "violations": self.violations,
+            "version": VERSION,
+        }
+
+    # ── Mapping ──
+
+    def __getitem__(self, key: str):
+        if key == "V_max":
+            return V_MAX
+        if key == "version":
+            return VERSION
+        if key in KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(KEYS)
+
+    def __len__(self) -> int:
+        return len(KEYS)
+
+    def __contains__(self, key) -> bool:
+        return key in KEYS
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RC1Result):
+            return (self._severity == other._severity and self._fields == other._fields
+                    and self._strings == other._strings)
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        fields = None if self._fields is None else self._fields.tolist()
+        return _unpickle, (self._severity, fields, self._strings)
+
+    def __repr__(self) -> str:
+        return (f"RC1Result(V={self.V}, gate={self.gate!r}, "
+                f"severities={self.severities})")
+
+
+def _unpickle(severity: bytes, fields: Optional[List[int]],
+              strings: Optional[Tuple[str, ...]]) -> RC1Result:
+    return RC1Result(severity, None if fields is None else array("q", fields), strings)
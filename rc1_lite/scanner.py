@@ -0,0 +1,361 @@
+"""
+RC1-Lite Fused Scanner
+
+One pass over y for every lexical marker family.
+
+Each operator owns lists of compiled patterns. Evaluated one by one, a
+document is scanned once per pattern (50+ passes). The fused scanner
+compiles all families into one candidate finder plus, per leading
+character, one tagged matcher:
+
+    candidate p  ->  bucket(y[p])  ->  (?=p_1|...|p_k)(?=(p_1)|)...(?=(p_k)|)
+
+The gate fails fast where nothing matches; where something does, the
+tagged lookaheads report every pattern that matches at p in one call.
+Word-list and phrase patterns skip the regex path entirely: the
+lexicon matcher (rc1_lite.lexicon) finds them with one walk over the
+word runs of y.
+
+Raw hits are all (start, end) positions where pattern.match(y, p)
+succeeds. finditer() semantics (leftmost, non-overlapping) are
+recovered per pattern, so operator hit lists are identical to the
+per-pattern reference scan. Pure function of (families, y).
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from .lexicon import LexiconMatcher, compile_phrases
+from .window import WindowIndex, analyse, _REPEATS, _sc, _sp
+
+
+Span = Tuple[int, int]
+
+_MISSING = object()
+
+_INLINE_FLAGS = ((re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x"))
+_SUPPORTED_FLAGS = re.I | re.M | re.S | re.X | re.U
+
+_CATEGORIES = {
+    _sc.CATEGORY_WORD: r"\w",
+    _sc.CATEGORY_NOT_WORD: r"\W",
+    _sc.CATEGORY_DIGIT: r"\d",
+    _sc.CATEGORY_NOT_DIGIT: r"\D",
+    _sc.CATEGORY_SPACE: r"\s",
+    _sc.CATEGORY_NOT_SPACE: r"\S",
+}
+
+
+def _inline(pattern: Pattern) -> str:
+    """Pattern source with its compile flags scoped inline: (?i:...)."""
+    if pattern.flags & ~_SUPPORTED_FLAGS:
+        raise ValueError(f"unsupported flags on {pattern.pattern!r}")
+    letters = "".join(ch for flag, ch in _INLINE_FLAGS if pattern.flags & flag)
+    if letters:
+        return f"(?{letters}:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+def _char_class(op, av, ignorecase: bool) -> Optional[str]:
+    """Regex source matching exactly the chars a LITERAL/IN node accepts."""
+    if op is _sc.LITERAL:
+        src = re.escape(chr(av))
+    else:
+        parts = []
+        for item_op, item_av in av:
+            if item_op is _sc.LITERAL:
+                parts.append(re.escape(chr(item_av)))
+            elif item_op is _sc.RANGE:
+                parts.append(f"{re.escape(chr(item_av[0]))}-{re.escape(chr(item_av[1]))}")
+            elif item_op is _sc.CATEGORY and item_av in _CATEGORIES:
+                parts.append(_CATEGORIES[item_av])
+            else:
+                return None  # NEGATE, unicode categories, ...
+        src = "[" + "".join(parts) + "]"
+    return f"(?i:{src})" if ignorecase else src
+
+
+def _first(items, flags: int):
+    """
+    Over-approximate the first character of any match.
+
+    Returns (classes, nullable). classes is a list of single-char regex
+    sources, or None when anything may come first. nullable is True if
+    the items can match without consuming a character.
+    """
+    classes = []
+    for op, av in items:
+        if op is _sc.AT:
+            continue
+        if op is _sc.LITERAL or op is _sc.IN:
+            cls = _char_class(op, av, bool(flags & re.I))
+            if cls is None:
+                return None, False
+            classes.append(cls)
+            return classes, False
+        if op is _sc.BRANCH:
+            nullable = False
+            for branch in av[1]:
+                sub, sub_nullable = _first(branch, flags)
+                if sub is None:
+                    return None, False
+                classes.extend(sub)
+                nullable = nullable or sub_nullable
+        elif op is _sc.SUBPATTERN:
+            _, add, delete, sub_items = av
+            sub, nullable = _first(sub_items, (flags | add) & ~delete)
+            if sub is None:
+                return None, False
+            classes.extend(sub)
+        elif op in _REPEATS:
+            lo, _, sub_items = av
+            sub, sub_nullable = _first(sub_items, flags)
+            if sub is None:
+                return None, False
+            classes.extend(sub)
+            nullable = lo == 0 or sub_nullable
+        else:
+            return None, False
+        if not nullable:
+            return classes, False
+    return classes, True
+
+
+def _leader(pattern: Pattern):
+    """
+    (starts_at_boundary, first_char_regex) for one pattern.
+
+    first_char_regex is None when the first character cannot be bounded.
+    """
+    items = list(_sp.parse(pattern.pattern, pattern.flags))
+    classes, nullable = _first(items, pattern.flags)
+    if nullable:
+        raise ValueError(f"pattern may match the empty string: {pattern.pattern!r}")
+    boundary = bool(items) and items[0] == (_sc.AT, _sc.AT_BOUNDARY)
+    if classes is None:
+        return boundary, None
+    return boundary, re.compile("|".join(classes))
+
+
+def finditer_spans(patterns: Sequence[Pattern], y: str) -> List[Span]:
+    """Reference scan: finditer spans, pattern by pattern."""
+    return [m.span() for pat in patterns for m in pat.finditer(y)]
+
+
+def _leftmost(raw: List[Span]) -> List[Span]:
+    """Recover finditer() order from all raw matches of one pattern."""
+    kept = []
+    end = -1
+    for s, e in raw:
+        if s >= end:
+            kept.append((s, e))
+            end = e
+    return kept
+
+
+class Scan:
+    """
+    Fused scan result for one text.
+
+    hits(tag)   -> finditer spans, pattern-major (same order as the
+                   reference loops: pattern 1 hits, then pattern 2, ...)
+    starts(tag) -> sorted start positions of every raw match in a family
+    window(tag) -> WindowIndex answering "family matches in y[cs:ce]"
+    raw(tag)    -> every match position, one sorted span list per pattern
+    """
+
+    __slots__ = ("text", "_raw", "_scanner", "_hits", "_starts", "_windows")
+
+    def __init__(self, text: str, raw: Dict[str, List[List[Span]]],
+                 scanner: "FusedScanner"):
+        self.text = text
+        self._raw = raw
+        self._scanner = scanner
+        self._hits = {}
+        self._starts = {}
+        self._windows = {}
+
+    def raw(self, tag: str) -> List[List[Span]]:
+        return self._raw[tag]
+
+    def hits(self, tag: str) -> List[Span]:
+        hits = self._hits.get(tag)
+        if hits is None:
+            hits = []
+            for raw in self._raw[tag]:
+                hits.extend(_leftmost(raw))
+            self._hits[tag] = hits
+        return hits
+
+    def starts(self, tag: str) -> List[int]:
+        starts = self._starts.get(tag)
+        if starts is None:
+            starts = sorted(s for raw in self._raw[tag] for s, _ in raw)
+            self._starts[tag] = starts
+        return starts
+
+    def any_start(self, tag: str, lo: int, hi: int) -> bool:
+        """True if some raw match of the family starts in [lo, hi)."""
+        starts = self.starts(tag)
+        i = bisect_left(starts, lo)
+        return i < len(starts) and starts[i] < hi
+
+    def window(self, tag: str) -> WindowIndex:
+        index = self._windows.get(tag)
+        if index is None:
+            index = WindowIndex(self.text, self._scanner.edges(tag), self._raw[tag])
+            self._windows[tag] = index
+        return index
+
+
+class StagedScan:
+    """
+    Scan view over several scanners, each run on first use of one of its
+    tags. A caller that may stop early pays only for the families it reads.
+    """
+
+    __slots__ = ("text", "_owner", "_scans")
+
+    def __init__(self, text: str, scanners: Sequence["FusedScanner"]):
+        self.text = text
+        self._owner = {tag: scanner for scanner in scanners for tag in scanner.tags}
+        self._scans = {}
+
+    def _scan(self, tag: str) -> Scan:
+        scanner = self._owner[tag]
+        scan = self._scans.get(id(scanner))
+        if scan is None:
+            scan = self._scans[id(scanner)] = scanner.scan(self.text)
+        return scan
+
+    def raw(self, tag: str) -> List[List[Span]]:
+        return self._scan(tag).raw(tag)
+
+    def hits(self, tag: str) -> List[Span]:
+        return self._scan(tag).hits(tag)
+
+    def starts(self, tag: str) -> List[int]:
+        return self._scan(tag).starts(tag)
+
+    def any_start(self, tag: str, lo: int, hi: int) -> bool:
+        return self._scan(tag).any_start(tag, lo, hi)
+
+    def window(self, tag: str) -> WindowIndex:
+        return self._scan(tag).window(tag)
+
+
+class FusedScanner:
+    """
+    Single-pass scanner over tagged pattern families.
+
+    families: {tag: [compiled pattern, ...]}. Patterns must not contain
+    capturing groups or match the empty string. lexicon=False scans
+    every pattern by regex (the reference for the lexicon matcher).
+    """
+
+    def __init__(self, families: Dict[str, Sequence[Pattern]], lexicon: bool = True):
+        self.families = {tag: list(pats) for tag, pats in families.items()}
+        self.tags = list(self.families)
+        self._slots = []          # flat index -> (tag, pattern_index)
+        self._sources = []        # flat index -> inline source
+        self._first = []          # flat index -> first-char regex or None
+        self._regex = []          # flat indices scanned by regex
+        self._literal = []        # flat indices scanned by the lexicon matcher
+        leaders = set()
+
+        for tag in self.tags:
+            for i, pat in enumerate(self.families[tag]):
+                if pat.groups:
+                    raise ValueError(f"capturing groups not allowed: {pat.pattern!r}")
+                boundary, first = _leader(pat)
+                k = len(self._slots)
+                self._slots.append((tag, i))
+                self._sources.append(_inline(pat))
+                self._first.append(first)
+                if lexicon and compile_phrases(pat) is not None:
+                    self._literal.append(k)
+                    continue
+                self._regex.append(k)
+                if boundary:
+                    leaders.add(r"\b")
+                elif first is None:
+                    leaders.add(r"(?=[\s\S])")
+                else:
+                    leaders.add(f"(?={first.pattern})")
+
+        self._candidates = re.compile("|".join(sorted(leaders))) if leaders else None
+        self._lexicon = (LexiconMatcher([self._pattern(k) for k in self._literal])
+                         if self._literal else None)
+        self._buckets = {}        # char -> (slot indices, matcher) or None
+        self._matchers = {}       # slot indices -> compiled tagged matcher
+        self._edges = {}          # tag -> [PatternEdges] for window queries
+
+    def _pattern(self, k: int) -> Pattern:
+        tag, i = self._slots[k]
+        return self.families[tag][i]
+
+    def edges(self, tag: str) -> list:
+        """Window-edge analysis of a family (rc1_lite.window)."""
+        edges = self._edges.get(tag)
+        if edges is None:
+            edges = [analyse(pat) for pat in self.families[tag]]
+            self._edges[tag] = edges
+        return edges
+
+    def _bucket(self, ch: str):
+        slots = tuple(
+            k for k in self._regex
+            if self._first[k] is None or self._first[k].fullmatch(ch)
+        )
+        entry = None
+        if slots:
+            matcher = self._matchers.get(slots)
+            if matcher is None:
+                gate = "|".join(self._sources[k] for k in slots)
+                tagged = "".join(f"(?=({self._sources[k]})|)" for k in slots)
+                matcher = re.compile(f"(?={gate}){tagged}")
+                self._matchers[slots] = matcher
+            entry = (slots, matcher)
+        self._buckets[ch] = entry
+        return entry
+
+    def scan(self, y: str, pos: int = 0) -> Scan:
+        """
+        Raw matches of every family in y starting at or after pos.
+
+        Matching still sees y[pos - 1] (for \\b), as pattern.match(y, p) does.
+        """
+        raw = [[] for _ in self._slots]
+        n = len(y)
+        buckets = self._buckets
+
+        if self._lexicon is not None:
+            for k, spans in zip(self._literal, self._lexicon.scan(y, pos)):
+                raw[k] = spans
+
+        candidates = self._candidates.finditer(y, pos) if self._candidates is not None else ()
+        for cand in candidates:
+            p = cand.start()
+            if p >= n:
+                break
+            ch = y[p]
+            entry = buckets.get(ch, _MISSING)
+            if entry is _MISSING:
+                entry = self._bucket(ch)
+            if entry is None:
+                continue
+            slots, matcher = entry
+            m = matcher.match(y, p)
+            if m is None:
+                continue
+            regs = m.regs
+            for j, k in enumerate(slots, 1):
+                s, e = regs[j]
+                if s >= 0:
+                    raw[k].append((s, e))
+
+        by_tag = {tag: [] for tag in self.tags}
+        for (tag, _), spans in zip(self._slots, raw):
+            by_tag[tag].append(spans)
+        return Scan(y, by_tag, self)
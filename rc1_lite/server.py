@@ -0,0 +1,584 @@
+"""
+RC1-Lite Evaluation Server
+
+Stdlib asyncio front end to evaluate_output over a worker pool:
+
+    python -m rc1_lite.server --port 8080 --jobs 4
+    python -m rc1_lite.server --port 8080 --unix /run/rc1.sock
+
+HTTP/1.1, persistent connections unless "Connection: close":
+
+    POST /evaluate      {"text": ...}  ->  evaluate_output(text)
+    GET  /metrics       Prometheus text exposition
+    GET  /health        {"status": "ok", "version": ...}
+
+Unix socket (--unix), one JSON record per line, as rc1_lite.cli reads
+them; answers come back one line each, in request order:
+
+    {"id": 7, "text": "..."}   ->   {"id": 7, "score": ..., "gate": ...}
+
+A connection reads at most LINE_PIPELINE records ahead of the answers
+written; a client that sends faster than it reads is made to wait,
+not refused.
+
+Requests are micro-batched. The dispatcher takes the first queued text,
+waits for a free worker, then collects whatever else arrives within
+batch_window_ms (up to max_batch texts) and ships the lot as one pool
+task, so a busy server forms larger batches on its own. Workers return
+packed RC1Results (rc1_lite.result), which keeps the pickles small.
+
+At most max_pending texts are admitted and unanswered at any time;
+beyond that, HTTP answers 429 with Retry-After and the line protocol
+{"id": ..., "error": "overloaded"}. Every result is exactly
+evaluate_output(text).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .batch import DEFAULT_CHUNKSIZE, _evaluate_chunk, _resolve_jobs
+from .instrument import Histogram
+from .result import RC1Result
+from .version import VERSION
+
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_MAX_BODY = 4 << 20
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+# Request line plus headers
+MAX_HEADER_BYTES = 16 << 10
+
+# Line protocol: records read ahead of the answers written, per connection
+LINE_PIPELINE = 256
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    408: "Request Timeout", 411: "Length Required", 413: "Payload Too Large",
+    429: "Too Many Requests", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 501: "Not Implemented",
+    505: "HTTP Version Not Supported",
+}
+
+
+class Overloaded(Exception):
+    """More than max_pending texts are waiting for an answer."""
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class EvaluationServer:
+    """
+    Micro-batching evaluation service.
+
+        server = EvaluationServer(jobs=4)
+        await server.start(port=8080)
+        result = await server.evaluate(text)   # in-process callers too
+        await server.close()
+
+    jobs: worker processes (None or <= 0: one per CPU; 1: one worker
+    thread in this process). A worker runs one batch at a time.
+    """
+
+    def __init__(self, jobs: Optional[int] = None,
+                 batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+                 max_batch: int = DEFAULT_CHUNKSIZE,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 max_body: int = DEFAULT_MAX_BODY,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 mp_context=None):
+        if batch_window_ms < 0:
+            raise ValueError("batch_window_ms must be >= 0")
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.jobs = _resolve_jobs(jobs)
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_body = max_body
+        self.idle_timeout = idle_timeout
+        self._mp_context = mp_context
+
+        self._executor = None
+        self._queue = None          # (text, future, enqueued at)
+        self._slots = None          # one per worker
+        self._dispatcher = None
+        self._servers = []
+        self._connections = set()
+        self._batches = set()
+        self.pending = 0
+
+        self.started_at = None
+        self.requests = {}          # (protocol, status) -> count
+        self.evaluations = 0
+        self.rejected = 0
+        self.batch_sizes = Histogram()
+        self.latency_us = Histogram()
+
+    # ── Lifecycle ──
+
+    async def start(self, host: Optional[str] = "127.0.0.1", port: Optional[int] = 0,
+                    unix_path: Optional[str] = None) -> None:
+        """
+        Start the pool and listeners.
+
+        HTTP on (host, port) unless port is None (0 picks a free port,
+        see http_address); the line protocol on unix_path if given.
+        """
+        if self.jobs == 1:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs,
+                                                 mp_context=self._mp_context)
+            # Workers start lazily; start them all before any listener
+            # exists, so a forked worker inherits no server or client socket.
+            # jobs concurrent no-ops find no idle worker and spawn one each.
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(self._executor, os.getpid)
+                                   for _ in range(self.jobs)))
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.jobs)
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+        self.started_at = time.time()
+        if port is not None:
+            self._servers.append(await asyncio.start_server(
+                self._serve_http, host, port, limit=MAX_HEADER_BYTES))
+        if unix_path is not None:
+            self._servers.append(await asyncio.start_unix_server(
+                self._serve_lines, unix_path, limit=self.max_body))
+
+    @property
+    def http_address(self) -> Optional[Tuple[str, int]]:
+        """(host, port) the HTTP listener is bound to, or None."""
+        for server in self._servers:
+            for sock in server.sockets:
+                if isinstance(sock.getsockname(), tuple):
+                    return sock.getsockname()[:2]
+        return None
+
+    async def serve_forever(self) -> None:
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        """Stop listening, drop open connections, finish admitted work, stop the pool."""
+        for server in self._servers:
+            server.close()
+        for writer in list(self._connections):
+            writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        while self.pending and self._dispatcher is not None and not self._dispatcher.done():
+            await asyncio.sleep(0.005)
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "EvaluationServer":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # ── Evaluation ──
+
+    async def evaluate(self, text: str) -> RC1Result:
+        """evaluate_result(text), batched with concurrent callers. Raises Overloaded."""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise Overloaded(f"{self.pending} requests pending")
+        future = asyncio.get_running_loop().create_future()
+        self.pending += 1
+        self._queue.put_nowait((text, future, time.perf_counter_ns()))
+        try:
+            return await future
+        finally:
+            self.pending -= 1
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await self._slots.acquire()
+            self._drain(batch)
+            if len(batch) < self.max_batch and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+                self._drain(batch)
+            task = loop.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    def _drain(self, batch: List) -> None:
+        queue = self._queue
+        while len(batch) < self.max_batch and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    async def _run(self, batch: List) -> None:
+        """Evaluate one batch on the pool and settle its futures."""
+        try:
+            live = [item for item in batch if not item[1].done()]
+            if not live:
+                return
+            self.batch_sizes.add(len(live))
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, _evaluate_chunk, [text for text, _, _ in live], True)
+            except Exception as exc:
+                for _, future, _ in live:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+            now = time.perf_counter_ns()
+            for (_, future, enqueued), result in zip(live, results):
+                self.evaluations += 1
+                self.latency_us.add((now - enqueued) // 1000)
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    def _count(self, protocol: str, status: int) -> None:
+        key = (protocol, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+    # ── HTTP/1.1 ──
+
+    async def _serve_http(self, reader: asyncio.StreamReader,
+                          writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader),
+                                                     self.idle_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except _HTTPError as exc:
+                    self._count("http", exc.status)
+                    await self._respond(writer, exc.status, {"error": str(exc)}, False)
+                    break
+                if request is None:
+                    break
+                method, path, keep_alive, body = request
+                status, payload, headers = await self._route(method, path, body)
+                self._count("http", status)
+                await self._respond(writer, status, payload, keep_alive, headers)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """(method, path, keep_alive, body), or None at a clean EOF."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial.strip():
+                return None
+            raise _HTTPError(400, "incomplete request head")
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(431, "request head too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split()
+        if len(parts) != 3:
+            raise _HTTPError(400, "malformed request line")
+        method, target, version = parts
+        if version not in ("HTTP/1.1", "HTTP/1.0"):
+            raise _HTTPError(505, f"unsupported version {version}")
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise _HTTPError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        if "transfer-encoding" in headers:
+            raise _HTTPError(501, "transfer-encoding is not supported; send Content-Length")
+        body = b""
+        if "content-length" in headers:
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                raise _HTTPError(400, "invalid Content-Length")
+            if length < 0:
+                raise _HTTPError(400, "invalid Content-Length")
+            if length > self.max_body:
+                raise _HTTPError(413, f"body exceeds {self.max_body} bytes")
+            body = await reader.readexactly(length)
+        elif method == "POST":
+            raise _HTTPError(411, "Content-Length required")
+        return method, target.split("?", 1)[0], keep_alive, body
+
+    async def _route(self, method: str, path: str, body: bytes):
+        """(status, payload, extra headers); payload is a dict or preformatted str."""
+        if path == "/evaluate":
+            if method != "POST":
+                return 405, {"error": "use POST"}, {"Allow": "POST"}
+            try:
+                obj = json.loads(body)
+            except ValueError as exc:
+                return 400, {"error": f"invalid JSON: {exc}"}, {}
+            if not isinstance(obj, dict) or not isinstance(obj.get("text"), str):
+                return 400, {"error": "expected {\"text\": string}"}, {}
+            try:
+                result = await self.evaluate(obj["text"])
+            except Overloaded as exc:
+                return 429, {"error": f"overloaded: {exc}"}, {"Retry-After": "1"}
+            except Exception as exc:
+                return 500, {"error": f"{type(exc).__name__}: {exc}"}, {}
+            return 200, result.to_dict(), {}
+        if path == "/metrics":
+            if method != "GET":
+                return 405, {"error": "use GET"}, {"Allow": "GET"}
+            return 200, self.metrics(), {}
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "use GET"}, {"Allow": "GET"}
+            return 200, {"status": "ok", "version": VERSION}, {}
+        return 404, {"error": f"no route {path}"}, {}
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload,
+                       keep_alive: bool, headers: Optional[Dict] = None) -> None:
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            content_type = "application/json"
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    # ── Line protocol ──
+
+    async def _serve_lines(self, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        """Read records as they come; answer them in order as they finish."""
+        self._connections.add(writer)
+        # Bounded: a client that pipelines faster than it reads stops being read
+        answers = asyncio.Queue(maxsize=LINE_PIPELINE)
+        loop = asyncio.get_running_loop()
+        sender = loop.create_task(self._send_lines(answers, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await answers.put(self._line_error(None, "record too long"))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    await answers.put(loop.create_task(self._answer_line(line)))
+        finally:
+            await answers.put(None)
+            try:
+                await sender
+            except ConnectionError:
+                pass
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _send_lines(self, answers: asyncio.Queue,
+                          writer: asyncio.StreamWriter) -> None:
+        # Keeps taking answers after a write fails, so the reader never
+        # blocks on a full queue; the error is raised at the end
+        failed = None
+        while True:
+            answer = await answers.get()
+            if answer is None:
+                if failed is not None:
+                    raise failed
+                return
+            row = await answer if isinstance(answer, asyncio.Task) else answer
+            if failed is not None:
+                continue
+            try:
+                writer.write(json.dumps(row).encode("utf-8") + b"\n")
+                await writer.drain()
+            except ConnectionError as exc:
+                failed = exc
+
+    def _line_error(self, rid, message: str) -> Dict:
+        self._count("line", 400)
+        return {"id": rid, "error": message}
+
+    async def _answer_line(self, line: bytes) -> Dict:
+        try:
+            obj = json.loads(line)
+        except ValueError as exc:
+            return self._line_error(None, f"invalid JSON: {exc}")
+        if not isinstance(obj, dict):
+            return self._line_error(None, "record is not an object")
+        rid = obj.get("id")
+        if not isinstance(obj.get("text"), str):
+            return self._line_error(rid, "missing or non-string field 'text'")
+        try:
+            result = await self.evaluate(obj["text"])
+        except Overloaded:
+            self._count("line", 429)
+            return {"id": rid, "error": "overloaded"}
+        except Exception as exc:
+            self._count("line", 500)
+            return {"id": rid, "error": f"{type(exc).__name__}: {exc}"}
+        self._count("line", 200)
+        row = {"id": rid}
+        row.update(result.to_dict())
+        return row
+
+    # ── Metrics ──
+
+    def metrics(self) -> str:
+        """Prometheus text exposition of the server counters."""
+        out = []
+
+        def metric(name: str, kind: str, help_text: str, samples) -> None:
+            out.append(f"# HELP rc1_{name} {help_text}")
+            out.append(f"# TYPE rc1_{name} {kind}")
+            for labels, value in samples:
+                out.append(f"rc1_{name}{labels} {value}")
+
+        def histogram(name: str, help_text: str, hist: Histogram) -> None:
+            samples = []
+            seen = 0
+            for upper, n in hist.buckets():
+                seen += n
+                samples.append((f'_bucket{{le="{upper}"}}', seen))
+            samples.append(('_bucket{le="+Inf"}', hist.count))
+            samples.append(("_sum", hist.total))
+            samples.append(("_count", hist.count))
+            metric(name, "histogram", help_text, samples)
+
+        metric("info", "gauge", "Engine version.", [(f'{{version="{VERSION}"}}', 1)])
+        metric("uptime_seconds", "gauge", "Seconds since start.",
+               [("", round(time.time() - (self.started_at or time.time()), 3))])
+        metric("requests_total", "counter", "Requests answered, by protocol and status.",
+               [(f'{{protocol="{p}",status="{s}"}}', n)
+                for (p, s), n in sorted(self.requests.items())])
+        metric("evaluations_total", "counter", "Texts evaluated.", [("", self.evaluations)])
+        metric("rejected_total", "counter", "Texts refused with 429 / overloaded.",
+               [("", self.rejected)])
+        metric("pending", "gauge", "Texts admitted and not yet answered.",
+               [("", self.pending)])
+        metric("queued", "gauge", "Texts waiting for a batch.",
+               [("", self._queue.qsize() if self._queue is not None else 0)])
+        metric("batches_in_flight", "gauge", "Batches on the pool.",
+               [("", len(self._batches))])
+        metric("workers", "gauge", "Pool workers.", [("", self.jobs)])
+        histogram("batch_size", "Texts per pool task (log2 buckets).", self.batch_sizes)
+        histogram("latency_us", "Enqueue to result, microseconds (log2 buckets).",
+                  self.latency_us)
+        return "\n".join(out) + "\n"
+
+
+# ── CLI ──
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m rc1_lite.server",
+        description=f"RC1-Lite evaluation server ({VERSION}).",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080,
+                        help="HTTP port (default 8080; -1 disables HTTP)")
+    parser.add_argument("--unix", default=None, metavar="PATH",
+                        help="also serve the line protocol on this Unix socket")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="worker processes (0: one per CPU; 1: one thread)")
+    parser.add_argument("--batch-window-ms", type=float, default=DEFAULT_BATCH_WINDOW_MS,
+                        help=f"time to gather a batch (default {DEFAULT_BATCH_WINDOW_MS:g})")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"texts per batch (default {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help=f"admitted, unanswered texts before 429 (default {DEFAULT_MAX_PENDING})")
+    parser.add_argument("--max-body", type=int, default=DEFAULT_MAX_BODY,
+                        help=f"largest request body or line in bytes (default {DEFAULT_MAX_BODY})")
+    return parser
+
+
+async def _serve(args) -> None:
+    server = EvaluationServer(jobs=args.jobs, batch_window_ms=args.batch_window_ms,
+                              max_batch=args.max_batch, max_pending=args.max_pending,
+                              max_body=args.max_body)
+    await server.start(args.host, None if args.port < 0 else args.port, args.unix)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    where = []
+    if server.http_address:
+        where.append("http://%s:%d" % server.http_address)
+    if args.unix:
+        where.append(f"unix:{args.unix}")
+    sys.stderr.write(f"rc1_lite {VERSION}: serving on {', '.join(where)} "
+                     f"with {server.jobs} workers\n")
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.port < 0 and not args.unix:
+        parser.error("nothing to serve: --port -1 needs --unix")
+    if args.batch_window_ms < 0:
+        parser.error("--batch-window-ms must be >= 0")
+    if args.max_batch < 1 or args.max_pending < 1:
+        parser.error("--max-batch and --max-pending must be >= 1")
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
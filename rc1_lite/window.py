@@ -0,0 +1,243 @@
+"""
+RC1-Lite Window Qualification Index
+
+Answers, for a family of qualifier patterns,
+
+    any(p.search(y[cs:ce]) for p in family)
+
+from one full-text scan plus a bisect over sorted match starts, instead
+of re-running every pattern on every window slice.
+
+Slicing only changes what a pattern sees at the two cut points:
+
+    - a full-text match strictly inside (cs, ce) is a slice match;
+    - a full-text match touching a cut is re-checked on the slice;
+    - a cut through a word makes \\b true where it was false, so
+      boundary-led patterns are re-tried at the start of the slice and
+      boundary-ended patterns on the few tokens before its end.
+
+Everything else is invisible to the slice, so the answer is exact.
+Patterns may use \\b only at their edges and no lookarounds.
+"""
+
+from bisect import bisect_left
+from typing import Callable, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+try:  # Python >= 3.11
+    from re import _constants as _sc
+    from re import _parser as _sp
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sc
+    import sre_parse as _sp
+
+_REPEATS = tuple(
+    getattr(_sc, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sc, name)
+)
+
+# Every str.isspace() code point lies below U+3001
+_SPACES = frozenset(c for c in range(0x3001) if chr(c).isspace())
+
+_SPACE_CATEGORIES = {
+    _sc.CATEGORY_SPACE, _sc.CATEGORY_NOT_WORD, _sc.CATEGORY_NOT_DIGIT,
+}
+
+
+class PatternEdges(NamedTuple):
+    """Edge behaviour of one qualifier pattern."""
+    pattern: Pattern
+    lead: bool              # first item is \b
+    trail: bool             # last item is \b
+    reach: Optional[int]    # max whitespace runs one match touches (None = unbounded)
+
+
+def _check_assertions(items, top: bool) -> None:
+    """Reject lookarounds and any \\b not at the pattern's edges."""
+    last = len(items) - 1
+    for i, (op, av) in enumerate(items):
+        if op is _sc.AT:
+            if not (top and av is _sc.AT_BOUNDARY and i in (0, last)):
+                raise ValueError(f"unsupported assertion {av}")
+        elif op in (_sc.ASSERT, _sc.ASSERT_NOT):
+            raise ValueError("lookarounds are not supported")
+        elif op is _sc.BRANCH:
+            for branch in av[1]:
+                _check_assertions(branch, False)
+        elif op is _sc.SUBPATTERN:
+            _check_assertions(av[3], False)
+        elif op in _REPEATS:
+            _check_assertions(av[2], False)
+
+
+def _space_kind(op, av) -> int:
+    """For one single-char node: 0 never whitespace, 1 only whitespace, 2 either."""
+    if op is _sc.LITERAL:
+        return 1 if av in _SPACES else 0
+    if op is _sc.IN:
+        kinds = set()
+        for item_op, item_av in av:
+            if item_op is _sc.LITERAL:
+                kinds.add(1 if item_av in _SPACES else 0)
+            elif item_op is _sc.RANGE:
+                lo, hi = item_av
+                kinds.add(2 if any(lo <= c <= hi for c in _SPACES) else 0)
+            elif item_op is _sc.CATEGORY:
+                if item_av is _sc.CATEGORY_SPACE:
+                    kinds.add(1)
+                elif item_av in _SPACE_CATEGORIES:
+                    kinds.add(2)
+                else:
+                    kinds.add(0)
+            else:
+                kinds.add(2)
+        if kinds == {1}:
+            return 1
+        return 2 if kinds - {0} else 0
+    return 2  # NOT_LITERAL, ANY
+
+
+def _reach(items) -> Optional[int]:
+    """Upper bound on whitespace runs a match of items can touch."""
+    total = 0
+    for op, av in items:
+        if op is _sc.AT:
+            continue
+        if op in (_sc.LITERAL, _sc.IN, _sc.NOT_LITERAL, _sc.ANY):
+            total += 1 if _space_kind(op, av) else 0
+        elif op is _sc.BRANCH:
+            reaches = [_reach(branch) for branch in av[1]]
+            if None in reaches:
+                return None
+            total += max(reaches)
+        elif op is _sc.SUBPATTERN:
+            sub = _reach(av[3])
+            if sub is None:
+                return None
+            total += sub
+        elif op in _REPEATS:
+            lo, hi, sub_items = av
+            sub = _reach(sub_items)
+            if sub is None:
+                return None
+            if sub == 0:
+                continue
+            if (len(sub_items) == 1
+                    and sub_items[0][0] in (_sc.LITERAL, _sc.IN)
+                    and _space_kind(*sub_items[0]) == 1):
+                total += 1    # a repeated whitespace class is one run
+            elif hi is _sc.MAXREPEAT:
+                return None
+            else:
+                total += sub * hi
+        else:
+            return None
+    return total
+
+
+def analyse(pattern: Pattern) -> PatternEdges:
+    """Edge behaviour of a qualifier pattern; ValueError if unsupported."""
+    items = list(_sp.parse(pattern.pattern, pattern.flags))
+    _check_assertions(items, True)
+    boundary = (_sc.AT, _sc.AT_BOUNDARY)
+    return PatternEdges(
+        pattern=pattern,
+        lead=bool(items) and items[0] == boundary,
+        trail=bool(items) and items[-1] == boundary,
+        reach=_reach(items),
+    )
+
+
+def _is_word(ch: str) -> bool:
+    """\\w for str patterns (alnum or underscore)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _tail_start(window: str, runs: Optional[int]) -> int:
+    """Start of the shortest suffix holding `runs` whitespace runs before a final token."""
+    if runs is None:
+        return 0
+    seen = 0
+    in_space = False
+    for i in range(len(window) - 1, -1, -1):
+        if window[i].isspace():
+            if not in_space:
+                seen += 1
+                if seen > runs:
+                    return i + 1
+                in_space = True
+        else:
+            in_space = False
+    return 0
+
+
+class WindowIndex:
+    """
+    Qualifier-position index for one family over one text.
+
+    has(cs, ce) == any(p.search(text[cs:ce]) for p in family)
+    """
+
+    __slots__ = ("text", "edges", "starts", "ends", "which")
+
+    def __init__(self, text: str, edges: Sequence[PatternEdges],
+                 raw: Sequence[List[Tuple[int, int]]]):
+        merged = sorted(
+            (s, e, k) for k, spans in enumerate(raw) for s, e in spans
+        )
+        self.text = text
+        self.edges = edges
+        self.starts = [s for s, _, _ in merged]
+        self.ends = [e for _, e, _ in merged]
+        self.which = [k for _, _, k in merged]
+
+    def has(self, cs: int, ce: int) -> bool:
+        y = self.text
+        n = len(y)
+        if cs >= ce:
+            return False
+        starts = self.starts
+        window = None
+
+        # Full-text matches starting inside the window
+        i = bisect_left(starts, cs)
+        while i < len(starts) and starts[i] < ce:
+            s = starts[i]
+            if s > cs and self.ends[i] < ce:
+                return True
+            if window is None:
+                window = y[cs:ce]
+            if self.edges[self.which[i]].pattern.match(window, s - cs):
+                return True
+            i += 1
+
+        # Cut through a word at the start: slice sees a boundary at 0
+        if cs > 0 and _is_word(y[cs - 1]) and _is_word(y[cs]):
+            if window is None:
+                window = y[cs:ce]
+            for edge in self.edges:
+                if edge.lead and edge.pattern.match(window):
+                    return True
+
+        # Cut through a word at the end: slice sees a boundary at ce
+        if ce < n and _is_word(y[ce - 1]) and _is_word(y[ce]):
+            if window is None:
+                window = y[cs:ce]
+            tails = {}
+            for edge in self.edges:
+                if not edge.trail:
+                    continue
+                rel = tails.get(edge.reach)
+                if rel is None:
+                    rel = tails[edge.reach] = _tail_start(window, edge.reach)
+                if edge.pattern.search(window, rel):
+                    return True
+
+        return False
+
+
+def slice_search(patterns: Sequence[Pattern], y: str) -> Callable[[int, int], bool]:
+    """Reference window test: search every pattern on the slice y[cs:ce]."""
+    def has(cs: int, ce: int) -> bool:
+        window_text = y[cs:ce]
+        return any(p.search(window_text) for p in patterns)
+    return has
@@ -48,9 +48,18 @@ sys.path.insert(0, '/home/claude')
 
 from fractions import Fraction
 from dataclasses import dataclass
-import hashlib, json, time, math, random
+import hashlib, json, time, math, numbers, random
+from array import array
 
-from tent_stack import RC2
+try:
+    from tent_stack import RC2
+except ImportError:  # Atom.gate makes the same exact comparison itself
+    RC2 = None
+
+try:
+    import numpy as np
+except ImportError:  # AtomBatch falls back to the stdlib array module
+    np = None
 
 
 # ═════════════════════════════════════════════════════
@@ -146,8 +155,11 @@ class Atom:
         """
         RC2 decision: score > threshold.
         Uses integer cross-multiplication. No float comparison.
-        Equivalent to Δ > 0 when threshold = 1/2.
+        Equivalent to Δ > 0 when threshold = 1/2. Without tent_stack,
+        the same comparison on Fractions.
         """
+        if RC2 is None:
+            return Fraction(self.score) > Fraction(threshold)
         return RC2(S=self.score, threshold=threshold).gate()
 
     # ── Matrix form ──
@@ -166,6 +178,162 @@ class Atom:
         }
 
 
+# ═════════════════════════════════════════════════════
+# §1a. INTEGER-SCALED ATOM
+# ═════════════════════════════════════════════════════
+#
+# Atom pays a gcd normalization for every Fraction its properties build,
+# on every access. ScaledAtom keeps the four gains as integer numerators
+# over one shared denominator D:
+#
+#     β = b/D,  κ = k/D,  α = a/D,  γ = g/D
+#
+#     Δ = (bk − ag) / D²     ρ = ag / bk     score = bk / (bk + ag)
+#
+# so every sign decision is one integer comparison, bk ⋛ ag, and Δ, ρ,
+# score and trace are built once, on first use. Same values, same
+# verdicts: anything that takes an Atom takes a ScaledAtom.
+
+def _lcm(a: int, b: int) -> int:
+    return a // math.gcd(a, b) * b
+
+
+class ScaledAtom:
+    """
+    Exact 2×2 atom on integer numerators b, k, a, g over denominator den.
+
+    Interchangeable with Atom: same properties and methods, equal to the
+    Atom with the same gains (and hashes like it).
+    """
+
+    __slots__ = ("b", "k", "a", "g", "den", "_bk", "_ag",
+                 "_gains", "_delta", "_rho", "_score", "_trace")
+
+    def __init__(self, b: int, k: int, a: int, g: int, den: int = 1):
+        for name, val in (("beta", b), ("kappa", k), ("alpha", a), ("gamma", g),
+                          ("den", den)):
+            if not isinstance(val, int):
+                raise TypeError(f"{name} numerator must be int, got {type(val).__name__}")
+            if val <= 0:
+                raise ValueError(f"{name} must be positive, got {val}")
+        self.b, self.k, self.a, self.g, self.den = b, k, a, g, den
+        self._bk = b * k
+        self._ag = a * g
+        self._gains = self._delta = self._rho = self._score = self._trace = None
+
+    @classmethod
+    def from_fractions(cls, beta, kappa, alpha, gamma) -> "ScaledAtom":
+        """From four gains (anything Fraction() takes), over their common denominator."""
+        gains = [Fraction(x) for x in (beta, kappa, alpha, gamma)]
+        den = 1
+        for x in gains:
+            den = _lcm(den, x.denominator)
+        return cls(*(x.numerator * (den // x.denominator) for x in gains), den=den)
+
+    @classmethod
+    def from_atom(cls, atom: Atom) -> "ScaledAtom":
+        return cls.from_fractions(atom.beta, atom.kappa, atom.alpha, atom.gamma)
+
+    def to_atom(self) -> Atom:
+        return Atom(self.beta, self.kappa, self.alpha, self.gamma)
+
+    # ── Gains, as Fractions ──
+
+    def _fractions(self) -> tuple:
+        if self._gains is None:
+            d = self.den
+            self._gains = (Fraction(self.b, d), Fraction(self.k, d),
+                           Fraction(self.a, d), Fraction(self.g, d))
+        return self._gains
+
+    @property
+    def beta(self) -> Fraction:
+        return self._fractions()[0]
+
+    @property
+    def kappa(self) -> Fraction:
+        return self._fractions()[1]
+
+    @property
+    def alpha(self) -> Fraction:
+        return self._fractions()[2]
+
+    @property
+    def gamma(self) -> Fraction:
+        return self._fractions()[3]
+
+    # ── Core invariants (cached) ──
+
+    @property
+    def delta(self) -> Fraction:
+        """Δ = (bk − ag) / D²."""
+        if self._delta is None:
+            self._delta = Fraction(self._bk - self._ag, self.den * self.den)
+        return self._delta
+
+    @property
+    def rho(self) -> Fraction:
+        """ρ = ag / bk (D² cancels)."""
+        if self._rho is None:
+            self._rho = Fraction(self._ag, self._bk)
+        return self._rho
+
+    @property
+    def trace(self) -> Fraction:
+        """tr(A) = −(b + k) / D."""
+        if self._trace is None:
+            self._trace = Fraction(-(self.b + self.k), self.den)
+        return self._trace
+
+    @property
+    def score(self) -> Fraction:
+        """score = bk / (bk + ag) (D² cancels)."""
+        if self._score is None:
+            self._score = Fraction(self._bk, self._bk + self._ag)
+        return self._score
+
+    # ── Sign decisions: integers only ──
+
+    @property
+    def delta_sign(self) -> int:
+        """sign(Δ) = sign(bk − ag): 1, 0 or −1."""
+        return (self._bk > self._ag) - (self._bk < self._ag)
+
+    @property
+    def phase(self) -> str:
+        return ("CRITICAL", "STABLE", "UNSTABLE")[self.delta_sign]
+
+    @property
+    def is_stable(self) -> bool:
+        return self._bk > self._ag
+
+    # Same code as Atom's: these read only trace, delta, score and the gains
+    eigenvalues = Atom.eigenvalues
+    gate = Atom.gate
+    matrix = Atom.matrix
+    to_dict = Atom.to_dict
+
+    # ── Interchangeability with Atom ──
+
+    def __eq__(self, other):
+        if isinstance(other, ScaledAtom):
+            # b/D == b'/D' for all four gains
+            return all(x * other.den == y * self.den for x, y in
+                       ((self.b, other.b), (self.k, other.k),
+                        (self.a, other.a), (self.g, other.g)))
+        if isinstance(other, Atom):
+            return self._fractions() == (other.beta, other.kappa, other.alpha, other.gamma)
+        return NotImplemented
+
+    def __hash__(self):
+        # Atom is a frozen dataclass: it hashes the tuple of its four gains
+        return hash(self._fractions())
+
+    def __repr__(self):
+        return (f"ScaledAtom(b={self.b}, k={self.k}, a={self.a}, g={self.g}, "
+                f"den={self.den})")
+
+
 # ═════════════════════════════════════════════════════
 # §2. EQUIVALENCE THEOREM
 # ═════════════════════════════════════════════════════
@@ -206,6 +374,220 @@ def verify_equivalence(atom: Atom) -> dict:
             "E4_score_gt_half": e4, "E5_eigenvalues_neg": e5, "E6_rc2_gate": e6}
 
 
+# ═════════════════════════════════════════════════════
+# §2a. BULK EQUIVALENCE (COLUMNAR)
+# ═════════════════════════════════════════════════════
+#
+# verify_equivalence decides E1–E6 for one atom through Fractions.
+# AtomBatch holds a population as columns b, k, a, g, den (the
+# ScaledAtom numerators) and decides each condition for all of them at
+# once, from its own formula:
+#
+#     E1  bk > ag               E4  2·bk > bk + ag
+#     E2  bk − ag > 0           E6  bk·t_den > t_num·(bk + ag),  t = 1/2
+#     E3  ag < bk
+#
+# in integers, exact as the scalar path is. E5 is floating point in the
+# scalar path (Atom.eigenvalues) and is repeated here operation for
+# operation — tr = −(b+k)/D and det = (bk−ag)/D² as correctly rounded
+# quotients — so it agrees bit for bit, not just in sign.
+#
+# Backends: NumPy int64 columns when every numerator and denominator is
+# below 2**26 (products and quotients then stay exact in int64 and
+# float64), NumPy object columns otherwise; without NumPy, stdlib
+# array('q') columns and one integer pass per atom.
+
+_INT64_EXACT = 1 << 26
+
+EQUIVALENCE_KEYS = ("E1_det_ineq", "E2_det_pos", "E3_rho_lt1",
+                    "E4_score_gt_half", "E5_eigenvalues_neg", "E6_rc2_gate")
+
+
+class AtomBatch:
+    """
+    Columnar population of atoms: gains b/den, k/den, a/den, g/den.
+
+    backend: "numpy", "array" or None (NumPy when installed).
+    """
+
+    def __init__(self, b, k, a, g, den=1, backend=None):
+        n = len(b)
+        if not (len(k) == len(a) == len(g) == n):
+            raise ValueError("columns b, k, a, g must have equal length")
+        if isinstance(den, numbers.Integral):
+            den = [den] * n
+        elif len(den) != n:
+            raise ValueError("den must be an int or a column of the same length")
+        if backend is None:
+            backend = "numpy" if np is not None else "array"
+        if backend not in ("numpy", "array"):
+            raise ValueError(f"unknown backend {backend!r}")
+        if backend == "numpy" and np is None:
+            raise ImportError("backend 'numpy' needs NumPy")
+        self.backend = backend
+        self.n = n
+
+        cols = [list(c) for c in (b, k, a, g, den)]
+        for name, col in zip(("b", "k", "a", "g", "den"), cols):
+            # Integral: NumPy integer columns arrive as np.int64 scalars
+            if col and (not all(isinstance(v, numbers.Integral) and not isinstance(v, bool)
+                                for v in col) or min(col) <= 0):
+                raise ValueError(f"column {name} must hold positive ints")
+        cols = [[int(v) for v in col] for col in cols]
+        top = max((max(c) for c in cols if c), default=0)
+        self.exact_int64 = top < _INT64_EXACT
+        if backend == "numpy":
+            dtype = np.int64 if self.exact_int64 else object
+            cols = [np.array(c, dtype=dtype) for c in cols]
+        elif top < 1 << 63:
+            cols = [array("q", c) for c in cols]
+        self.b, self.k, self.a, self.g, self.den = cols
+        self._cache = None
+
+    @classmethod
+    def from_atoms(cls, atoms, backend=None) -> "AtomBatch":
+        """From Atoms or ScaledAtoms."""
+        scaled = [x if isinstance(x, ScaledAtom) else ScaledAtom.from_atom(x) for x in atoms]
+        return cls([x.b for x in scaled], [x.k for x in scaled], [x.a for x in scaled],
+                   [x.g for x in scaled], [x.den for x in scaled], backend)
+
+    @classmethod
+    def random(cls, n: int, seed=42, high: int = 99, den: int = 100,
+               backend=None) -> "AtomBatch":
+        """
+        n atoms with gains randint(1, high)/den, drawn β, κ, α, γ per atom
+        from random.Random(seed): the atoms of the scalar sweeps for the
+        same seed.
+        """
+        rng = random.Random(seed)
+        draw = rng.randint
+        rows = [(draw(1, high), draw(1, high), draw(1, high), draw(1, high))
+                for _ in range(n)]
+        cols = [list(c) for c in zip(*rows)] if rows else [[], [], [], []]
+        return cls(*cols, den=den, backend=backend)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def atom(self, i: int) -> ScaledAtom:
+        return ScaledAtom(int(self.b[i]), int(self.k[i]), int(self.a[i]),
+                          int(self.g[i]), int(self.den[i]))
+
+    # ── Bulk conditions ──
+
+    def equivalence(self, threshold=Fraction(1, 2)) -> dict:
+        """
+        {E-key: column of bools} in verify_equivalence's keys; E6 at threshold.
+        Cached for the default threshold.
+        """
+        threshold = Fraction(threshold)
+        default = threshold == Fraction(1, 2)
+        if default and self._cache is not None:
+            return self._cache
+        if self.backend == "numpy":
+            result = self._equivalence_numpy(threshold)
+        else:
+            result = self._equivalence_rows(threshold)
+        if default:
+            self._cache = result
+        return result
+
+    def _equivalence_numpy(self, t: Fraction) -> dict:
+        b, k, a, g, d = self.b, self.k, self.a, self.g, self.den
+        bk = b * k
+        ag = a * g
+        if self.exact_int64 and max(t.numerator, t.denominator) >= 1 << 9:
+            # bk + ag < 2**53: a wide threshold could overflow int64
+            e6 = bk.astype(object) * t.denominator > (bk + ag).astype(object) * t.numerator
+        else:
+            e6 = bk * t.denominator > (bk + ag) * t.numerator
+        if self.exact_int64:
+            tr = -(b + k) / d
+            det = (bk - ag) / (d * d)
+        else:
+            # Python int true division per element: correctly rounded at any size
+            tr = (-(b + k) / d).astype(np.float64)
+            det = ((bk - ag) / (d * d)).astype(np.float64)
+        disc = tr * tr - 4 * det
+        sd = np.sqrt(np.where(disc >= 0, disc, 0.0))
+        real = ((tr + sd) / 2 < 0) & ((tr - sd) / 2 < 0)
+        e5 = np.where(disc >= 0, real, tr / 2 < 0)
+        cols = (bk > ag, bk - ag > 0, ag < bk, 2 * bk > bk + ag, e5, e6)
+        return {key: np.asarray(col, dtype=bool) for key, col in zip(EQUIVALENCE_KEYS, cols)}
+
+    def _equivalence_rows(self, t: Fraction) -> dict:
+        tn, td = t.numerator, t.denominator
+        cols = tuple([] for _ in EQUIVALENCE_KEYS)
+        e1, e2, e3, e4, e5, e6 = (c.append for c in cols)
+        sqrt = math.sqrt
+        for b, k, a, g, d in zip(self.b, self.k, self.a, self.g, self.den):
+            bk = b * k
+            ag = a * g
+            e1(bk > ag)
+            e2(bk - ag > 0)
+            e3(ag < bk)
+            e4(2 * bk > bk + ag)
+            tr = -(b + k) / d
+            det = (bk - ag) / (d * d)
+            disc = tr * tr - 4 * det
+            if disc >= 0:
+                sd = sqrt(disc)
+                e5((tr + sd) / 2 < 0 and (tr - sd) / 2 < 0)
+            else:
+                e5(tr / 2 < 0)
+            e6(bk * td > (bk + ag) * tn)
+        return dict(zip(EQUIVALENCE_KEYS, cols))
+
+    # ── Reports ──
+
+    def disagreements(self) -> list:
+        """Indices of atoms whose E1–E6 are not unanimous."""
+        eq = self.equivalence()
+        if self.backend == "numpy":
+            first = eq[EQUIVALENCE_KEYS[0]]
+            split = np.zeros(self.n, dtype=bool)
+            for key in EQUIVALENCE_KEYS[1:]:
+                split |= eq[key] != first
+            return [int(i) for i in np.nonzero(split)[0]]
+        return [i for i, row in enumerate(zip(*eq.values()))
+                if any(row) and not all(row)]
+
+    def phases(self) -> dict:
+        """{phase: count}, from sign(bk − ag)."""
+        if self.backend == "numpy":
+            diff = self.b * self.k - self.a * self.g
+            stable, critical = int(np.count_nonzero(diff > 0)), int(np.count_nonzero(diff == 0))
+        else:
+            stable = critical = 0
+            for b, k, a, g in zip(self.b, self.k, self.a, self.g):
+                bk, ag = b * k, a * g
+                stable += bk > ag
+                critical += bk == ag
+        return {"STABLE": stable, "CRITICAL": critical,
+                "UNSTABLE": self.n - stable - critical}
+
+    def report(self, limit: int = 20) -> dict:
+        """Population summary; at most limit disagreeing atoms spelled out."""
+        split = self.disagreements()
+        eq = self.equivalence()
+        return {
+            "n": self.n, "backend": self.backend, "exact_int64": self.exact_int64,
+            "phases": self.phases(),
+            "unanimous": self.n - len(split),
+            "disagreements": len(split),
+            "examples": [dict(self.atom(i).to_dict(),
+                              conditions={key: bool(eq[key][i]) for key in EQUIVALENCE_KEYS})
+                         for i in split[:limit]],
+        }
+
+    def cross_check(self, indices) -> list:
+        """Indices among the given whose bulk conditions differ from verify_equivalence."""
+        eq = self.equivalence()
+        return [i for i in indices
+                if verify_equivalence(self.atom(i))
+                != {key: bool(eq[key][i]) for key in EQUIVALENCE_KEYS}]
+
+
 # ═════════════════════════════════════════════════════
 # §3. N-STATE BLOCK GENERALIZATION
 # ═════════════════════════════════════════════════════
@@ -363,6 +745,181 @@ class AtomSimulator:
         return [(t, x1**2 + x2**2) for t, x1, x2 in traj]
 
 
+# ═════════════════════════════════════════════════════
+# §5a. CLOSED-FORM TRAJECTORY ENGINE
+# ═════════════════════════════════════════════════════
+#
+# dx/dt = Ax is linear, so x(t) = e^{At} x₀ exactly. With s = tr/2 and
+# ω² = s² − Δ = ((β − κ)/2)² + αγ > 0 (positive gains: the eigenvalues
+# λ₁,₂ = s ± ω are always real and distinct),
+#
+#     e^{At} = c(t) I + σ(t) (A − sI)
+#     c(t) = e^{λ₁t} (1 + e^{−2ωt}) / 2
+#     σ(t) = e^{λ₁t} (−expm1(−2ωt)) / 2ω
+#
+# which is e^{st}(cosh ωt · I + sinh ωt / ω · (A − sI)) written so that
+# nothing overflows unless x(t) does and nothing cancels as ωt → 0.
+# One e^{At} per grid point serves every initial condition, and only
+# the grid points asked for are evaluated. Mode "rk4" steps
+# AtomSimulator's integrator instead, as the reference.
+
+class TrajectoryEngine:
+    """
+    Trajectories of many atoms from many initial conditions.
+
+    Grid: AtomSimulator.simulate's (t accumulates dt while t <= t_max);
+    stride keeps every stride-th point, so trajectories(...) in "rk4"
+    mode equals simulate(...)[::stride].
+    """
+
+    MODES = ("exact", "rk4")
+
+    def __init__(self, atoms, mode: str = "exact"):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+        self.atoms = list(atoms)
+        self.mode = mode
+        self._grids = {}
+        self._forms = []
+        for atom in self.atoms:
+            b, k = float(atom.beta), float(atom.kappa)
+            al, g = float(atom.alpha), float(atom.gamma)
+            half = (b - k) / 2
+            omega = math.hypot(half, math.sqrt(al * g))
+            s = -(b + k) / 2
+            # (λ₁, ω, A − sI as m11, m12, m21, m22)
+            self._forms.append((s + omega, omega, -half, -g, -al, half))
+
+    def grid(self, t_max: float = 20.0, dt: float = 0.005) -> list:
+        """Grid times, accumulated as in AtomSimulator.simulate."""
+        key = (t_max, dt)
+        times = self._grids.get(key)
+        if times is None:
+            times = []
+            t = 0.0
+            while t <= t_max:
+                times.append(t)
+                t += dt
+            self._grids[key] = times
+        return times
+
+    def _points(self, i: int, x0s, t_max: float, dt: float, stride: int):
+        """(index, t, [(x1, x2) per IC]) at every stride-th grid point and the last."""
+        if stride < 1:
+            raise ValueError("stride must be >= 1")
+        times = self.grid(t_max, dt)
+        last = len(times) - 1
+        x0s = [(float(x1), float(x2)) for x1, x2 in x0s]
+        if self.mode == "rk4":
+            sim = AtomSimulator(self.atoms[i])
+            states = x0s
+            for n, t in enumerate(times):
+                if n % stride == 0 or n == last:
+                    yield n, t, states
+                if n < last:
+                    states = [sim._rk4(x1, x2, dt) for x1, x2 in states]
+            return
+        picks = list(range(0, last + 1, stride))
+        if picks[-1] != last:
+            picks.append(last)
+        for n in picks:
+            yield n, times[n], self._exact(i, x0s, times[n])
+
+    def _exact(self, i: int, x0s, t: float) -> list:
+        """e^{At}x₀ for every (float) x₀."""
+        lam, omega, m11, m12, m21, m22 = self._forms[i]
+        grow = math.exp(lam * t)
+        c = grow * (1 + math.exp(-2 * omega * t)) / 2
+        sg = grow * -math.expm1(-2 * omega * t) / (2 * omega) if omega else grow * t
+        return [(c * x1 + sg * (m11 * x1 + m12 * x2),
+                 c * x2 + sg * (m21 * x1 + m22 * x2)) for x1, x2 in x0s]
+
+    def trajectories(self, x0s, t_max: float = 20.0, dt: float = 0.005,
+                     stride: int = 1) -> list:
+        """[atom][IC] -> [(t, x1, x2), ...] at every stride-th grid point."""
+        out = []
+        for i in range(len(self.atoms)):
+            per_ic = [[] for _ in x0s]
+            for n, t, states in self._points(i, x0s, t_max, dt, stride):
+                if n % stride == 0:
+                    for traj, (x1, x2) in zip(per_ic, states):
+                        traj.append((t, x1, x2))
+            out.append(per_ic)
+        return out
+
+    def final(self, x0s, t_max: float = 20.0, dt: float = 0.005) -> list:
+        """
+        [atom][IC] -> (t, x1, x2) at the last grid point: one closed-form
+        evaluation per atom in "exact" mode, the full RK4 march in "rk4".
+        """
+        times = self.grid(t_max, dt)
+        out = []
+        for i in range(len(self.atoms)):
+            if self.mode == "exact":
+                t = times[-1]
+                states = self._exact(i, [(float(x1), float(x2)) for x1, x2 in x0s], t)
+            else:
+                for _, t, states in self._points(i, x0s, t_max, dt, len(times)):
+                    pass
+            out.append([(t, x1, x2) for x1, x2 in states])
+        return out
+
+    def at(self, x0s, t: float, dt: float = 0.005) -> list:
+        """
+        [atom][IC] -> (t, x1, x2) at any time t >= 0: e^{At}x₀ in "exact"
+        mode; in "rk4", steps of dt and one shorter step landing on t.
+        """
+        if t < 0:
+            raise ValueError("t must be >= 0")
+        x0s = [(float(x1), float(x2)) for x1, x2 in x0s]
+        out = []
+        for i in range(len(self.atoms)):
+            if self.mode == "exact":
+                states = self._exact(i, x0s, t)
+            else:
+                sim = AtomSimulator(self.atoms[i])
+                steps = int(t // dt)
+                rest = t - steps * dt
+                states = x0s
+                for _ in range(steps):
+                    states = [sim._rk4(x1, x2, dt) for x1, x2 in states]
+                if rest > 0:
+                    states = [sim._rk4(x1, x2, rest) for x1, x2 in states]
+            out.append([(t, x1, x2) for x1, x2 in states])
+        return out
+
+    def lyapunov_stats(self, x0s, t_max: float = 20.0, dt: float = 0.005,
+                       stride: int = 1, tol: float = 1e-10) -> list:
+        """
+        [atom][IC] -> statistics of V = x₁² + x₂², reduced without storing
+        trajectories: V0, V_final and x_final at the last grid point,
+        V_max / V_min and monotone (V non-increasing within tol) over
+        every stride-th point. For the final state alone, see final().
+        """
+        out = []
+        for i in range(len(self.atoms)):
+            stats = [{"V0": None, "V_max": -math.inf, "V_min": math.inf, "monotone": True}
+                     for _ in x0s]
+            prev = [None] * len(x0s)
+            for n, t, states in self._points(i, x0s, t_max, dt, stride):
+                for j, (x1, x2) in enumerate(states):
+                    v = x1 * x1 + x2 * x2
+                    st = stats[j]
+                    if n % stride == 0:
+                        if st["V0"] is None:
+                            st["V0"] = v
+                        if prev[j] is not None and v > prev[j] + tol:
+                            st["monotone"] = False
+                        prev[j] = v
+                        st["V_max"] = max(st["V_max"], v)
+                        st["V_min"] = min(st["V_min"], v)
+                    st["V_final"] = v
+                    st["x_final"] = (x1, x2)
+                    st["t_final"] = t
+            out.append(stats)
+        return out
+
+
 # ═════════════════════════════════════════════════════
 # §6. BENCHMARK
 # ═════════════════════════════════════════════════════
@@ -395,6 +952,9 @@ class UniversalBenchmark:
         self.sect_block_weakest_link()
         self.sect_perturbation_bound()
         self.sect_score_algebra()
+        self.sect_scaled_atom()
+        self.sect_batch_sweep()
+        self.sect_trajectory_engine()
         return time.time() - t0
 
     # ── §6.1 Atom invariants ──
@@ -507,14 +1067,12 @@ class UniversalBenchmark:
     def sect_trajectory_convergence(self):
         print("\n── §5. Trajectory Convergence ──")
         a = Atom(Fraction(6,10), Fraction(7,10), Fraction(1,10), Fraction(2,10))
-        sim = AtomSimulator(a)
+        engine = TrajectoryEngine([a])
 
         ics = [(5.0, 3.0), (-2.0, 4.0), (8.0, -1.0), (-3.0, -5.0), (0.1, 9.0)]
         converged = 0
-        for x1, x2 in ics:
-            traj = sim.simulate(x1, x2, dt=0.005, t_max=30)
-            final = traj[-1]
-            if abs(final[1]) < 0.01 and abs(final[2]) < 0.01:
+        for _, x1, x2 in engine.final(ics, t_max=30, dt=0.005)[0]:
+            if abs(x1) < 0.01 and abs(x2) < 0.01:
                 converged += 1
 
         self.check(f"Stable: {len(ics)} ICs → origin",
@@ -525,11 +1083,11 @@ class UniversalBenchmark:
     def sect_trajectory_divergence(self):
         print("\n── §6. Trajectory Divergence ──")
         a = Atom(Fraction(1,10), Fraction(1,10), Fraction(8,10), Fraction(8,10))
-        sim = AtomSimulator(a)
+        engine = TrajectoryEngine([a])
 
-        traj = sim.simulate(1.0, 0.1, dt=0.005, t_max=20)
-        init_norm = math.sqrt(traj[0][1]**2 + traj[0][2]**2)
-        final_norm = math.sqrt(traj[-1][1]**2 + traj[-1][2]**2)
+        _, x1, x2 = engine.final([(1.0, 0.1)], t_max=20, dt=0.005)[0][0]
+        init_norm = math.hypot(1.0, 0.1)
+        final_norm = math.hypot(x1, x2)
 
         self.check("Unstable: trajectory diverges",
                     final_norm > init_norm * 10,
@@ -539,19 +1097,14 @@ class UniversalBenchmark:
     def sect_lyapunov(self):
         print("\n── §7. Lyapunov Monotonicity ──")
         a = Atom(Fraction(6,10), Fraction(7,10), Fraction(1,10), Fraction(2,10))
-        sim = AtomSimulator(a)
-
-        traj = sim.simulate(5.0, 5.0, dt=0.005, t_max=30)
-        lyap = sim.lyapunov(traj)
+        engine = TrajectoryEngine([a])
 
         # Sample every 50 steps
-        sampled = lyap[::50]
-        decreasing = all(sampled[i][1] >= sampled[i+1][1] - 1e-10
-                         for i in range(len(sampled)-1))
-        self.check("V(t) monotonically decreasing", decreasing)
+        st = engine.lyapunov_stats([(5.0, 5.0)], dt=0.005, t_max=30, stride=50)[0][0]
+        self.check("V(t) monotonically decreasing", st["monotone"])
 
         # V → 0
-        self.check("V(t) → 0", lyap[-1][1] < 0.001, f"V_final = {lyap[-1][1]:.8f}")
+        self.check("V(t) → 0", st["V_final"] < 0.001, f"V_final = {st['V_final']:.8f}")
 
     # ── §6.8 RC2 gate equivalence ──
     def sect_rc2_gate_equivalence(self):
@@ -694,6 +1247,149 @@ class UniversalBenchmark:
         self.check("Score = 1/2 at ρ = 1",
                     a_c.score == Fraction(1, 2), f"score = {a_c.score}")
 
+    # ── §6.14 Integer-scaled atom ──
+    def sect_scaled_atom(self):
+        print("\n── §14. Integer-Scaled Atom ──")
+
+        a = Atom(Fraction(7,10), Fraction(8,10), Fraction(3,10), Fraction(2,10))
+        s = ScaledAtom.from_atom(a)
+        self.check("ScaledAtom: shared denominator",
+                    (s.b, s.k, s.a, s.g, s.den) == (7, 8, 3, 2, 10), repr(s))
+        self.check("ScaledAtom == Atom, same hash",
+                    s == a and a == s and hash(s) == hash(a) and s.to_atom() == a)
+
+        # Mixed denominators, including the critical line
+        random.seed(14)
+        pairs = []
+        for i in range(2000):
+            gains = [Fraction(random.randint(1, 99), random.choice((1, 7, 10, 12, 100)))
+                     for _ in range(4)]
+            if i % 10 == 0:
+                gains[3] = gains[0] * gains[1] / gains[2]     # Δ = 0
+            pairs.append((Atom(*gains), ScaledAtom.from_fractions(*gains)))
+        same = sum(
+            (x.delta, x.rho, x.score, x.trace, x.phase, x.is_stable, x.eigenvalues(),
+             x.gate(), x.to_dict(), verify_equivalence(x))
+            == (y.delta, y.rho, y.score, y.trace, y.phase, y.is_stable, y.eigenvalues(),
+                y.gate(), y.to_dict(), verify_equivalence(y))
+            for x, y in pairs)
+        self.check(f"ScaledAtom ≡ Atom ({len(pairs)} atoms, incl. critical)",
+                    same == len(pairs), f"{same}/{len(pairs)}")
+
+        for n in range(0, len(pairs), 50):
+            block = pairs[n:n + 50]
+            ref = BlockSystem([x for x, _ in block]).stability_report()
+            fast = BlockSystem([y for _, y in block]).stability_report()
+            if ref != fast:
+                break
+        self.check("BlockSystem reports identical", ref == fast)
+
+        t0 = time.perf_counter()
+        ref = [(x.phase, x.score, x.rho) for x, _ in pairs for _ in range(5)]
+        t1 = time.perf_counter()
+        fast = [(y.phase, y.score, y.rho) for _, y in pairs for _ in range(5)]
+        t2 = time.perf_counter()
+        self.check("ScaledAtom: cached invariants agree", ref == fast,
+                    f"Atom {t1 - t0:.3f}s, ScaledAtom {t2 - t1:.3f}s")
+
+    # ── §6.15 Bulk equivalence sweep ──
+    def sect_batch_sweep(self):
+        print("\n── §15. Bulk E1–E6 Sweep (AtomBatch) ──")
+
+        # Same seed, same atoms as §9
+        batch = AtomBatch.random(200, seed=42)
+        random.seed(42)
+        scalar = [Atom(*(Fraction(random.randint(1, 99), 100) for _ in range(4)))
+                  for _ in range(200)]
+        self.check("AtomBatch.random(seed) = §9 atoms",
+                    all(batch.atom(i) == x for i, x in enumerate(scalar)))
+        self.check("Bulk E1–E6 = verify_equivalence (200 atoms)",
+                    batch.cross_check(range(200)) == [])
+
+        # Critical line and large numerators (object / list columns)
+        edge = [Atom(1, 1, 1, 1), Atom(Fraction(2, 3), Fraction(3, 4), Fraction(1, 2), 1),
+                Atom(Fraction(10**30 + 1, 7), 3, 5, Fraction(10**30, 7)),
+                Atom(Fraction(1, 10**40), Fraction(1, 3), Fraction(1, 5), Fraction(1, 7))]
+        eb = AtomBatch.from_atoms(edge)
+        self.check("Bulk = scalar on critical / huge atoms",
+                    not eb.exact_int64 and eb.cross_check(range(len(edge))) == [],
+                    f"phases={eb.phases()}")
+
+        # Integer columns of any kind; the numpy backend against the array one
+        cols = [[getattr(batch.atom(i), c) for i in range(200)] for c in "bkag"]
+        plain = AtomBatch(*cols, den=100, backend="array")
+        typed = AtomBatch(*(array("q", c) for c in cols), den=100, backend="array")
+        self.check("array('q') columns = list columns",
+                    typed.report() == plain.report())
+        if np is None:
+            print("  – numpy backend: skipped (NumPy not installed)")
+        else:
+            nb = AtomBatch(*(np.array(c, dtype=np.int64) for c in cols), den=np.int64(100),
+                           backend="numpy")
+            self.check("numpy backend, np.int64 columns = array backend",
+                        dict(nb.report(), backend="array") == plain.report()
+                        and nb.cross_check(range(200)) == [])
+
+        n = 100_000
+        t0 = time.perf_counter()
+        big = AtomBatch.random(n, seed=2026)
+        t1 = time.perf_counter()
+        report = big.report()
+        t2 = time.perf_counter()
+        sample = range(0, n, n // 500)
+        self.check(f"E1–E6 unanimous ({n} atoms, {big.backend})",
+                    report["disagreements"] == 0 and big.cross_check(sample) == []
+                    and sum(report["phases"].values()) == n,
+                    f"build {t1 - t0:.3f}s, E1–E6 {t2 - t1:.3f}s")
+
+    # ── §6.16 Closed-form trajectories vs RK4 reference ──
+    def sect_trajectory_engine(self):
+        print("\n── §16. Closed-Form Trajectories (RK4 Reference) ──")
+
+        atoms = [Atom(Fraction(6,10), Fraction(7,10), Fraction(1,10), Fraction(2,10)),
+                 Atom(Fraction(1,10), Fraction(1,10), Fraction(8,10), Fraction(8,10)),
+                 Atom(Fraction(1), Fraction(1), Fraction(1), Fraction(1)),
+                 ScaledAtom(5, 5, 1, 1, 10)]
+        ics = [(5.0, 3.0), (-2.0, 4.0), (1.0, 0.1)]
+
+        rk4 = TrajectoryEngine(atoms[:1], mode="rk4").trajectories(ics[:1], stride=7)[0][0]
+        self.check("rk4 mode = AtomSimulator.simulate",
+                    rk4 == AtomSimulator(atoms[0]).simulate(*ics[0])[::7])
+
+        t0 = time.perf_counter()
+        exact = TrajectoryEngine(atoms).trajectories(ics, stride=40)
+        t1 = time.perf_counter()
+        ref = TrajectoryEngine(atoms, mode="rk4").trajectories(ics, stride=40)
+        t2 = time.perf_counter()
+        err = max(abs(p[j] - q[j]) / max(1.0, abs(q[j]))
+                  for e_atom, r_atom in zip(exact, ref)
+                  for e_ic, r_ic in zip(e_atom, r_atom)
+                  for p, q in zip(e_ic, r_ic) for j in (1, 2))
+        same_grid = all(len(e) == len(r) and all(p[0] == q[0] for p, q in zip(e, r))
+                        for ea, ra in zip(exact, ref) for e, r in zip(ea, ra))
+        self.check("e^{At}x₀ = RK4 within 1e-8 (rel)", same_grid and err < 1e-8,
+                    f"err={err:.1e}, exact {t1 - t0:.4f}s, rk4 {t2 - t1:.3f}s")
+
+        stats = TrajectoryEngine(atoms).lyapunov_stats(ics, stride=50)
+        self.check("Lyapunov stats: stable decays, unstable grows, critical holds",
+                    all(st["monotone"] and st["V_final"] < 1e-3 for st in stats[0])
+                    and all(st["V_final"] > 100 * st["V0"] for st in stats[1])
+                    and all(st["V_final"] <= st["V0"] for st in stats[2]))
+
+        self.check("final() = last trajectory point, both modes",
+                    all(TrajectoryEngine(atoms, mode).final(ics)
+                        == [[traj[-1] for traj in per_ic] for per_ic in
+                            TrajectoryEngine(atoms, mode).trajectories(ics)]
+                        for mode in TrajectoryEngine.MODES))
+
+        times = (0.0, 0.0123, 3.3333, 17.5)
+        err = max(abs(p[j] - q[j]) / max(1.0, abs(q[j]))
+                  for t in times
+                  for e_atom, r_atom in zip(TrajectoryEngine(atoms).at(ics, t),
+                                            TrajectoryEngine(atoms, mode="rk4").at(ics, t))
+                  for p, q in zip(e_atom, r_atom) for j in (1, 2))
+        self.check("at(t) = RK4 off the grid within 1e-8 (rel)", err < 1e-8, f"err={err:.1e}")
+
 
 # ═════════════════════════════════════════════════════
 # MAIN
@@ -717,6 +1413,7 @@ def main():
     if bench.failed == 0:
         print(f"\n  ★ ATOM HOLDS")
         print(f"  E1–E6 equivalence verified on {200} random configurations.")
+        print(f"  Bulk E1–E6 (AtomBatch) unanimous on {100_000} random configurations.")
         print(f"  RC2 gate ⟺ Routh-Hurwitz on {500} random configurations.")
         print(f"  N-state block stability = weakest-link principle.")
         print(f"  Perturbation bound: ε < min_i(Δᵢ).")
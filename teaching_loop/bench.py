@@ -0,0 +1,321 @@
+"""
+Teaching Loop — Load Benchmark
+
+Throughput and latency of the correction path under a simulated model:
+
+    python -m teaching_loop.bench --concurrency 1,8,64 --latency-ms 200
+    python -m teaching_loop.bench --quick --growth-rate 0.3
+
+    report = run_load_benchmark(concurrency=(1, 16), samples=100)
+
+The rewriter is a stand-in (SimulatedRewriter): it waits a lognormal
+latency, fails at error_rate, applies harness.deterministic_rewrite, and
+at growth_rate pads the result by `growth` of its length. The defaults
+(GROWTH past EXPANSION_LIMIT, at GROWTH_RATE) make every run, --quick
+included, send some rewrites of samples over EXPANSION_FLOOR into the
+expansion block; --growth-rate 0 turns that off. Every draw is seeded
+from the text it rewrites, so a sample's course through the loop does
+not depend on scheduling and the iteration distribution is the same at
+every concurrency level; only the timings move.
+
+Samples come from rc1_lite.corpus: 200 .. 3000 character documents at
+varied violation density, below and above EXPANSION_FLOOR. Each
+concurrency level runs all of them through run_teaching_loop_async and
+reports, per level:
+
+    samples_per_s      completed samples (errors included) per wall second
+    e2e_us             end-to-end sample latency, exact nearest-rank quantiles
+    rc1_cpu_share      RC1 CPU time / process CPU time
+    rc1_loop_busy      RC1 CPU time / wall time: the fraction of the event
+                       loop RC1 occupies; near 1, validation is the limit
+                       and wants a pool (iter_teaching_loops jobs > 1)
+    iterations         {iterations_used: samples}, plus halted, errors
+                       and final gates
+    expansion_blocked  samples whose rewrite hit EXPANSION_LIMIT, out of
+                       above_floor samples longer than EXPANSION_FLOOR
+
+Validation runs in-process (LLMHarness, delta on) so its CPU time can
+be attributed on the event-loop thread.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence
+
+from harness.runner import LLMHarness
+from harness.schema import CorrectionVector
+from harness.teacher.rewrite import deterministic_rewrite
+from rc1_lite.bench import stats
+from rc1_lite.corpus import document
+from rc1_lite.version import VERSION
+
+from .concurrent import run_teaching_loop_async
+from .loop import EXPANSION_FLOOR, EXPANSION_LIMIT, MAX_ITERATIONS
+
+CONCURRENCY = (1, 4, 16, 64)
+SAMPLES = 200
+QUICK_SAMPLES = 40
+LATENCY_MS = 50.0
+QUICK_LATENCY_MS = 10.0
+LATENCY_SIGMA = 0.5
+
+# Padding of a growing rewrite (past EXPANSION_LIMIT) and how often one grows
+GROWTH = 0.5
+GROWTH_RATE = 0.25
+
+# Sample lengths and violation densities (rc1_lite.corpus.document)
+LENGTHS = (200, 400, 800, 1500, 3000)
+DENSITIES = (0.1, 0.3, 0.6, 1.0)
+
+# Padding appended by a growing rewrite
+FILLER = " The handler returns the parsed list."
+
+
+class RewriteError(Exception):
+    """Simulated model failure."""
+
+
+class SimulatedRewriter:
+    """
+    Deterministic async rewrite_fn with model-like latency and failures.
+
+    latency_ms: median latency; lognormal with latency_sigma (0: fixed).
+    error_rate: probability a call raises RewriteError.
+    growth, growth_rate: with probability growth_rate, pad the rewrite to
+    (1 + growth) x its length.
+    """
+
+    def __init__(self, latency_ms: float = LATENCY_MS, latency_sigma: float = LATENCY_SIGMA,
+                 error_rate: float = 0.0, growth: float = GROWTH,
+                 growth_rate: float = GROWTH_RATE, seed: int = 0):
+        for name, value in (("latency_ms", latency_ms), ("latency_sigma", latency_sigma),
+                            ("growth", growth)):
+            if value < 0:
+                raise ValueError(f"{name} must be >= 0")
+        for name, value in (("error_rate", error_rate), ("growth_rate", growth_rate)):
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be within [0, 1]")
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.growth = growth
+        self.growth_rate = growth_rate
+        self.seed = seed
+        self.calls = 0
+
+    def draw(self, text: str) -> random.Random:
+        """The generator for one call on text."""
+        return random.Random(f"{self.seed}:{zlib.crc32(text.encode('utf-8', 'surrogatepass'))}")
+
+    async def __call__(self, text: str, corrections: List[CorrectionVector]) -> str:
+        self.calls += 1
+        rng = self.draw(text)
+        latency = self.latency_ms * math.exp(rng.gauss(0.0, self.latency_sigma)) \
+            if self.latency_sigma else self.latency_ms
+        failed = rng.random() < self.error_rate
+        grows = rng.random() < self.growth_rate
+        await asyncio.sleep(latency / 1000)
+        if failed:
+            raise RewriteError("simulated rewrite failure")
+        rewritten = deterministic_rewrite(text, corrections)
+        if grows and self.growth:
+            target = int(len(rewritten) * (1 + self.growth))
+            pad = max(1, math.ceil((target - len(rewritten)) / len(FILLER)))
+            rewritten += FILLER * pad
+        return rewritten
+
+
+class _TimedHarness(LLMHarness):
+    """LLMHarness that adds up the thread CPU time of RC1 evaluation."""
+
+    def __init__(self):
+        super().__init__()
+        self.cpu_ns = 0
+
+    def evaluate(self, text, previous=None):
+        started = time.thread_time_ns()
+        try:
+            return super().evaluate(text, previous)
+        finally:
+            self.cpu_ns += time.thread_time_ns() - started
+
+
+def load_samples(n: int = SAMPLES, seed: int = 0) -> List[str]:
+    """n seeded sample texts across LENGTHS x DENSITIES."""
+    rng = random.Random(f"teaching-loop-bench:{seed}")
+    grid = [(length, density) for length in LENGTHS for density in DENSITIES]
+    return [document(*grid[i % len(grid)], rng) for i in range(n)]
+
+
+async def _level(texts: Sequence[str], rewriter: SimulatedRewriter, concurrency: int) -> Dict:
+    harness = _TimedHarness()
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+    iterations: Dict[str, int] = {}
+    gates: Dict[str, int] = {}
+    counts = {"halted": 0, "expansion_blocked": 0, "errors": 0}
+
+    async def one(i: int, text: str) -> None:
+        async with slots:
+            started = time.perf_counter_ns()
+            try:
+                result = await run_teaching_loop_async(text, rewriter, f"s{i}", harness)
+            except RewriteError:
+                counts["errors"] += 1
+                return
+            finally:
+                latencies.append((time.perf_counter_ns() - started) // 1000)
+        key = str(result.iterations_used)
+        iterations[key] = iterations.get(key, 0) + 1
+        gates[result.final_gate] = gates.get(result.final_gate, 0) + 1
+        counts["halted"] += result.halted
+        counts["expansion_blocked"] += result.expansion_blocked
+
+    cpu = time.process_time_ns()
+    wall = time.perf_counter_ns()
+    await asyncio.gather(*(one(i, t) for i, t in enumerate(texts)))
+    wall = time.perf_counter_ns() - wall
+    cpu = time.process_time_ns() - cpu
+
+    return {
+        "concurrency": concurrency,
+        "samples": len(texts),
+        "seconds": round(wall / 1e9, 3),
+        "samples_per_s": round(len(texts) / (wall / 1e9), 2),
+        "e2e_us": stats(latencies),
+        "rc1_cpu_s": round(harness.cpu_ns / 1e9, 4),
+        "cpu_s": round(cpu / 1e9, 4),
+        "rc1_cpu_share": round(harness.cpu_ns / max(cpu, 1), 4),
+        "rc1_loop_busy": round(harness.cpu_ns / max(wall, 1), 4),
+        "iterations": dict(sorted(iterations.items())),
+        "final_gates": gates,
+        "above_floor": sum(len(t) > EXPANSION_FLOOR for t in texts),
+        **counts,
+    }
+
+
+def run_load_benchmark(
+    concurrency: Sequence[int] = CONCURRENCY,
+    samples: int = SAMPLES,
+    seed: int = 0,
+    rewriter: Optional[SimulatedRewriter] = None,
+    progress: Optional[Callable[[str, Dict], None]] = None,
+) -> Dict:
+    """Run every concurrency level over the same samples; the JSON-shaped report."""
+    if not concurrency or min(concurrency) < 1:
+        raise ValueError("concurrency levels must be >= 1")
+    if samples < 1:
+        raise ValueError("samples must be >= 1")
+    rewriter = rewriter or SimulatedRewriter(seed=seed)
+    texts = load_samples(samples, seed)
+
+    started = time.perf_counter()
+    results = {}
+    for level in concurrency:
+        key = f"c{level}"
+        results[key] = asyncio.run(_level(texts, rewriter, level))
+        if progress is not None:
+            progress(key, results[key])
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "max_iterations": MAX_ITERATIONS,
+        "expansion_floor": EXPANSION_FLOOR,
+        "expansion_limit": EXPANSION_LIMIT,
+        "rewriter": {
+            "latency_ms": rewriter.latency_ms,
+            "latency_sigma": rewriter.latency_sigma,
+            "error_rate": rewriter.error_rate,
+            "growth": rewriter.growth,
+            "growth_rate": rewriter.growth_rate,
+        },
+        "mean_chars": round(sum(map(len, texts)) / len(texts), 1),
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": results,
+    }
+
+
+# ── CLI ──
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m teaching_loop.bench",
+        description=f"Teaching-loop load benchmark (RC1-Lite {VERSION}).",
+    )
+    parser.add_argument("--concurrency", default=",".join(map(str, CONCURRENCY)),
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--samples", type=int, default=None,
+                        help=f"samples per level (default {SAMPLES}, quick {QUICK_SAMPLES})")
+    parser.add_argument("--latency-ms", type=float, default=None,
+                        help=f"median rewrite latency (default {LATENCY_MS:g}, "
+                             f"quick {QUICK_LATENCY_MS:g})")
+    parser.add_argument("--latency-sigma", type=float, default=LATENCY_SIGMA,
+                        help="lognormal sigma of the latency; 0: fixed")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--growth", type=float, default=GROWTH,
+                        help=f"padding of a growing rewrite, as a fraction of its length "
+                             f"(default {GROWTH:g})")
+    parser.add_argument("--growth-rate", type=float, default=GROWTH_RATE,
+                        help=f"fraction of rewrites that grow (default {GROWTH_RATE:g}; "
+                             f"0: none)")
+    parser.add_argument("--quick", action="store_true",
+                        help="fewer samples, lower latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None,
+                        help="write the JSON report here (default: stdout)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="no progress on stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        levels = [int(c) for c in args.concurrency.split(",")]
+    except ValueError:
+        parser.error("--concurrency must be comma-separated integers")
+    if min(levels) < 1:
+        parser.error("--concurrency levels must be >= 1")
+    samples = args.samples or (QUICK_SAMPLES if args.quick else SAMPLES)
+    latency = args.latency_ms
+    if latency is None:
+        latency = QUICK_LATENCY_MS if args.quick else LATENCY_MS
+    try:
+        rewriter = SimulatedRewriter(latency, args.latency_sigma, args.error_rate,
+                                     args.growth, args.growth_rate, args.seed)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    def progress(key: str, result: Dict) -> None:
+        e2e = result["e2e_us"]
+        sys.stderr.write(f"{key:<6} {result['samples_per_s']:>9.1f} samples/s  "
+                         f"p50 {e2e['p50'] / 1000:>8.1f} ms  p99 {e2e['p99'] / 1000:>8.1f} ms  "
+                         f"rc1 busy {result['rc1_loop_busy']:.1%}  "
+                         f"iters {result['iterations']}  "
+                         f"blocked {result['expansion_blocked']}/{result['above_floor']}\n")
+
+    report = run_load_benchmark(levels, samples, args.seed, rewriter,
+                                progress=None if args.quiet else progress)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Teaching Loop — Concurrent Runner
+
+In production rewrite_fn is a network call, so one sample at a time
+leaves the process idle for the model's latency. Here many samples
+share one event loop:
+
+    async def rewrite(text, corrections):
+        return await client.complete(build_rewrite_prompt(text, corrections))
+
+    async for result in iter_teaching_loops(samples, rewrite, concurrency=64, jobs=4):
+        log(result.summary_line())
+
+    result = await run_teaching_loop_async(text, rewrite, sample_id="s1")
+
+Both drive loop.loop_steps, the same generator as run_teaching_loop, so
+MAX_ITERATIONS, the expansion block and every IterationRecord are those
+of the serial loop. rewrite_fn may be async or plain; a plain one runs
+on the event loop.
+
+Validation: with an executor, RC1 runs there (rc1_lite.engine.evaluate_result,
+compact results back) and the Report is built on the event loop; without
+one, in-process through harness.run, which keeps delta re-evaluation.
+iter_teaching_loops owns its pool: jobs worker processes, or in-process
+for jobs=1.
+
+Results stream in completion order, at most `concurrency` samples in
+flight; samples is consumed lazily. An exception in one sample cancels
+the rest and propagates. A sample whose own task ends cancelled (its
+rewrite_fn raised CancelledError) yields nothing; the others go on.
+"""
+
+import asyncio
+import inspect
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (AsyncIterator, Awaitable, Callable, Iterable, List, Optional,
+                    Tuple, Union)
+
+from harness.runner import LLMHarness, build_report
+from harness.schema import CorrectionVector, Report
+from rc1_lite.engine import evaluate_result
+
+from .loop import VALIDATE, LoopResult, loop_steps
+
+RewriteFn = Callable[[str, List[CorrectionVector]], Union[str, Awaitable[str]]]
+
+DEFAULT_CONCURRENCY = 16
+
+
+async def _validate(text: str, sample_id: str, previous: Optional[Report],
+                    harness: LLMHarness, executor: Optional[Executor]) -> Report:
+    if executor is None:
+        return harness.run(text, sample_id=sample_id, previous=previous)
+    result = await asyncio.get_running_loop().run_in_executor(executor, evaluate_result, text)
+    return build_report(text, result, sample_id)
+
+
+async def run_teaching_loop_async(
+    text: str,
+    rewrite_fn: Optional[RewriteFn] = None,
+    sample_id: str = "sample_0",
+    harness: Optional[LLMHarness] = None,
+    executor: Optional[Executor] = None,
+    trace_sink=None,
+) -> LoopResult:
+    """
+    run_teaching_loop with an awaitable rewrite_fn.
+
+    harness: validates in-process when no executor is given (default LLMHarness()).
+    executor: pool to run RC1 in.
+    trace_sink: as for run_teaching_loop.
+    """
+    harness = harness or LLMHarness()
+    steps = loop_steps(text, rewrite_fn is not None, sample_id, trace_sink)
+    reply = None
+    while True:
+        try:
+            step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
+        if step[0] == VALIDATE:
+            _, current, iteration_id, previous = step
+            reply = await _validate(current, iteration_id, previous, harness, executor)
+        else:
+            _, current, corrections = step
+            reply = rewrite_fn(current, corrections)
+            if inspect.isawaitable(reply):
+                reply = await reply
+
+
+async def iter_teaching_loops(
+    samples: Iterable[Tuple[str, str]],
+    rewrite_fn: Optional[RewriteFn] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    jobs: Optional[int] = None,
+    harness: Optional[LLMHarness] = None,
+    mp_context=None,
+    trace_sink=None,
+) -> AsyncIterator[LoopResult]:
+    """
+    Run the loop over (sample_id, text) pairs, yielding LoopResults as they finish.
+
+    Args:
+        concurrency: max samples in flight
+        jobs: RC1 worker processes (None or <= 0: one per CPU; 1: in-process)
+        harness: in-process validator for jobs=1
+        mp_context: multiprocessing context for the pool
+        trace_sink: shared by all samples (teaching_loop.trace)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if jobs is None or jobs <= 0:
+        jobs = os.cpu_count() or 1
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context)
+
+    pending = set()
+    source = iter(samples)
+    try:
+        while True:
+            for sample_id, text in source:
+                pending.add(asyncio.ensure_future(run_teaching_loop_async(
+                    text, rewrite_fn, sample_id, harness, executor, trace_sink)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            finished = [task for task in done if not task.cancelled()]
+            errors = [task.exception() for task in finished]   # retrieves them all
+            for error in errors:
+                if error is not None:
+                    raise error
+            for task in finished:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if executor is not None:
+            executor.shutdown()
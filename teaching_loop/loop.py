@@ -40,7 +40,7 @@ the rewrite prompt and the caller handles it externally.
 
 import sys
 import os
-from typing import Callable, Optional, List, Dict
+from typing import Callable, Generator, Optional, List, Dict
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -91,7 +91,7 @@ class LoopResult:
     expansion_blocked: bool               # True if rewrite tried to expand
     delta_score: float                    # final - initial
     delta_violations: int                 # final - initial (negative = improvement)
-    iterations: List[IterationRecord] = field(default_factory=list)
+    iterations: List[IterationRecord] = field(default_factory=list)   # empty with a trace_sink
     final_text: str = ""
     timestamp: str = ""
 
@@ -136,6 +136,7 @@ def run_teaching_loop(
     harness: LLMHarness,
     rewrite_fn: Optional[Callable[[str, List[CorrectionVector]], str]] = None,
     sample_id: str = "sample_0",
+    trace_sink=None,
 ) -> LoopResult:
     """
     Run the Möbius reiteration loop.
@@ -146,6 +147,8 @@ def run_teaching_loop(
         rewrite_fn: Optional function (text, corrections) -> corrected_text
                     If None, loop runs once and returns rewrite prompt for external handling
         sample_id: Identifier for this sample
+        trace_sink: Optional TraceSink (teaching_loop.trace) that takes each
+                    IterationRecord; the LoopResult then keeps summary fields only
 
     Returns:
         LoopResult with full delta trace
@@ -158,13 +161,55 @@ def run_teaching_loop(
         5. Repeat up to MAX_ITERATIONS
         6. Halt regardless after MAX_ITERATIONS
     """
+    steps = loop_steps(text, rewrite_fn is not None, sample_id, trace_sink)
+    reply = None
+    while True:
+        try:
+            step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
+        if step[0] == VALIDATE:
+            _, current, iteration_id, previous = step
+            reply = harness.run(current, sample_id=iteration_id, previous=previous)
+        else:
+            _, current, corrections = step
+            reply = rewrite_fn(current, corrections)
+
+
+# Steps loop_steps yields to its driver
+VALIDATE = "validate"   # (VALIDATE, text, sample_id, previous Report) -> Report
+REWRITE = "rewrite"     # (REWRITE, text, corrections) -> rewritten text
+
+
+def loop_steps(
+    text: str,
+    rewrite: bool,
+    sample_id: str = "sample_0",
+    trace_sink=None,
+) -> Generator[tuple, object, LoopResult]:
+    """
+    The loop itself, without I/O: a generator that yields each
+    validation and rewrite it needs, is sent back the Report or the
+    rewritten text, and returns the LoopResult.
+
+    run_teaching_loop drives it synchronously, teaching_loop.concurrent
+    from an event loop; both get the same iterations, halting and
+    expansion checks. rewrite=False: stop after the first validation
+    and hand the rewrite prompt to the caller.
+
+    trace_sink: receives each IterationRecord as it is made
+    (sink.write(sample_id, record), see teaching_loop.trace) instead of
+    the LoopResult, whose iterations then stay empty.
+    """
     iterations = []
     current_text = text
     initial_length = len(text)
     expansion_blocked = False
+    report = None
 
     for i in range(MAX_ITERATIONS + 1):  # iteration 0 = initial eval
-        report = harness.run(current_text, sample_id=f"{sample_id}_iter{i}")
+        # previous: the report this rewrite answers, for delta re-evaluation
+        report = yield (VALIDATE, current_text, f"{sample_id}_iter{i}", report)
 
         record = IterationRecord(
             iteration=i,
@@ -175,31 +220,36 @@ def run_teaching_loop(
             rewrite_prompt=report.rewrite_prompt,
             text_length=len(current_text),
         )
-        iterations.append(record)
+        if i == 0:
+            first = record
+        if trace_sink is None:
+            iterations.append(record)
+        else:
+            trace_sink.write(sample_id, record)
 
         # PASS → ship it
         if report.gate == "PASS":
             return LoopResult(
                 sample_id=sample_id,
-                initial_gate=iterations[0].gate,
-                initial_score=iterations[0].score,
+                initial_gate=first.gate,
+                initial_score=first.score,
                 final_gate=report.gate,
                 final_score=report.overall_score,
                 iterations_used=i,
                 halted=False,
                 expansion_blocked=expansion_blocked,
-                delta_score=report.overall_score - iterations[0].score,
-                delta_violations=len(report.violations) - len(iterations[0].violations),
+                delta_score=report.overall_score - first.score,
+                delta_violations=len(report.violations) - len(first.violations),
                 iterations=iterations,
                 final_text=current_text,
             )
 
         # No rewrite function → return with rewrite prompt, caller handles it
-        if rewrite_fn is None:
+        if not rewrite:
             return LoopResult(
                 sample_id=sample_id,
-                initial_gate=iterations[0].gate,
-                initial_score=iterations[0].score,
+                initial_gate=first.gate,
+                initial_score=first.score,
                 final_gate=report.gate,
                 final_score=report.overall_score,
                 iterations_used=i,
@@ -215,22 +265,22 @@ def run_teaching_loop(
         if i >= MAX_ITERATIONS:
             return LoopResult(
                 sample_id=sample_id,
-                initial_gate=iterations[0].gate,
-                initial_score=iterations[0].score,
+                initial_gate=first.gate,
+                initial_score=first.score,
                 final_gate=report.gate,
                 final_score=report.overall_score,
                 iterations_used=i,
                 halted=True,  # HIT THE WALL
                 expansion_blocked=expansion_blocked,
-                delta_score=report.overall_score - iterations[0].score,
-                delta_violations=len(report.violations) - len(iterations[0].violations),
+                delta_score=report.overall_score - first.score,
+                delta_violations=len(report.violations) - len(first.violations),
                 iterations=iterations,
                 final_text=current_text,
             )
 
         # CORRECTION PASS
         corrections = generate_corrections(report.violations)
-        rewritten = rewrite_fn(current_text, corrections)
+        rewritten = yield (REWRITE, current_text, corrections)
 
         # EXPANSION CHECK: forbid scope creep during correction
         # Only applies to texts above floor — short texts naturally resize
@@ -240,15 +290,15 @@ def run_teaching_loop(
             # Reject the rewrite, keep current text, halt
             return LoopResult(
                 sample_id=sample_id,
-                initial_gate=iterations[0].gate,
-                initial_score=iterations[0].score,
+                initial_gate=first.gate,
+                initial_score=first.score,
                 final_gate=report.gate,
                 final_score=report.overall_score,
                 iterations_used=i,
                 halted=True,
                 expansion_blocked=True,
-                delta_score=report.overall_score - iterations[0].score,
-                delta_violations=len(report.violations) - len(iterations[0].violations),
+                delta_score=report.overall_score - first.score,
+                delta_violations=len(report.violations) - len(first.violations),
                 iterations=iterations,
                 final_text=current_text,
             )
@@ -256,18 +306,18 @@ def run_teaching_loop(
         current_text = rewritten
 
     # Should never reach here, but safety
-    last = iterations[-1]
+    last = record
     return LoopResult(
         sample_id=sample_id,
-        initial_gate=iterations[0].gate,
-        initial_score=iterations[0].score,
+        initial_gate=first.gate,
+        initial_score=first.score,
         final_gate=last.gate,
         final_score=last.score,
-        iterations_used=len(iterations) - 1,
+        iterations_used=last.iteration,
         halted=True,
         expansion_blocked=expansion_blocked,
-        delta_score=last.score - iterations[0].score,
-        delta_violations=len(last.violations) - len(iterations[0].violations),
+        delta_score=last.score - first.score,
+        delta_violations=len(last.violations) - len(first.violations),
         iterations=iterations,
         final_text=current_text,
     )
@@ -0,0 +1,187 @@
+"""
+Teaching Loop — Trace Sink
+
+A LoopResult carries every IterationRecord, prompts included, for as
+long as it lives. Over a long correction run the traces go to disk
+instead, as they are produced:
+
+    with TraceSink("traces/") as sink:
+        result = run_teaching_loop(text, harness, rewrite_fn, "s1", trace_sink=sink)
+        # result.iterations == []: summary fields only
+
+    reader = TraceReader("traces/")
+    records = reader.read("s1")          # [IterationRecord, ...] in iteration order
+
+Layout of the directory:
+
+    segment-000000.jsonl.gz   one record per line: {"sample_id": ..., **record.to_dict()}
+    segment-000001.jsonl.gz   (a new segment after segment_bytes of JSON)
+    index.jsonl               one line per closed segment: {"segment", "records", "samples"}
+
+A segment is indexed when it is closed (rotation or close()), so the
+index names every segment holding a sample's records; samples from
+concurrent loops interleave freely. A segment the index does not name
+(the writer died) is still read, up to its last complete record. A new
+sink in an existing directory continues the numbering.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+from .loop import IterationRecord
+
+SEGMENT_BYTES = 16 << 20
+INDEX_NAME = "index.jsonl"
+
+_SEGMENT = re.compile(r"segment-(\d{6,})\.jsonl\.gz$")
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl.gz"
+
+
+class TraceSink:
+    """
+    Writes IterationRecords to rotating gzip JSONL segments in directory.
+
+    segment_bytes: uncompressed JSON per segment before rotating.
+    Thread-safe; close() (or the with block) indexes the last segment.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SEGMENT_BYTES,
+                 compresslevel: int = 6):
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be >= 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.compresslevel = compresslevel
+        numbers = [int(m.group(1)) for m in map(_SEGMENT.match, os.listdir(directory)) if m]
+        self._next = max(numbers) + 1 if numbers else 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._name = ""
+        self._bytes = 0
+        self._records = 0
+        self._samples: Dict[str, None] = {}
+        self.records = 0
+        self.segments = 0
+
+    def write(self, sample_id: str, record: IterationRecord) -> None:
+        """Append one record of sample_id."""
+        row = {"sample_id": sample_id}
+        row.update(record.to_dict())
+        line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            self._bytes += len(line)
+            self._records += 1
+            self._samples[sample_id] = None
+            self.records += 1
+            if self._bytes >= self.segment_bytes:
+                self._close_segment()
+
+    def _open(self) -> None:
+        self._name = _segment_name(self._next)
+        self._next += 1
+        self._file = gzip.open(os.path.join(self.directory, self._name), "wb",
+                               compresslevel=self.compresslevel)
+        self._bytes = 0
+        self._records = 0
+        self._samples = {}
+
+    def _close_segment(self) -> None:
+        self._file.close()
+        self._file = None
+        entry = {"segment": self._name, "records": self._records,
+                 "samples": list(self._samples)}
+        with open(os.path.join(self.directory, INDEX_NAME), "a", encoding="utf-8") as index:
+            index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.segments += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._close_segment()
+
+    def __enter__(self) -> "TraceSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _record(row: Dict) -> IterationRecord:
+    return IterationRecord(
+        iteration=row["iteration"],
+        gate=row["gate"],
+        score=row["score"],
+        violations=row["violations"],
+        corrections=row["corrections"],
+        rewrite_prompt=row["rewrite_prompt"],
+        text_length=row["text_length"],
+    )
+
+
+class TraceReader:
+    """Reconstructs traces written by a TraceSink, by sample_id."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._index: Dict[str, List[str]] = {}
+        indexed = set()
+        path = os.path.join(directory, INDEX_NAME)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as index:
+                for line in index:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    indexed.add(entry["segment"])
+                    for sample_id in entry["samples"]:
+                        self._index.setdefault(sample_id, []).append(entry["segment"])
+        # Unindexed segments: scanned once, here
+        for name in sorted(n for n in os.listdir(directory) if _SEGMENT.match(n)):
+            if name not in indexed:
+                for sample_id in dict.fromkeys(row["sample_id"] for row in self._rows(name)):
+                    self._index.setdefault(sample_id, []).append(name)
+        self._cached: Optional[str] = None
+        self._cache: Dict[str, List[Dict]] = {}
+
+    def _rows(self, name: str) -> Iterator[Dict]:
+        with gzip.open(os.path.join(self.directory, name), "rb") as segment:
+            try:
+                for line in segment:
+                    if line.endswith(b"\n"):
+                        yield json.loads(line)
+            except (EOFError, zlib.error):
+                return   # truncated segment: keep the complete records
+
+    def _segment(self, name: str) -> Dict[str, List[Dict]]:
+        if name != self._cached:
+            rows: Dict[str, List[Dict]] = {}
+            for row in self._rows(name):
+                rows.setdefault(row["sample_id"], []).append(row)
+            self._cached, self._cache = name, rows
+        return self._cache
+
+    def sample_ids(self) -> List[str]:
+        return list(self._index)
+
+    def __contains__(self, sample_id: str) -> bool:
+        return sample_id in self._index
+
+    def read(self, sample_id: str) -> List[IterationRecord]:
+        """sample_id's IterationRecords in iteration order; KeyError if absent."""
+        rows = []
+        for name in self._index[sample_id]:
+            rows.extend(self._segment(name).get(sample_id, ()))
+        rows.sort(key=lambda row: row["iteration"])
+        return [_record(row) for row in rows]
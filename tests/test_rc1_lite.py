@@ -7,26 +7,71 @@ Tests gate thresholds.
 Tests taxonomy aggregation.
 Tests full engine integration.
 Tests idempotence.
+Tests fused scan equivalence with the per-pattern reference.
+Tests the lexicon matcher against the regex scan.
+Tests the gate fast path against the full evaluation.
+Tests that instrumentation observes without changing results.
+Tests batch evaluation ordering.
+Tests chunked evaluation of long documents against a single pass.
+Tests that the differential fuzzer finds and minimizes a divergence.
+Tests the harness reports and the teaching loop around them, serial and async.
 
 Deterministic. No shared state. No external dependencies.
 """
 
 import sys
 import os
+import asyncio
+import io
+import json
+import multiprocessing
+import pickle
+import random
+import re
+import socket
+import tempfile
+import threading
+import time
+import tracemalloc
 
 # Ensure rc1_lite is importable (repo root = parent of tests/)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rc1_lite.engine import evaluate_output
+from rc1_lite import engine, server as rc1_server
+from rc1_lite.engine import (evaluate_output, evaluate_reference, evaluate_gate, evaluate_result,
+                             instrumented, GATE_ORDER, SCANNER)
+from rc1_lite.batch import evaluate_batch, iter_evaluate
+from rc1_lite.chunked import evaluate_chunked, plan_chunks
+from rc1_lite.delta import DeltaResult, evaluate_delta
+from rc1_lite.cli import run as run_cli
+from rc1_lite.server import EvaluationServer
+from rc1_lite.certify import certify, engine_hash, sign_report, verify_report
+from rc1_lite.bench import compare, run_benchmarks
+from rc1_lite import corpus as synthetic
+from rc1_lite.fuzz import generate_case, run_differential
+from rc1_lite.cache import ResultCache
+from rc1_lite.instrument import Histogram
+from rc1_lite.incremental import IncrementalEvaluator
+from rc1_lite.result import RC1Result
+from rc1_lite.scanner import FusedScanner, finditer_spans
+from rc1_lite.lexicon import compile_phrases
+from rc1_lite.window import slice_search
+from rc1_lite.context import DocumentContext, SENT_SPLIT
 from rc1_lite.scoring import compute_score, compute_gate, compute_taxonomy, V_MAX
 from rc1_lite.version import VERSION
 from rc1_lite.constraints.h2_metaphor import h2_metaphor
 from rc1_lite.constraints.absolute_claim import absolute_claim
 from rc1_lite.constraints.intent_execution import intent_execution
 from rc1_lite.constraints.abstraction_escalation import abstraction_escalation
-from rc1_lite.constraints.rephrasing_loop import rephrasing_loop
+from rc1_lite.constraints.rephrasing_loop import rephrasing_loop, _jaccard, _jaccard_sets
 from rc1_lite.constraints.ungrounded_prescriptive import ungrounded_prescriptive
 from rc1_lite.constraints.self_reference import self_reference
+from harness import LLMHarness, build_report, deterministic_rewrite
+from harness.schema import CorrectionVector
+from teaching_loop.loop import MAX_ITERATIONS, run_teaching_loop
+from teaching_loop.concurrent import iter_teaching_loops, run_teaching_loop_async
+from teaching_loop.trace import TraceReader, TraceSink
+from teaching_loop.bench import SimulatedRewriter, run_load_benchmark
 
 
 passed = 0
@@ -269,6 +314,908 @@ for i, text in enumerate(test_inputs):
           f"S={r['score']} != 1-{r['V']}/14={expected}")
 
 
+# ═══════════════════════════════════════════
+# FUSED SCAN EQUIVALENCE
+# ═══════════════════════════════════════════
+print("\n── Fused Scan ──")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+with open(os.path.join(ROOT, "samples", "batch.jsonl")) as f:
+    corpus = [json.loads(line)["text"] for line in f if line.strip()]
+with open(os.path.join(ROOT, "certification", "test-vectors.jsonl")) as f:
+    corpus += [json.loads(line)["input"] for line in f if line.strip()]
+corpus += [bad, clean, ""] + test_inputs
+
+# Seeded shuffles: sentence-boundary, case and whitespace variants
+rng = random.Random(2026)
+words = " ".join(corpus).split()
+for _ in range(60):
+    picked = [rng.choice(words) for _ in range(rng.randint(1, 400))]
+    seps = [rng.choice([" ", " ", "  ", "\n", ". ", "! "]) for _ in picked]
+    text = "".join(w + sep for w, sep in zip(picked, seps))
+    corpus.append(text.upper() if rng.random() < 0.1 else text)
+corpus += ["Use `f(x)` in a.py. It is ſeed, KEY and İf.", "12 ms. 5MB i.e. RFC 793!"]
+
+mismatched_hits = 0
+for text in corpus:
+    scan = SCANNER.scan(text)
+    for tag, pats in SCANNER.families.items():
+        if scan.hits(tag) != finditer_spans(pats, text):
+            mismatched_hits += 1
+check("fused_hits_eq_finditer", mismatched_hits == 0,
+      f"{mismatched_hits} family hit lists differ")
+
+# Qualifier windows: bisect index vs slice search, including word-cut edges
+window_tags = ["ABS_SCOPE", "PRESC_GROUND", "INTENT_MECH", "H2_DISSOLVE", "SELF_QUAL"]
+window_diffs = 0
+for text in corpus + ["3 msec mayhem ifs i.e.x `a` b` in some casesx"]:
+    scan = SCANNER.scan(text)
+    for tag in window_tags:
+        index = scan.window(tag)
+        reference = slice_search(SCANNER.families[tag], text)
+        for _ in range(20):
+            cs = rng.randint(0, len(text))
+            ce = min(len(text), cs + rng.choice([3, 8, 70, 105, 120, 140]))
+            if index.has(cs, ce) != reference(cs, ce):
+                window_diffs += 1
+check("window_index_eq_slice_search", window_diffs == 0,
+      f"{window_diffs} windows differ")
+
+diverged = [t for t in corpus if evaluate_output(t) != evaluate_reference(t)]
+check("fused_eq_reference", not diverged,
+      f"{len(diverged)} diverge, first={diverged[0][:80]!r}" if diverged else "")
+
+
+# ═══════════════════════════════════════════
+# LEXICON MATCHER
+# ═══════════════════════════════════════════
+print("\n── Lexicon ──")
+
+regex_scanner = FusedScanner(SCANNER.families, lexicon=False)
+check("lexicon_covers_markers",
+      len(SCANNER._literal) > 80 and all(
+          "`" in SCANNER._pattern(k).pattern for k in SCANNER._regex))
+check("lexicon_phrase_order",
+      compile_phrases(re.compile(r"\b(?:veins?|in\s+code:?)\b", re.I))[2][:3]
+      == [(("lit", "veins"),), (("lit", "vein"),), (("lit", "in"), ("space", 1), ("lit", "code:"))])
+check("lexicon_rejects_backtracking", all(
+    compile_phrases(re.compile(src)) is None
+    for src in [r"\b\w+s\b", r"\b(?:\w+|\.x)",r"`[^`]+`", r"\ba\b\s+\bb\b", r"\b(a)\b"]))
+
+# Unicode case folding: re.I matches ſ/s, K/k, İ/i, ı/i both ways
+confusable = str.maketrans({"s": "ſ", "k": "\u212a", "i": "\u0130", "I": "\u0131", "S": "\u017f"})
+lexicon_diffs = 0
+for text in corpus + [t.translate(confusable) for t in corpus[::3]]:
+    for pos in (0, rng.randint(0, len(text)), rng.randint(0, len(text))):
+        fused, regex = SCANNER.scan(text, pos), regex_scanner.scan(text, pos)
+        for tag in SCANNER.tags:
+            if fused.raw(tag) != regex.raw(tag):
+                lexicon_diffs += 1
+check("lexicon_raw_eq_regex", lexicon_diffs == 0, f"{lexicon_diffs} raw lists differ")
+
+
+# ═══════════════════════════════════════════
+# DOCUMENT CONTEXT
+# ═══════════════════════════════════════════
+print("\n── Document Context ──")
+
+contexts = [(t, DocumentContext(t)) for t in corpus]
+check("context_sentences_eq_split",
+      all(ctx.sentences == SENT_SPLIT.split(t) for t, ctx in contexts))
+check("context_jaccard_eq_strings", all(
+    _jaccard_sets(ctx.sentence_sets[i], ctx.sentence_sets[i + 1])
+    == _jaccard(ctx.sentences[i], ctx.sentences[i + 1])
+    for _, ctx in contexts for i in range(len(ctx.sentences) - 1)))
+
+shared = DocumentContext("Short. Short. Short again here.")
+check("context_shared_by_operators",
+      rephrasing_loop(shared.text, shared) == rephrasing_loop(shared.text)
+      and shared._sentence_sets is not None)
+
+
+# ═══════════════════════════════════════════
+# GATE FAST PATH
+# ═══════════════════════════════════════════
+print("\n── Gate ──")
+
+gates = [(evaluate_gate(t), evaluate_output(t)) for t in corpus]
+check("gate_eq_full", all(g["gate"] == r["gate"] for g, r in gates))
+check("gate_v_lower_bound", all(
+    g["V_lower"] <= sum(v["severity"] for v in r["violations"]) for g, r in gates))
+check("gate_complete_is_exact", all(
+    g["V_lower"] == sum(v["severity"] for v in r["violations"])
+    for g, r in gates if len(g["evaluated"]) == len(GATE_ORDER)))
+check("gate_early_exit",
+      all(len(g["evaluated"]) >= 4 for g, _ in gates)
+      and any(len(g["evaluated"]) < len(GATE_ORDER) for g, _ in gates))
+
+
+print("\n── Deadline ──")
+
+long_text = " ".join(corpus) * 3
+check("deadline_generous_exact",
+      all(evaluate_output(t, deadline_ms=60_000) == evaluate_output(t) for t in corpus)
+      and evaluate_output(long_text, deadline_ms=60_000) == evaluate_output(long_text))
+
+def best_of(fn, runs=2):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return result, min(timings)
+
+# A deadline that is never hit costs about what the fused path does
+large = " ".join(corpus) * (400_000 // len(" ".join(corpus)) + 1)
+plain, plain_s = best_of(lambda: evaluate_output(large))
+bounded, bounded_s = best_of(lambda: evaluate_output(large, deadline_ms=60_000))
+check("deadline_generous_large_fast", bounded == plain and bounded_s < 2 * plain_s + 0.05,
+      f"plain {plain_s:.3f}s, deadline {bounded_s:.3f}s")
+expired = evaluate_output(long_text, deadline_ms=0)
+check("deadline_expired_partial", expired["partial"] and expired["chars"] == 0
+      and expired["length"] == len(long_text) and expired["gate"] is None
+      and (expired["V_lower"], expired["V_upper"]) == (0, V_MAX))
+
+heavy = " ".join(["You must always obey. The soul is the heart of it."] * 8000)
+full = evaluate_output(heavy)
+severity = {r["type"]: r["severity"] for r in full["violations"]}
+partial = evaluate_output(heavy, deadline_ms=5)
+check("deadline_partial_sound", partial["partial"] and 0 < partial["chars"] < len(heavy)
+      and partial["V_lower"] <= full["V"] <= partial["V_upper"]
+      and all(lo <= severity.get(kind, 0) <= hi for kind, (lo, hi) in partial["bounds"].items())
+      and partial["gate"] in (None, full["gate"]) and partial["V_lower"] > 0)
+try:
+    evaluate_output("x", deadline_ms=-1)
+    check("deadline_negative_rejected", False)
+except ValueError:
+    check("deadline_negative_rejected", True)
+
+
+# ═══════════════════════════════════════════
+# INSTRUMENTATION
+# ═══════════════════════════════════════════
+print("\n── Instrumentation ──")
+
+plain = [evaluate_output(t) for t in corpus]
+with instrumented() as inst:
+    observed = [evaluate_output(t) for t in corpus]
+check("instrument_results_unchanged", observed == plain)
+check("instrument_detached_after_block", engine._instrumentation is None)
+
+snapshot = json.loads(inst.to_json())
+stages = snapshot["stages"]
+check("instrument_stages", snapshot["calls"] == len(corpus)
+      and list(stages) == ["scan", "H2", "ABS", "INTENT", "ESC", "LOOP", "PRESC", "SELF"]
+      and all(m["count"] == len(corpus) for st in stages.values() for m in st.values()))
+check("instrument_hit_counts", all(
+    stages[tag]["hits"]["sum"] == sum(len(SCANNER.scan(t).hits(tag)) for t in corpus)
+    for tag in ("H2", "ABS", "INTENT", "PRESC", "SELF")))
+check("instrument_window_counts",
+      stages["LOOP"]["window_checks"]["sum"] == 0
+      and stages["H2"]["window_checks"]["sum"] == stages["H2"]["hits"]["sum"]
+      and stages["ESC"]["window_checks"]["sum"] > 0)
+
+hist = Histogram()
+for value in (0, 1, 2, 3, 4, 100):
+    hist.add(value)
+check("histogram_buckets", hist.buckets() == [(0, 1), (1, 1), (3, 2), (7, 1), (127, 1)]
+      and hist.quantile(0.5) == 3 and hist.quantile(1.0) == 100)
+
+
+# ═══════════════════════════════════════════
+# RESULT CACHE
+# ═══════════════════════════════════════════
+print("\n── Cache ──")
+
+cache = ResultCache(max_entries=8)
+first = cache.evaluate(bad)
+check("cache_result_exact", first == evaluate_output(bad)
+      and json.dumps(first) == json.dumps(evaluate_output(bad)))
+check("cache_hit_same_object", cache.evaluate(bad) is first
+      and (cache.hits, cache.misses) == (1, 1))
+
+mutations = [
+    lambda: first.__setitem__("gate", "PASS"),
+    lambda: first["violations"].append({}),
+    lambda: first["violations"][0]["metadata"].update(reason="x"),
+    lambda: first["taxonomy"].pop("H2"),
+]
+refused = 0
+for mutate in mutations:
+    try:
+        mutate()
+    except TypeError:
+        refused += 1
+check("cache_results_immutable", refused == len(mutations)
+      and cache.evaluate(bad) == evaluate_output(bad))
+
+first.__init__(gate="PASS")
+first["violations"].__init__([])
+check("cache_reinit_ignored", cache.evaluate(bad) == evaluate_output(bad)
+      and pickle.loads(pickle.dumps(first)) == first)
+
+for t in corpus[:20]:
+    cache.evaluate(t)
+check("cache_entry_bound", len(cache) == 8 and cache.evictions > 0)
+
+small = ResultCache(max_bytes=4000)
+for t in corpus[:20]:
+    small.evaluate(t)
+check("cache_byte_bound", 0 < small.stats()["bytes"] <= 4000)
+
+shared_cache = ResultCache(max_entries=16)
+texts = corpus[:12] * 4
+mismatches = []
+
+def worker(offset):
+    for t in texts[offset:] + texts[:offset]:
+        if shared_cache.evaluate(t) != evaluate_output(t):
+            mismatches.append(t)
+
+threads = [threading.Thread(target=worker, args=(k * 5,)) for k in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+stats = shared_cache.stats()
+check("cache_threaded", not mismatches
+      and stats["hits"] + stats["misses"] == 4 * len(texts) and stats["entries"] <= 16)
+
+
+# ═══════════════════════════════════════════
+# INCREMENTAL (STREAMED) EVALUATION
+# ═══════════════════════════════════════════
+print("\n── Incremental ──")
+
+rng = random.Random(7)
+
+
+def stream(text, sizes, every_prefix=False):
+    """Feed text in random-sized chunks; (session, all prefix results exact)."""
+    session = IncrementalEvaluator()
+    pos = 0
+    prefixes_ok = True
+    while pos < len(text):
+        chunk = text[pos:pos + rng.choice(sizes)]
+        pos += len(chunk)
+        result = session.append(chunk)
+        if every_prefix and result != evaluate_output(text[:pos]):
+            prefixes_ok = False
+    return session, prefixes_ok
+
+
+check("incremental_empty", IncrementalEvaluator().result() == evaluate_output(""))
+
+short = [t for t in corpus if len(t) < 1500][:40]
+check("incremental_every_prefix", all(stream(t, (1, 2, 5, 17), every_prefix=True)[1] for t in short))
+check("incremental_final_exact", all(
+    stream(t, (3, 40, 400))[0].result() == evaluate_output(t) for t in corpus))
+
+phrases = "I am able to | is the heart of | no one can | in some cases | we need to. ".split("|")
+tricky = " ".join(rng.choice(phrases) for _ in range(200))
+check("incremental_multiword_markers", stream(tricky, (1, 2, 3), every_prefix=True)[1])
+check("incremental_indexed_chunks", all(
+    stream(t, (7, 2500, 9000), every_prefix=True)[1] for t in (long_text, " ".join([tricky] * 6))))
+
+
+def bounds_hold(text, sizes):
+    """After every chunk, bounds() contains the final and the prefix severities."""
+    session = IncrementalEvaluator()
+    final = {r["type"]: r["severity"] for r in evaluate_output(text)["violations"]}
+    pos = 0
+    while pos < len(text):
+        chunk = text[pos:pos + rng.choice(sizes)]
+        pos += len(chunk)
+        session.feed(chunk)
+        prefix = {r["type"]: r["severity"] for r in evaluate_output(text[:pos])["violations"]}
+        for kind, (lo, hi) in session.bounds().items():
+            if not lo <= final.get(kind, 0) <= hi or not lo <= prefix.get(kind, 0) <= hi:
+                return False
+    return session.result() == evaluate_output(text)
+
+
+check("incremental_bounds_sound", all(bounds_hold(t, (5, 60, 300)) for t in short + [tricky]))
+session = IncrementalEvaluator()
+session.feed("The soul is the heart of it. " * 3 + "It works because of section 2. " * 8)
+check("incremental_bounds_settle",
+      list(session.bounds()) == [f("")["type"] for f in engine.CONSTRAINTS]
+      and session.bounds()["H2"][0] == 1 and session.bounds()["LOOP"][0] == 2)
+
+
+# ═══════════════════════════════════════════
+# COMPACT RESULT
+# ═══════════════════════════════════════════
+print("\n── Compact Result ──")
+
+packed = [evaluate_result(t) for t in corpus]
+check("compact_to_dict_exact",
+      all(r.to_dict() == evaluate_output(t) for r, t in zip(packed, corpus)))
+check("compact_mapping_equal",
+      all(r == evaluate_output(t) and dict(r) == evaluate_output(t)
+          for r, t in zip(packed, corpus)))
+check("compact_scalars",
+      all((r.V, r.score, r.gate) == (d["V"], d["score"], d["gate"])
+          and sum(r.severities) == r.V for r, d in zip(packed, map(evaluate_output, corpus))))
+check("compact_pickle_roundtrip",
+      all(pickle.loads(pickle.dumps(r)) == r for r in packed))
+check("compact_violations_fresh",
+      all(r.violations is not r.violations for r in packed if r.V))
+
+# Retained memory, the point of the format
+tracemalloc.start()
+as_dicts = [evaluate_output(t) for t in corpus]
+dict_bytes = tracemalloc.get_traced_memory()[0]
+del as_dicts
+tracemalloc.stop()
+tracemalloc.start()
+as_packed = [evaluate_result(t) for t in corpus]
+packed_bytes = tracemalloc.get_traced_memory()[0]
+del as_packed
+tracemalloc.stop()
+check("compact_smaller", packed_bytes * 2 < dict_bytes,
+      f"{packed_bytes} vs {dict_bytes} bytes")
+
+
+# ═══════════════════════════════════════════
+# BATCH EVALUATION
+# ═══════════════════════════════════════════
+print("\n── Batch ──")
+
+expected = [evaluate_output(t) for t in corpus]
+
+check("batch_inprocess_ordered", evaluate_batch(corpus, jobs=1) == expected)
+
+# Workers must not re-run this script: fork where the platform has it
+if "fork" in multiprocessing.get_all_start_methods():
+    ctx = multiprocessing.get_context("fork")
+    check("batch_pool_ordered",
+          evaluate_batch(iter(corpus), jobs=2, chunksize=7, mp_context=ctx) == expected)
+
+    streamed = list(iter_evaluate(corpus, jobs=2, chunksize=5, window=3, mp_context=ctx))
+    check("stream_pool_complete",
+          sorted(i for i, _ in streamed) == list(range(len(corpus))))
+    check("stream_pool_results",
+          all(result == expected[i] for i, result in streamed))
+
+    ordered = list(iter_evaluate(corpus, jobs=2, chunksize=3, window=2,
+                                 ordered=True, mp_context=ctx))
+    check("stream_pool_ordered", [i for i, _ in ordered] == list(range(len(corpus))))
+
+    compact = evaluate_batch(corpus, jobs=2, chunksize=4, mp_context=ctx, compact=True)
+    check("batch_pool_compact",
+          all(isinstance(r, RC1Result) for r in compact) and compact == expected)
+
+    gates = list(iter_evaluate([None] + corpus[:20] + [None], jobs=2, chunksize=3,
+                               ordered=True, mp_context=ctx, gate_only=True))
+    check("stream_pool_gate_only_placeholders",
+          [r for _, r in gates] == [None] + [evaluate_gate(t) for t in corpus[:20]] + [None])
+
+
+# ═══════════════════════════════════════════
+# CHUNKED EVALUATION
+# ═══════════════════════════════════════════
+print("\n── Chunked ──")
+
+# Tiny chunks put a cut at nearly every sentence start
+long_texts = [t for t in corpus if len(SENT_SPLIT.split(t)) > 3]
+long_texts += ["Took 5. MB was big. Took 5. MB was big.",
+               "The code parses tokens. Consciousness transcends. " * 3,
+               "I can do it! Maybe. I can. We guarantee it? No. " * 5]
+chunk_diffs = 0
+for text in long_texts:
+    expected_result = evaluate_output(text)
+    for size in (1, 17, 200):
+        if evaluate_chunked(text, jobs=1, chunk_chars=size) != expected_result:
+            chunk_diffs += 1
+check("chunked_eq_full", chunk_diffs == 0, f"{chunk_diffs} chunked results differ")
+
+spans = DocumentContext("One. Two. Three. Four.").sentence_spans
+check("chunk_plan_covers", plan_chunks(spans, 10) == [(0, 2), (2, 4)]
+      and plan_chunks(spans, 1000) == [(0, 4)])
+
+document = " ".join(long_texts) * 4
+if "fork" in multiprocessing.get_all_start_methods():
+    check("chunked_pool_eq_full",
+          evaluate_chunked(document, jobs=2, chunk_chars=2000,
+                           mp_context=multiprocessing.get_context("fork"))
+          == evaluate_output(document))
+
+
+# ═══════════════════════════════════════════
+# DELTA RE-EVALUATION
+# ═══════════════════════════════════════════
+print("\n── Delta ──")
+
+# Rewrites as a correction loop makes them: a few sentences replaced,
+# dropped or inserted; small chunks put cuts near every edit
+delta_diffs = 0
+rng = random.Random(18)
+for text in long_texts:
+    for size in (1, 64, 1024):
+        previous, result = None, None
+        current = text
+        for _ in range(4):
+            result = evaluate_delta(previous, result, current, chunk_chars=size)
+            if result != evaluate_output(current):
+                delta_diffs += 1
+            sentences = SENT_SPLIT.split(current)
+            i = rng.randrange(len(sentences))
+            sentences[i:i + rng.randint(0, 1)] = rng.choice(
+                [[], ["The parser returns a list."], [rng.choice(corpus)[:200]]])
+            previous, current = current, " ".join(sentences)
+check("delta_eq_full", delta_diffs == 0, f"{delta_diffs} delta results differ")
+
+first = evaluate_delta(None, None, document)
+edited = document.replace("Consciousness transcends.", "The loop halts.", 1)
+second = evaluate_delta(document, first, edited)
+check("delta_reuses_chunks",
+      isinstance(second, DeltaResult) and second == evaluate_output(edited)
+      and len(set(first.chunks) & set(second.chunks)) >= len(second.chunks) - 3)
+check("delta_plain_previous",
+      evaluate_delta(document, evaluate_output(document), edited) == evaluate_output(edited)
+      and evaluate_delta(edited, second, edited) == second)
+
+
+# ═══════════════════════════════════════════
+# DIFFERENTIAL FUZZING
+# ═══════════════════════════════════════════
+print("\n── Differential Fuzz ──")
+
+
+def soulless(y):
+    """A deliberately wrong engine: passes anything mentioning 'soul'."""
+    result = evaluate_output(y)
+    return dict(result, gate="PASS") if "soul" in y.lower() else result
+
+
+check("fuzz_cases_deterministic",
+      [generate_case(5, i) for i in range(50)] == [generate_case(5, i) for i in range(50)]
+      and generate_case(5, 0) != generate_case(6, 0))
+
+report = run_differential(evaluate_output, cases=400, seed=11, jobs=1)
+check("fuzz_optimized_eq_reference", report["divergence"] is None and report["cases"] == 400
+      and all(report["phases"].values()), str(report["divergence"])[:200])
+
+report = run_differential(soulless, cases=2000, seed=3, jobs=1, block=50)
+divergence = report["divergence"]
+check("fuzz_finds_divergence", divergence is not None
+      and divergence["expected"] != divergence["actual"]
+      and report["cases"] == divergence["index"] + 1)
+check("fuzz_minimizes", divergence is not None
+      and len(divergence["minimized"]) < len(divergence["input"])
+      and "soul" in divergence["minimized"].lower()
+      and divergence["minimized_expected"] != divergence["minimized_actual"])
+
+
+print("\n── Bench ──")
+
+docs = synthetic.fp_study_corpus()
+check("corpus_deterministic",
+      docs == synthetic.fp_study_corpus() and docs != synthetic.fp_study_corpus(seed=1)
+      and synthetic.class_document("loop_spiral", random.Random(2))
+      == synthetic.class_document("loop_spiral", random.Random(2)))
+check("corpus_fp_study_distribution",
+      sorted(evaluate_output(d)["V"] for d in docs) == [0] * 168 + [1] * 32
+      and all(40 <= len(d.split()) <= 120 for d in docs))
+check("corpus_document_length", all(
+    len(synthetic.document(n, density, random.Random(n))) == n
+    for n in (0, 1, 100, 5000) for density in (0.0, 0.3, 1.0)))
+sample_V = {c: evaluate_output(synthetic.class_document(c, random.Random(0)))["V"]
+            for c in synthetic.CLASSES}
+check("corpus_classes",
+      all(sample_V[c] == 0 for c in ("clean_tech", "mixed_good", "dissolved_metaphor"))
+      and all(sample_V[c] > 0 for c in ("metaphor_heavy", "epistemic_fail", "all_intent")))
+
+report = run_benchmarks(suites=["class"], quick=True, budget=0)
+case = report["results"]["class/metaphor_heavy"]
+check("bench_report_shape",
+      set(report["results"]) == {f"class/{c}" for c in synthetic.CLASSES + ("fp_study",)}
+      and case["e2e_us"]["count"] == case["docs"] and case["mean_V"] == 2
+      and set(case["stages"]) == {"scan", "H2", "ABS", "INTENT", "ESC", "LOOP", "PRESC", "SELF"}
+      and case["stages"]["H2"]["hits"]["min"] > 0
+      and case["e2e_us"]["p50"] <= case["e2e_us"]["p99"] <= case["e2e_us"]["max"]
+      and json.loads(json.dumps(report)) == report)
+
+slower = json.loads(json.dumps(report))
+for result in report["results"].values():
+    result["e2e_us"].update(p50=1000, p90=1000)
+for result in slower["results"].values():
+    result["e2e_us"].update(p50=1000, p90=1000)
+slower["results"]["class/clean_tech"]["e2e_us"].update(p50=2000)
+regressions = [(r["case"], r["stage"], r["metric"]) for r in compare(slower, report)]
+check("bench_compare_flags", ("class/clean_tech", "e2e", "p50") in regressions
+      and all(r[1] != "e2e" or r[0] == "class/clean_tech" for r in regressions)
+      and not [r for r in compare(report, report) if r["stage"] == "e2e"])
+slower["calibration_us"] = report["calibration_us"] * 2
+check("bench_compare_calibrated", not [r for r in compare(slower, report) if r["stage"] == "e2e"])
+
+
+# ═══════════════════════════════════════════
+# CORPUS CLI
+# ═══════════════════════════════════════════
+print("\n── CLI ──")
+
+with open(os.path.join(os.path.dirname(__file__), "..", "samples", "batch.jsonl"), "rb") as f:
+    jsonl = f.read()
+jsonl = jsonl.rstrip(b"\n") + b"\nnot json\n\n[1]\n" + b'{"id": "no_text"}\n' + jsonl
+
+out = io.StringIO()
+stats = run_cli(io.BytesIO(jsonl), out, emit_offsets=True)
+rows = [json.loads(line) for line in out.getvalue().splitlines()]
+records = [json.loads(line) for line in jsonl.splitlines() if line.startswith(b'{"id": "')
+           and b'"text"' in line]
+check("cli_row_count", len(rows) == len(records) + 3 and stats["records"] == len(rows))
+check("cli_errors_in_place", [r["id"] for r in rows if "error" in r] == [None, None, "no_text"]
+      and "error" in rows[8] and stats["errors"] == 3)
+scored = [r for r in rows if "error" not in r]
+check("cli_results_exact", all(
+    {k: v for k, v in r.items() if k not in ("id", "next_offset")} == evaluate_output(rec["text"])
+    and r["id"] == rec["id"]
+    for r, rec in zip(scored, records)))
+check("cli_bytes", stats["bytes"] == len(jsonl) and rows[-1]["next_offset"] == len(jsonl))
+
+resume = rows[10]["next_offset"]
+out = io.StringIO()
+buf = io.BytesIO(jsonl)
+buf.seek(resume)
+run_cli(buf, out, offset=resume, gate_only=True)
+tail = [json.loads(line) for line in out.getvalue().splitlines()]
+check("cli_resume_gate_only", tail == [{"id": r["id"], "gate": r["gate"]} for r in rows[11:]])
+
+
+class CountingLines(io.BytesIO):
+    """Input that counts the lines read so far."""
+    read_lines = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        self.read_lines += 1
+        return line
+
+
+class LagOut(io.StringIO):
+    """Output recording, per row written, how many input lines were read by then."""
+
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.read_at = []
+
+    def write(self, text):
+        self.read_at.append(self.source.read_lines)
+        return super().write(text)
+
+
+# A run of bad lines behind a text in flight is held to the window
+flood = b'{"id": 0, "text": "The soul is the heart of it."}\n' + b"not json\n" * 2000 \
+    + b'{"id": 1, "text": "It works."}\n'
+for jobs in (1, 2) if "fork" in multiprocessing.get_all_start_methods() else (1,):
+    source = CountingLines(flood)
+    out = LagOut(source)
+    stats = run_cli(source, out, jobs=jobs, chunksize=4, gate_only=True,
+                    mp_context=multiprocessing.get_context("fork") if jobs > 1 else None)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    check(f"cli_errors_bounded_jobs{jobs}",
+          len(lines) == 2002 and stats["errors"] == 2000
+          and [r["id"] for r in lines if "gate" in r] == [0, 1]
+          and max(at - i for i, at in enumerate(out.read_at)) <= 4 * 2 * jobs + 1,
+          f"lag {max(at - i for i, at in enumerate(out.read_at))}")
+
+
+
+# ═══════════════════════════════════════════
+# CERTIFICATION RUNNER
+# ═══════════════════════════════════════════
+print("\n── Certification ──")
+
+with open(os.path.join(ROOT, "certification", "test-vectors.jsonl"), "rb") as f:
+    vectors = f.read()
+report = certify(io.BytesIO(vectors), jobs=1)
+check("certify_reference_compliant",
+      report["compliant"] and report["vectors"]["passed"] == len(vectors.splitlines())
+      and report["engine"]["sha256"] == engine_hash()["sha256"])
+
+altered = vectors.replace(b'"V": 2,', b'"V": 5,', 1) + b"not json\n"
+out = io.StringIO()
+report = certify(io.BytesIO(altered), jobs=1, results_out=out)
+rows = [json.loads(line) for line in out.getvalue().splitlines()]
+check("certify_diff_reported",
+      not report["compliant"] and report["vectors"]["failed"] == 1
+      and report["vectors"]["errors"] == 1 and report["mismatches"][0]["fields"] == ["V"]
+      and len(rows) == report["vectors"]["vectors"] and sum(r["match"] for r in rows) == 12)
+
+report = certify(io.BytesIO(vectors), command=f"{sys.executable} -m rc1_lite -q")
+check("certify_external_command", report["compliant"] and report["vectors"]["passed"] == 13)
+
+sign_report(report, "tests", key=b"k")
+check("certify_signoff", verify_report(report) and verify_report(report, key=b"k")
+      and not verify_report(report, key=b"other"))
+report["vectors"]["failed"] = 0
+report["compliant"] = False
+check("certify_signoff_tamper", not verify_report(report))
+
+
+# ═══════════════════════════════════════════
+# EVALUATION SERVER
+# ═══════════════════════════════════════════
+print("\n── Server ──")
+
+async def http(reader, writer, method, path, body=b"", close=False):
+    head = f"{method} {path} HTTP/1.1\r\nHost: t\r\nContent-Length: {len(body)}\r\n"
+    if close:
+        head += "Connection: close\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    head = (await reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")
+    headers = dict(line.lower().split(": ", 1) for line in head[1:] if line)
+    return int(head[0].split()[1]), headers, await reader.readexactly(int(headers["content-length"]))
+
+
+async def serve_checks(sock_dir):
+    unix_path = os.path.join(sock_dir, "rc1.sock") if hasattr(socket, "AF_UNIX") else None
+    async with EvaluationServer(jobs=1, batch_window_ms=5) as server:
+        await server.start(port=0, unix_path=unix_path)
+        host, port = server.http_address
+
+        async def client(texts):
+            reader, writer = await asyncio.open_connection(host, port)
+            replies = [await http(reader, writer, "POST", "/evaluate",
+                                  json.dumps({"text": t}).encode()) for t in texts]
+            writer.close()
+            return replies
+
+        replies = await asyncio.gather(*(client(corpus[i::4]) for i in range(4)))
+        check("server_http_exact", all(
+            status == 200 and json.loads(body) == evaluate_output(t)
+            for i, group in enumerate(replies)
+            for (status, _, body), t in zip(group, corpus[i::4])))
+        check("server_microbatches",
+              server.batch_sizes.count < len(corpus) and server.batch_sizes.max > 1)
+
+        reader, writer = await asyncio.open_connection(host, port)
+        errors = [(await http(reader, writer, "GET", "/nope"))[0],
+                  (await http(reader, writer, "GET", "/evaluate"))[0],
+                  (await http(reader, writer, "POST", "/evaluate", b"{"))[0]]
+        status, headers, metrics = await http(reader, writer, "GET", "/metrics", close=True)
+        check("server_errors_keepalive", errors == [404, 405, 400])
+        check("server_metrics",
+              status == 200 and headers["connection"] == "close"
+              and f"rc1_evaluations_total {len(corpus)}" in metrics.decode()
+              and 'rc1_requests_total{protocol="http",status="404"} 1' in metrics.decode())
+
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+            writer.write(b"".join(json.dumps({"id": i, "text": t}).encode() + b"\n"
+                                  for i, t in enumerate(corpus[:10])) + b"[1]\n")
+            rows = [json.loads(await reader.readline()) for _ in range(11)]
+            writer.close()
+            check("server_lines_in_order",
+                  [r["id"] for r in rows] == list(range(10)) + [None]
+                  and all({k: v for k, v in r.items() if k != "id"} == evaluate_output(t)
+                          for r, t in zip(rows[:10], corpus)) and "error" in rows[-1])
+
+    if unix_path:
+        # A flood past max_pending is read as answers go out, not refused
+        pipeline = rc1_server.LINE_PIPELINE
+        rc1_server.LINE_PIPELINE = 8
+        try:
+            async with EvaluationServer(jobs=1, batch_window_ms=1, max_pending=16) as server:
+                await server.start(port=None, unix_path=unix_path)
+                reader, writer = await asyncio.open_unix_connection(unix_path)
+                writer.write(b"".join(json.dumps({"id": i, "text": corpus[i % len(corpus)]})
+                                      .encode() + b"\n" for i in range(400)))
+                rows = [json.loads(await reader.readline()) for _ in range(400)]
+                writer.close()
+                check("server_lines_bounded",
+                      [r["id"] for r in rows] == list(range(400))
+                      and not any("error" in r for r in rows) and server.rejected == 0)
+        finally:
+            rc1_server.LINE_PIPELINE = pipeline
+
+    async with EvaluationServer(jobs=1, batch_window_ms=200, max_pending=1) as server:
+        await server.start(port=0)
+        host, port = server.http_address
+
+        async def one():
+            reader, writer = await asyncio.open_connection(host, port)
+            return await http(reader, writer, "POST", "/evaluate", b'{"text": "x"}', close=True)
+
+        first = asyncio.ensure_future(one())
+        await asyncio.sleep(0.05)
+        status, headers, _ = await one()
+        check("server_backpressure_429",
+              status == 429 and "retry-after" in headers and (await first)[0] == 200
+              and server.rejected == 1)
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return
+    # Fork is where workers could inherit the listeners
+    async with EvaluationServer(jobs=2, batch_window_ms=5,
+                                mp_context=multiprocessing.get_context("fork")) as server:
+        await server.start(port=0)
+        host, port = server.http_address
+
+        async def closed():
+            reader, writer = await asyncio.open_connection(host, port)
+            status, _, _ = await http(reader, writer, "POST", "/evaluate",
+                                      json.dumps({"text": corpus[0]}).encode(), close=True)
+            rest = await asyncio.wait_for(reader.read(), 10)
+            writer.close()
+            return status == 200 and rest == b""
+
+        # Pool workers hold no inherited socket: the server's close is the last
+        check("server_pool_close_eof", all(await asyncio.gather(*(closed() for _ in range(6)))))
+
+
+with tempfile.TemporaryDirectory() as sock_dir:
+    asyncio.run(serve_checks(sock_dir))
+
+
+# ═══════════════════════════════════════════
+# TEACHING LOOP
+# ═══════════════════════════════════════════
+print("\n── Teaching Loop ──")
+
+harness = LLMHarness()
+reports = [harness.run(t) for t in corpus]
+check("harness_report_exact", all(
+    r.V == evaluate_output(t)["V"] and r.gate == evaluate_output(t)["gate"]
+    and [v.type for v in r.violations] == [v["type"] for v in evaluate_output(t)["violations"]]
+    for r, t in zip(reports, corpus)))
+
+spans = DocumentContext(bad).sentence_spans
+report = harness.run(bad)
+check("harness_sentences", all(
+    0 <= v.sentence < len(spans)
+    and (v.location + 1 == v.sentence if v.type in ("ESC", "LOOP")
+         else spans[v.sentence][0] <= v.location < spans[v.sentence][1] + 1)
+    for v in report.violations))
+check("harness_corrections",
+      len(report.corrections) == len(report.violations)
+      and [c.severity for c in report.corrections]
+      == sorted((c.severity for c in report.corrections), reverse=True)
+      and all(f"sentence {c.sentence}: {c.action}" in report.rewrite_prompt
+              for c in report.corrections)
+      and report.rewrite_prompt.endswith(bad)
+      and harness.run(clean).rewrite_prompt == "")
+
+rewritten = deterministic_rewrite(bad, report.corrections)
+check("harness_rewrite_reduces",
+      rewritten == deterministic_rewrite(bad, report.corrections)
+      and evaluate_output(rewritten)["V"] < report.V)
+
+bridged = "We ship to Berlin. The plan scales. I agree. NASA agrees. Berlin agrees."
+bridge = [CorrectionVector("ESC", 1, i, "bridge_abstraction", "", "") for i in range(5)]
+check("harness_rewrite_keeps_names",
+      deterministic_rewrite(bridged, bridge)
+      == "In practice, we ship to Berlin. In practice, the plan scales. In practice, I agree. "
+         "In practice, NASA agrees. In practice, Berlin agrees.")
+
+first = harness.run(document)
+edited = deterministic_rewrite(document, first.corrections)
+check("harness_delta_previous",
+      harness.run(edited, previous=first) == build_report(edited, evaluate_output(edited))
+      == LLMHarness(delta=False).run(edited))
+
+loops = [run_teaching_loop(t, harness, deterministic_rewrite, sample_id=f"s{i}")
+         for i, t in enumerate([bad, clean, document])]
+check("loop_runs", all(
+    r.iterations_used <= MAX_ITERATIONS and r.final_score >= r.initial_score
+    and r.final_score == evaluate_output(r.final_text)["score"] for r in loops)
+    and loops[1].iterations_used == 0 and loops[0].final_score > loops[0].initial_score)
+prompt_only = run_teaching_loop(bad, harness)
+check("loop_prompt_only",
+      prompt_only.iterations_used == 0 and prompt_only.iterations[0].rewrite_prompt
+      == report.rewrite_prompt)
+
+
+def loop_trace(result):
+    trace = result.to_dict()
+    del trace["timestamp"]
+    return trace, result.final_text
+
+
+async def loop_checks():
+    in_flight = [0, 0]
+
+    async def rewrite(text, corrections):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        return deterministic_rewrite(text, corrections)
+
+    samples = [(f"s{i}", t) for i, t in enumerate(corpus + [document])]
+    serial = {sid: loop_trace(run_teaching_loop(t, harness, deterministic_rewrite, sid))
+              for sid, t in samples}
+    for jobs in (1, 2):
+        streamed = [r async for r in iter_teaching_loops(iter(samples), rewrite,
+                                                         concurrency=4, jobs=jobs)]
+        check(f"loop_async_eq_serial_jobs{jobs}",
+              sorted(r.sample_id for r in streamed) == sorted(serial)
+              and all(loop_trace(r) == serial[r.sample_id] for r in streamed))
+    check("loop_async_concurrency", 1 < in_flight[1] <= 4)
+
+    expanding = await run_teaching_loop_async(document, lambda t, c: t + t)
+    check("loop_async_expansion_block",
+          expanding.expansion_blocked and expanding.halted
+          and expanding.final_text == document and expanding.iterations_used == 0)
+
+    async def cancels_b(text, corrections):
+        if text.startswith("B:"):
+            raise asyncio.CancelledError
+        return deterministic_rewrite(text, corrections)
+
+    survivors = [r async for r in iter_teaching_loops(
+        [("a", bad), ("b", "B: " + bad), ("c", bad)], cancels_b, concurrency=3, jobs=1)]
+    check("loop_async_cancelled_sample_skipped",
+          sorted(r.sample_id for r in survivors) == ["a", "c"])
+
+    async def broken(text, corrections):
+        raise RuntimeError("model unavailable")
+
+    try:
+        [r async for r in iter_teaching_loops([("a", bad), ("b", bad)], broken, jobs=1)]
+        check("loop_async_error_propagates", False)
+    except RuntimeError:
+        check("loop_async_error_propagates", True)
+
+
+asyncio.run(loop_checks())
+
+# Traces on disk: small segments force rotation mid-sample
+with tempfile.TemporaryDirectory() as trace_dir:
+    traced_samples = [(f"t{i}", t) for i, t in enumerate([bad, document] + corpus[:20])]
+    with TraceSink(trace_dir, segment_bytes=4096) as sink:
+        traced = [run_teaching_loop(t, harness, deterministic_rewrite, sid, trace_sink=sink)
+                  for sid, t in traced_samples]
+    full = [run_teaching_loop(t, harness, deterministic_rewrite, sid) for sid, t in traced_samples]
+    reader = TraceReader(trace_dir)
+    check("trace_summary_only",
+          all(r.iterations == [] and loop_trace(r)[0] == dict(loop_trace(f)[0], iterations=[])
+              for r, f in zip(traced, full)))
+    check("trace_rotates", sink.segments > 1 and sink.records == sum(
+        len(f.iterations) for f in full) and all(
+        name.endswith(".jsonl.gz") for name in os.listdir(trace_dir) if name.startswith("segment")))
+    check("trace_reader_exact",
+          sorted(reader.sample_ids()) == sorted(sid for sid, _ in traced_samples)
+          and all(reader.read(f.sample_id) == f.iterations for f in full))
+
+    async def traced_async():
+        with TraceSink(trace_dir, segment_bytes=4096) as sink:
+            return [r async for r in iter_teaching_loops(
+                [("a" + sid, t) for sid, t in traced_samples], deterministic_rewrite,
+                concurrency=8, jobs=1, trace_sink=sink)]
+
+    streamed = asyncio.run(traced_async())
+    reader = TraceReader(trace_dir)
+    check("trace_async_interleaved",
+          all(r.iterations == [] for r in streamed)
+          and all(reader.read("a" + f.sample_id) == f.iterations for f in full)
+          and all(reader.read(f.sample_id) == f.iterations for f in full))
+
+# Load benchmark: scheduling moves timings, never a sample's course
+load = run_load_benchmark((1, 6), samples=40, rewriter=SimulatedRewriter(
+    latency_ms=0.5, error_rate=0.4, growth=0.5, growth_rate=0.5))
+levels = list(load["results"].values())
+outcome = [{k: r[k] for k in ("iterations", "final_gates", "halted",
+                              "expansion_blocked", "errors")} for r in levels]
+check("loop_bench_levels",
+      outcome[0] == outcome[1] and all(
+          sum(r["iterations"].values()) + r["errors"] == 40 == r["e2e_us"]["count"]
+          and 0 < r["rc1_cpu_share"] <= 1 and r["samples_per_s"] > 0 for r in levels))
+check("loop_bench_exercises_limits",
+      levels[0]["expansion_blocked"] > 0 and levels[0]["errors"] > 0, str(outcome[0]))
+default = run_load_benchmark((1,), samples=40, rewriter=SimulatedRewriter(latency_ms=0.5))
+check("loop_bench_default_grows",
+      0 < default["results"]["c1"]["expansion_blocked"] <= default["results"]["c1"]["above_floor"],
+      str(default["results"]["c1"]))
+
+
 # ═══════════════════════════════════════════
 print(f"\n{'='*40}")
 print(f"Results: {passed}/{passed + failed} passed")
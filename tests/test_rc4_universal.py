@@ -0,0 +1,198 @@
+"""
+RC4 Universal Test Suite
+
+Tests the integer-scaled atom against the Fraction atom.
+Tests the bulk E1–E6 sweep against per-atom verify_equivalence.
+Tests closed-form trajectories against the RK4 reference.
+
+Deterministic. No shared state. Runs without tent_stack and without NumPy.
+"""
+
+import sys
+import os
+import random
+from array import array
+from fractions import Fraction
+
+# rc4_universal lives in rc_stack/ (repo root = parent of tests/)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "rc_stack"))
+
+from rc4_universal import (Atom, AtomBatch, AtomSimulator, ScaledAtom, TrajectoryEngine,
+                           EQUIVALENCE_KEYS, np, verify_equivalence)
+
+passed = 0
+failed = 0
+
+
+def check(name, condition, msg=""):
+    global passed, failed
+    if condition:
+        print(f"  ✅ {name}")
+        passed += 1
+    else:
+        print(f"  ❌ {name}: {msg}")
+        failed += 1
+
+
+def rel_err(a, b):
+    """Largest relative (x1, x2) error between two point lists."""
+    return max((abs(p[j] - q[j]) / max(1.0, abs(q[j]))
+                for p, q in zip(a, b) for j in (1, 2)), default=0.0)
+
+
+# ═══════════════════════════════════════════
+print("\n── Gate ──")
+
+stable = Atom(Fraction(7, 10), Fraction(8, 10), Fraction(3, 10), Fraction(2, 10))
+unstable = Atom(Fraction(1, 10), Fraction(1, 10), Fraction(8, 10), Fraction(8, 10))
+critical = Atom(1, 1, 1, 1)
+check("gate_tracks_delta",
+      stable.gate() and not unstable.gate() and not critical.gate())
+check("gate_threshold",
+      stable.gate(Fraction(9, 10)) and not stable.gate(Fraction(10, 11)),
+      str(stable.score))
+
+
+# ═══════════════════════════════════════════
+print("\n── ScaledAtom ──")
+
+s = ScaledAtom.from_atom(stable)
+check("scaled_shared_denominator",
+      (s.b, s.k, s.a, s.g, s.den) == (7, 8, 3, 2, 10), repr(s))
+check("scaled_equals_atom",
+      s == stable and stable == s and hash(s) == hash(stable) and s.to_atom() == stable)
+
+rng = random.Random(14)
+pairs = []
+for i in range(500):
+    gains = [Fraction(rng.randint(1, 99), rng.choice((1, 7, 10, 12, 100))) for _ in range(4)]
+    if i % 10 == 0:
+        gains[3] = gains[0] * gains[1] / gains[2]     # Δ = 0
+    pairs.append((Atom(*gains), ScaledAtom.from_fractions(*gains)))
+
+
+def profile(x):
+    return (x.delta, x.rho, x.score, x.trace, x.phase, x.is_stable, x.eigenvalues(),
+            x.gate(), x.gate(Fraction(2, 3)), x.matrix(), x.to_dict(), verify_equivalence(x))
+
+
+mismatch = [y for x, y in pairs if profile(x) != profile(y)]
+check("scaled_matches_atom", not mismatch and any(x.phase == "CRITICAL" for x, _ in pairs),
+      str(mismatch[:3]))
+
+for bad, err in (((7, 8, 3, 2.0), TypeError), ((7, 8, 0, 2), ValueError),
+                 ((7, 8, 3, 2, -10), ValueError)):
+    try:
+        ScaledAtom(*bad)
+        check(f"scaled_rejects_{bad}", False, "no error")
+    except err:
+        check(f"scaled_rejects_{bad}", True)
+
+
+# ═══════════════════════════════════════════
+print("\n── AtomBatch ──")
+
+
+def per_atom(batch, threshold=Fraction(1, 2)):
+    """Bulk conditions of every atom, row by row."""
+    eq = batch.equivalence(threshold)
+    return [{key: bool(eq[key][i]) for key in EQUIVALENCE_KEYS} for i in range(len(batch))]
+
+
+batch = AtomBatch.random(300, seed=42, backend="array")
+rng = random.Random(42)
+scalar = [Atom(*(Fraction(rng.randint(1, 99), 100) for _ in range(4))) for _ in range(300)]
+check("batch_random_atoms", all(batch.atom(i) == x for i, x in enumerate(scalar)))
+check("batch_matches_per_atom",
+      per_atom(batch) == [verify_equivalence(x) for x in scalar]
+      and batch.cross_check(range(300)) == [])
+check("batch_phases",
+      batch.phases() == {p: sum(x.phase == p for x in scalar)
+                         for p in ("STABLE", "CRITICAL", "UNSTABLE")})
+t = Fraction(2, 3)
+check("batch_threshold",
+      list(batch.equivalence(t)["E6_rc2_gate"]) == [x.gate(t) for x in scalar]
+      and batch.equivalence() is batch.equivalence())
+
+edge = [critical, Atom(Fraction(2, 3), Fraction(3, 4), Fraction(1, 2), 1),
+        Atom(Fraction(10**30 + 1, 7), 3, 5, Fraction(10**30, 7)),
+        Atom(Fraction(1, 10**40), Fraction(1, 3), Fraction(1, 5), Fraction(1, 7))]
+eb = AtomBatch.from_atoms(edge, backend="array")
+check("batch_huge_numerators",
+      not eb.exact_int64 and eb.cross_check(range(len(edge))) == []
+      and eb.phases() == {"STABLE": 0, "CRITICAL": 2, "UNSTABLE": 2}, str(eb.phases()))
+
+# Integral column types: lists, array('q'), NumPy integer columns
+cols = [[getattr(batch.atom(i), c) for i in range(300)] for c in "bkag"]
+typed = AtomBatch(*(array("q", c) for c in cols), den=100, backend="array")
+check("batch_array_columns", typed.report() == batch.report())
+accepted = []
+for bad in ([1.5] * 300, [True] * 300, [0] * 300):
+    try:
+        AtomBatch(bad, *cols[1:], backend="array")
+        accepted.append(bad[0])
+    except ValueError:
+        pass
+check("batch_rejects_columns", not accepted, str(accepted))
+if np is None:
+    print("  – numpy columns: skipped (NumPy not installed)")
+else:
+    np_cols = [np.array(c, dtype=np.int64) for c in cols]
+    on_array = AtomBatch(*np_cols, den=np.int64(100), backend="array")
+    on_numpy = AtomBatch(*np_cols, den=np.int64(100), backend="numpy")
+    check("batch_numpy_columns",
+          on_array.report() == batch.report()
+          and dict(on_numpy.report(), backend="array") == batch.report()
+          and per_atom(on_numpy) == per_atom(batch)
+          and on_numpy.cross_check(range(300)) == [])
+
+
+# ═══════════════════════════════════════════
+print("\n── TrajectoryEngine ──")
+
+atoms = [stable, unstable, critical, ScaledAtom(5, 5, 1, 1, 10)]
+ics = [(5.0, 3.0), (-2.0, 4.0), (1.0, 0.1)]
+exact = TrajectoryEngine(atoms)
+rk4 = TrajectoryEngine(atoms, mode="rk4")
+
+check("traj_rk4_is_simulator",
+      TrajectoryEngine(atoms[:1], mode="rk4").trajectories(ics[:1], t_max=5.0, stride=7)[0][0]
+      == AtomSimulator(atoms[0]).simulate(*ics[0], t_max=5.0)[::7])
+
+e_traj = exact.trajectories(ics, stride=40)
+r_traj = rk4.trajectories(ics, stride=40)
+err = max(rel_err(e, r) for ea, ra in zip(e_traj, r_traj) for e, r in zip(ea, ra))
+same_grid = all([p[0] for p in e] == [q[0] for q in r]
+                for ea, ra in zip(e_traj, r_traj) for e, r in zip(ea, ra))
+check("traj_exact_matches_rk4", same_grid and err < 1e-8, f"err={err:.1e}")
+
+e_final = exact.final(ics)
+r_final = rk4.final(ics)
+check("traj_final_matches_rk4",
+      max(rel_err(e, r) for e, r in zip(e_final, r_final)) < 1e-8
+      and all(p[0] == q[0] == exact.grid()[-1]
+              for e, r in zip(e_final, r_final) for p, q in zip(e, r)))
+check("traj_final_is_last_point",
+      e_final == [[traj[-1] for traj in per_ic] for per_ic in exact.trajectories(ics)]
+      and r_final == [[traj[-1] for traj in per_ic] for per_ic in rk4.trajectories(ics)])
+
+times = (0.0, 0.0123, 3.3333, 17.5)
+err = max(rel_err(e, r) for t in times
+          for e, r in zip(exact.at(ics, t), rk4.at(ics, t)))
+check("traj_at_matches_rk4", err < 1e-8, f"err={err:.1e}")
+check("traj_at_start_and_last",
+      exact.at(ics, 0.0) == [[(0.0, x1, x2) for x1, x2 in ics]] * len(atoms)
+      and exact.at(ics, exact.grid()[-1]) == e_final)
+try:
+    exact.at(ics, -1.0)
+    check("traj_at_rejects_negative", False, "no error")
+except ValueError:
+    check("traj_at_rejects_negative", True)
+
+
+# ═══════════════════════════════════════════
+print(f"\n{'='*40}")
+print(f"Results: {passed}/{passed + failed} passed")
+print(f"{'='*40}")
+sys.exit(0 if failed == 0 else 1)